@@ -0,0 +1,7 @@
+# customclock
+# Zdieľané pomocné moduly pre widgety modulu CustomClock (skratky, modely, cache, ...)
+# Autor: Jastronit
+#
+# Widgety sa načítavajú podľa cesty k súboru (každý dock/overlay má vlastnú kópiu modulu),
+# preto spoločný stav pre celý proces žije tu - v balíku importovanom cez sys.path,
+# ktorý je v sys.modules práve raz.
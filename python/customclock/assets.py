@@ -0,0 +1,130 @@
+# assets.py
+# Cache predškálovaných obrázkov (bannery) a detekcie témy pre widgety
+# Autor: Jastronit
+#
+# Bannery v assets/banners sú v plnej veľkosti a každý widget ich predtým pri vytvorení
+# dekódoval a škáloval SmoothTransformation. Tu sa škáluje raz na (téma, výška, DPR),
+# výsledok ostáva v pamäti procesu a na disku v data/asset_cache, takže ďalší štart
+# načíta len malý hotový obrázok. Detekcia tmavej témy a RGBA režimu sa robí raz.
+
+import os
+
+from PySide6.QtWidgets import QApplication, QLabel
+from PySide6.QtGui import QPixmap, QPalette, QGuiApplication
+from PySide6.QtCore import Qt
+
+MODULE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+BANNER_DIR = os.path.join(MODULE_ROOT, "assets", "banners")
+CACHE_DIR = os.path.join(MODULE_ROOT, "data", "asset_cache")
+
+
+# ////---- Téma a RGBA režim (zisťuje sa raz za proces) ----////
+_theme = {}
+
+def is_dark_mode():
+    dark = _theme.get("dark")
+    if dark is None:
+        palette = QApplication.instance().palette()
+        dark = _theme["dark"] = palette.color(QPalette.Window).lightness() < 128
+    return dark
+
+
+def detect_rgba_mode():
+    mode = _theme.get("rgba")
+    if mode is None:
+        mode = "float"
+        test = QLabel()
+        try:
+            test.setStyleSheet("background-color: rgba(0,0,0,128);")
+            effective = test.palette().color(test.backgroundRole()).alpha()
+            if 120 <= effective <= 135:
+                mode = "int"
+        except Exception:
+            pass
+        _theme["rgba"] = mode
+    return mode
+
+
+def invalidate_theme():
+    """Forget the detected theme (e.g. after a palette change); cached banners stay valid per theme."""
+    _theme.clear()
+# ////-----------------------------------------------------------------------------------------
+
+
+# ////---- Pomocné funkcie pre diskovú cache ----////
+def _source_stamp(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f"{st.st_mtime_ns:x}-{st.st_size:x}"
+
+
+def _cache_prefix(stem, height, dpr):
+    return f"{stem}-{height}h-{round(dpr * 100)}x-"
+
+
+def _drop_stale(prefix, keep):
+    # staré verzie toho istého bannera (zmenený zdrojový súbor) netreba držať
+    try:
+        for name in os.listdir(CACHE_DIR):
+            if name.startswith(prefix) and name != keep:
+                try:
+                    os.remove(os.path.join(CACHE_DIR, name))
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
+
+def _store(pixmap, cache_path, prefix):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = cache_path + ".tmp"
+        if pixmap.save(tmp_path, "PNG"):
+            os.replace(tmp_path, cache_path)
+            _drop_stale(prefix, os.path.basename(cache_path))
+    except Exception:
+        pass
+# ////-----------------------------------------------------------------------------------------
+
+
+# ////---- Bannery ----////
+_pixmaps = {}  # (cesta, výška, dpr) -> QPixmap
+
+def banner_pixmap(name, height=32, dpr=None):
+    """Banner `name` for the current theme scaled to `height` logical pixels.
+    Dark theme uses NAME.png, light theme NAME_DARK.png (dark artwork on light background).
+    Returns None if the banner doesn't exist."""
+    stem = name if is_dark_mode() else f"{name}_DARK"
+    path = os.path.join(BANNER_DIR, f"{stem}.png")
+    if dpr is None:
+        try:
+            dpr = QGuiApplication.primaryScreen().devicePixelRatio()
+        except Exception:
+            dpr = 1.0
+    dpr = float(dpr) or 1.0
+
+    key = (path, height, dpr)
+    pixmap = _pixmaps.get(key)
+    if pixmap is not None:
+        return pixmap
+
+    stamp = _source_stamp(path)
+    if stamp is None:
+        return None
+    prefix = _cache_prefix(stem, height, dpr)
+    cache_path = os.path.join(CACHE_DIR, f"{prefix}{stamp}.png")
+
+    pixmap = QPixmap(cache_path) if os.path.exists(cache_path) else QPixmap()
+    if pixmap.isNull():
+        source = QPixmap(path)
+        if source.isNull():
+            return None
+        # škáluje sa na fyzické pixely, aby bol banner ostrý aj pri 125 % / 150 %
+        pixmap = source.scaledToHeight(max(1, round(height * dpr)), Qt.SmoothTransformation)
+        _store(pixmap, cache_path, prefix)
+    pixmap.setDevicePixelRatio(dpr)
+    _pixmaps[key] = pixmap
+    return pixmap
+# ////-----------------------------------------------------------------------------------------
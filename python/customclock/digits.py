@@ -0,0 +1,202 @@
+# digits.py
+# Vykresľovanie číslic hodín z predkreslenej mapy znakov (glyph atlas)
+# Autor: Jastronit
+#
+# QLabel pri každej zmene času znova tvaruje celý text a pri proporcionálnom písme mení
+# šírku, čím zneplatní layout overlayu. DigitDisplay kreslí "0-9", ":", "-" (a "." pre
+# desatiny stopiek) z atlasu, ktorý sa rasterizuje raz na font, farbu a DPR. Každý znak
+# má pevnú bunku (číslice šírku najširšej číslice), takže geometria sa pri tikaní nemení
+# a prekreslia sa len bunky, ktorých znak sa zmenil.
+
+from PySide6.QtWidgets import QWidget, QSizePolicy
+from PySide6.QtGui import QPixmap, QPainter, QColor, QFontMetrics
+from PySide6.QtCore import Qt, QRect, QRectF, QSize
+
+from customclock import perf
+from customclock.fonts import get_font, DIGITS
+from customclock.render import get_render_counters
+
+GLYPHS = DIGITS + ":-."
+ATLAS_LIMIT = 64  # farby odpočtu stopiek sa menia plynulo - staršie atlasy sa zahodia
+
+
+# ////---- Atlas znakov pre (font, farba, DPR) ----////
+class GlyphAtlas:
+    __slots__ = ("entry", "color", "dpr", "pixmap", "cells", "height")
+
+    def __init__(self, entry, color, dpr):
+        self.entry = entry
+        self.color = color
+        self.dpr = dpr
+        metrics = QFontMetrics(entry.font)
+        self.height = metrics.height()
+
+        # bunka: znak -> (x v atlase, šírka); číslice majú spoločnú šírku
+        self.cells = {}
+        x = 0
+        for ch in GLYPHS:
+            width = entry.digit_width if ch in DIGITS else metrics.horizontalAdvance(ch)
+            self.cells[ch] = (x, width)
+            x += width
+
+        self.pixmap = QPixmap(max(1, round(x * dpr)), max(1, round(self.height * dpr)))
+        self.pixmap.setDevicePixelRatio(dpr)
+        self.pixmap.fill(Qt.transparent)
+        painter = QPainter(self.pixmap)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        painter.setFont(entry.font)
+        painter.setPen(QColor(color))
+        for ch, (cx, width) in self.cells.items():
+            painter.drawText(QRectF(cx, 0, width, self.height), Qt.AlignCenter, ch)
+        painter.end()
+
+    def cell_width(self, ch):
+        cell = self.cells.get(ch)
+        if cell is not None:
+            return cell[1]
+        return QFontMetrics(self.entry.font).horizontalAdvance(ch)
+
+
+_atlases = {}
+
+def get_atlas(family, size, weight, color, dpr):
+    """Shared atlas for the font/color/DPR; rasterized on first use only."""
+    key = (str(family), int(size), weight, str(color), float(dpr))
+    atlas = _atlases.get(key)
+    if atlas is None:
+        if len(_atlases) >= ATLAS_LIMIT:
+            del _atlases[next(iter(_atlases))]
+        atlas = _atlases[key] = GlyphAtlas(get_font(family, size, weight), color, float(dpr))
+    return atlas
+# ////-----------------------------------------------------------------------------------------
+
+
+# ////---- Widget s číslicami z atlasu ----////
+class DigitDisplay(QWidget):
+    """Replacement for a clock QLabel. Like RenderedLabel, the setters skip unchanged
+    values and return True only when something was actually applied."""
+
+    def __init__(self, owner, alignment=Qt.AlignCenter, parent=None):
+        super().__init__(parent)
+        self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        self.counters = get_render_counters(owner)
+        self._paint_key = f"{owner}.paint"
+        self._alignment = alignment
+        self._font_key = None
+        self._color = "#ffffff"
+        self._atlas = None
+        self._text = ""
+
+    # ////---- Nastavenia (rovnaký kontrakt ako RenderedLabel) ----////
+    def set_glyph_font(self, family, size, weight=None):
+        key = (str(family), int(size), weight)
+        if key == self._font_key:
+            self.counters["skipped"] += 1
+            return False
+        self._font_key = key
+        self._atlas = None
+        self._relayout()
+        self.counters["applied"] += 1
+        return True
+
+    def set_color(self, color):
+        if color == self._color:
+            self.counters["skipped"] += 1
+            return False
+        self._color = color
+        self._atlas = None
+        self.update()
+        self.counters["applied"] += 1
+        return True
+
+    def set_text(self, text):
+        old = self._text
+        if text == old:
+            self.counters["skipped"] += 1
+            return False
+        self._text = text
+        atlas = self._current_atlas()
+        if atlas is None or len(text) != len(old) or any(
+                atlas.cell_width(a) != atlas.cell_width(b) for a, b in zip(text, old)):
+            # iné rozloženie buniek (napr. pribudlo "-") - nová geometria
+            self._relayout()
+        else:
+            # rovnaké bunky - prekreslí sa len to, čo sa zmenilo
+            x = self._origin_x(atlas)
+            for a, b in zip(text, old):
+                width = atlas.cell_width(a)
+                if a != b:
+                    self.update(QRect(x, self._origin_y(atlas), width, atlas.height))
+                x += width
+        self.counters["applied"] += 1
+        return True
+
+    # ////---------------------------------------------------------------------------------
+
+    # ////---- Geometria ----////
+    def _current_atlas(self):
+        if self._font_key is None:
+            return None
+        try:
+            dpr = self.devicePixelRatioF()
+        except Exception:
+            dpr = 1.0
+        atlas = self._atlas
+        if atlas is None or atlas.dpr != dpr:
+            family, size, weight = self._font_key
+            atlas = self._atlas = get_atlas(family, size, weight, self._color, dpr)
+        return atlas
+
+    def _relayout(self):
+        self.updateGeometry()
+        self.update()
+
+    def _text_width(self, atlas):
+        return sum(atlas.cell_width(ch) for ch in self._text)
+
+    def _origin_x(self, atlas):
+        free = self.width() - self._text_width(atlas)
+        if self._alignment & Qt.AlignRight:
+            return max(0, free)
+        if self._alignment & Qt.AlignLeft:
+            return 0
+        return max(0, free // 2)
+
+    def _origin_y(self, atlas):
+        return max(0, (self.height() - atlas.height) // 2)
+
+    def sizeHint(self):
+        atlas = self._current_atlas()
+        if atlas is None:
+            return QSize(0, 0)
+        return QSize(self._text_width(atlas), atlas.height)
+
+    def minimumSizeHint(self):
+        return self.sizeHint()
+    # ////---------------------------------------------------------------------------------
+
+    # ////---- Vykreslenie (len bunky v prekresľovanej oblasti) ----////
+    def paintEvent(self, event):
+        started = perf.now()
+        atlas = self._current_atlas()
+        if atlas is not None and self._text:
+            dirty = event.rect()
+            painter = QPainter(self)
+            x = self._origin_x(atlas)
+            y = self._origin_y(atlas)
+            for ch in self._text:
+                width = atlas.cell_width(ch)
+                if x < dirty.right() + 1 and x + width > dirty.left():
+                    cell = atlas.cells.get(ch)
+                    if cell is not None:
+                        painter.drawPixmap(QRectF(x, y, width, atlas.height), atlas.pixmap,
+                                           QRectF(cell[0] * atlas.dpr, 0, width * atlas.dpr, atlas.height * atlas.dpr))
+                    else:
+                        # znak mimo atlasu (napr. medzera) - bežné vykreslenie textu
+                        painter.setFont(atlas.entry.font)
+                        painter.setPen(QColor(self._color))
+                        painter.drawText(QRectF(x, y, width, atlas.height), Qt.AlignCenter, ch)
+                x += width
+            painter.end()
+        perf.add_time(self._paint_key, perf.now() - started)
+# ////-----------------------------------------------------------------------------------------
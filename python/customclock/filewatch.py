@@ -0,0 +1,243 @@
+# filewatch.py
+# Jeden spoločný watcher pre config/ a data/ (namiesto pollingu v každom widgete)
+# Autor: Jastronit
+#
+# Predtým každá inštancia widgetu raz za sekundu stat-ovala svoj JSON config a game_clock
+# aj data.ini. Hub sleduje priečinky a odoberané súbory jedným QFileSystemWatcherom,
+# zlúči sériu zápisov (editory ukladajú cez dočasný súbor a premenovanie) do jedného
+# spracovania, súbor raz sparsuje a hotový obsah pošle všetkým odberateľom. Počet
+# sledovaných ciest závisí len od počtu rôznych súborov, nie od počtu widgetov a overlayov.
+
+import os
+import json
+import configparser
+
+from PySide6.QtCore import QObject, QTimer, QFileSystemWatcher
+
+from customclock import perf
+
+DEBOUNCE_MS = 100  # ticho po poslednej udalosti, kým sa súbor spracuje (zápisy jedného uloženia)
+DEBOUNCE_MAX_MS = 1000  # najdlhšie čakanie od prvej udalosti pri nepretržitom zapisovaní
+
+
+# ////---- Parsery obsahu ----////
+class ParseError(Exception):
+    pass
+
+
+def parse_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            return json.load(f)
+        except ValueError as e:
+            raise ParseError(str(e))
+
+
+def parse_ini(path):
+    cfg = configparser.ConfigParser()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cfg.read_file(f)
+    except configparser.Error as e:
+        raise ParseError(str(e))
+    return cfg
+# ////-----------------------------------------------------------------------------------------
+
+
+# ////---- Sledovaný súbor ----////
+class _Watched:
+    __slots__ = ("path", "parser", "stamp", "value", "callbacks")
+
+    def __init__(self, path, parser):
+        self.path = path
+        self.parser = parser
+        self.stamp = None
+        self.value = None
+        self.callbacks = []
+
+
+def _stamp(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime, st.st_size
+# ////-----------------------------------------------------------------------------------------
+
+
+# ////---- Hub ----////
+class FileWatchHub(QObject):
+    def __init__(self):
+        super().__init__()
+        self._files = {}  # abspath -> _Watched
+        self._dirs = {}  # priečinok -> počet odoberaných súborov v ňom
+        self._pending = set()
+        self._first_event = None  # perf.now() prvej nespracovanej udalosti
+        self._bad = set()  # súbory, ktorých chyba parsovania už bola vypísaná
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._watcher.directoryChanged.connect(self._on_dir_changed)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._flush)
+
+    def subscribe(self, path, callback, parser=parse_json):
+        """Call callback(path, value) whenever the parsed content of `path` changes
+        (value is None while the file doesn't exist). Returns the current value."""
+        path = os.path.abspath(path)
+        entry = self._files.get(path)
+        if entry is None:
+            entry = self._files[path] = _Watched(path, parser)
+            self._watch_dir(os.path.dirname(path))
+            self._watch_file(path)
+            self._reload(entry)
+        entry.callbacks.append(callback)
+        return entry.value
+
+    def unsubscribe(self, path, callback):
+        path = os.path.abspath(path)
+        entry = self._files.get(path)
+        if entry is None:
+            return
+        try:
+            entry.callbacks.remove(callback)
+        except ValueError:
+            return
+        if entry.callbacks:
+            return
+        del self._files[path]
+        self._pending.discard(path)
+        try:
+            if path in self._watcher.files():
+                self._watcher.removePath(path)
+        except Exception:
+            pass
+        self._unwatch_dir(os.path.dirname(path))
+
+    def value(self, path):
+        entry = self._files.get(os.path.abspath(path))
+        return entry.value if entry is not None else None
+
+    def mtime(self, path):
+        """mtime of the content last pushed for `path` (no extra stat)."""
+        entry = self._files.get(os.path.abspath(path))
+        return entry.stamp[0] if entry is not None and entry.stamp else None
+
+    def watch_count(self):
+        try:
+            return len(self._watcher.files()) + len(self._watcher.directories())
+        except Exception:
+            return len(self._files) + len(self._dirs)
+
+    # ////---- Cesty vo watcheri ----////
+    def _watch_dir(self, directory):
+        count = self._dirs.get(directory, 0)
+        self._dirs[directory] = count + 1
+        if count == 0 and os.path.isdir(directory):
+            try:
+                self._watcher.addPath(directory)
+            except Exception:
+                pass
+
+    def _unwatch_dir(self, directory):
+        count = self._dirs.get(directory, 0) - 1
+        if count > 0:
+            self._dirs[directory] = count
+            return
+        self._dirs.pop(directory, None)
+        try:
+            if directory in self._watcher.directories():
+                self._watcher.removePath(directory)
+        except Exception:
+            pass
+
+    def _watch_file(self, path):
+        # editory súbor nahradia novým - po premenovaní ho treba pridať znova
+        try:
+            if os.path.exists(path) and path not in self._watcher.files():
+                self._watcher.addPath(path)
+        except Exception:
+            pass
+
+    # ////---- Udalosti (len poznačia súbor, spracuje sa po ustálení) ----////
+    def _on_file_changed(self, path):
+        if path in self._files:
+            self._pending.add(path)
+            self._arm()
+
+    def _on_dir_changed(self, directory):
+        # vytvorenie, zmazanie alebo premenovanie súboru v priečinku
+        for path in self._files:
+            if os.path.dirname(path) == directory:
+                self._pending.add(path)
+        if self._pending:
+            self._arm()
+
+    def _arm(self):
+        # debounce: každá udalosť posunie spracovanie o DEBOUNCE_MS, aby sa nečítal
+        # rozpísaný súbor; nepretržitý zápis ho však neodsunie viac ako DEBOUNCE_MAX_MS
+        now = perf.now()
+        if self._first_event is None:
+            self._first_event = now
+        waited_ms = (now - self._first_event) * 1000
+        self._timer.start(max(0, int(min(DEBOUNCE_MS, DEBOUNCE_MAX_MS - waited_ms))))
+
+    def _flush(self):
+        perf.count("wakeup.filewatch")
+        started = perf.now()
+        pending, self._pending = self._pending, set()
+        self._first_event = None
+        for path in pending:
+            entry = self._files.get(path)
+            if entry is None:
+                continue
+            self._watch_file(path)
+            if self._reload(entry):
+                perf.count("filewatch.push")
+                for callback in list(entry.callbacks):
+                    try:
+                        callback(path, entry.value)
+                    except Exception as e:
+                        print(f"[FileWatch] Chyba pri spracovaní {os.path.basename(path)}: {e}")
+            if (path in self._files and path not in self._bad and entry.stamp is not None
+                    and _stamp(path) != entry.stamp):
+                # súbor sa zmenil počas čítania - ďalšie kolo dostane posledný obsah
+                self._pending.add(path)
+        if self._pending:
+            self._arm()
+        perf.add_time("filewatch.update", perf.now() - started)
+
+    def _reload(self, entry):
+        """Re-parse if (mtime, size) changed. Returns True if there is new content to push
+        (also when only mtime changed - data.ini samples are anchored to it)."""
+        stamp = _stamp(entry.path)
+        if stamp == entry.stamp and entry.stamp is not None:
+            return False
+        if stamp is None:
+            entry.stamp = None
+            changed = entry.value is not None
+            entry.value = None
+            return changed
+        try:
+            value = entry.parser(entry.path)
+        except (OSError, ParseError) as e:
+            # rozpísaný alebo chybný súbor - ostáva posledný platný obsah
+            if entry.path not in self._bad:
+                self._bad.add(entry.path)
+                print(f"[FileWatch] Súbor {os.path.basename(entry.path)} sa nedá načítať: {e}")
+            return False
+        self._bad.discard(entry.path)
+        entry.stamp = stamp
+        entry.value = value
+        return True
+# ////-----------------------------------------------------------------------------------------
+
+
+_hub = []
+
+def get_hub():
+    """Process-wide FileWatchHub (created on first use)."""
+    if not _hub:
+        _hub.append(FileWatchHub())
+    return _hub[0]
+# ////-----------------------------------------------------------------------------------------
@@ -0,0 +1,74 @@
+# fonts.py
+# Procesová cache fontov pre widgety (kľúč: rodina, veľkosť, váha)
+# Autor: Jastronit
+#
+# Configy používajú rodiny ako "Z003" alebo "ArialBold", ktoré na mnohých systémoch
+# neexistujú, a Qt pri každom QFont(fam, size) znova hľadá náhradu. Tu sa font vyrieši
+# raz, náhrada sa zapíše do logu raz na rodinu a k fontu sa predpočítajú metriky číslic,
+# aby hodiny mali stálu šírku aj pri proporcionálnom písme.
+
+from PySide6.QtGui import QFont, QFontInfo, QFontMetrics
+
+DIGITS = "0123456789"
+
+
+# ////---- Vyriešený font s metrikami ----////
+class FontEntry:
+    __slots__ = ("font", "family", "resolved_family", "digit_width", "widest_digit", "height", "ascent", "_widths")
+
+    def __init__(self, family, size, weight):
+        font = QFont(family, size)
+        if weight is not None:
+            font.setWeight(weight)
+        resolved = QFontInfo(font).family()
+        if resolved and resolved.lower() != str(family).lower():
+            _report_substitution(family, resolved)
+            # ďalšie použitia (setFont na viacerých labeloch) už idú na presnú rodinu
+            font.setFamily(resolved)
+
+        metrics = QFontMetrics(font)
+        advances = {d: metrics.horizontalAdvance(d) for d in DIGITS}
+        self.font = font
+        self.family = family
+        self.resolved_family = resolved or family
+        self.widest_digit = max(DIGITS, key=lambda d: advances[d])
+        self.digit_width = advances[self.widest_digit]
+        self.height = metrics.height()
+        self.ascent = metrics.ascent()
+        self._widths = {}
+
+    def fixed_text(self, text):
+        """Text with every digit replaced by the widest one (template for a stable width)."""
+        widest = self.widest_digit
+        return "".join(widest if c in DIGITS else c for c in text)
+
+    def fixed_width(self, text):
+        """Pixel width `text` needs so that any digits fit without the label resizing."""
+        template = self.fixed_text(text)
+        width = self._widths.get(template)
+        if width is None:
+            width = self._widths[template] = QFontMetrics(self.font).horizontalAdvance(template)
+        return width
+# ////-----------------------------------------------------------------------------------------
+
+
+# ////---- Cache a hlásenie náhrad ----////
+_fonts = {}
+substitutions = {}  # požadovaná rodina -> skutočne použitá
+
+
+def _report_substitution(family, resolved):
+    if family in substitutions:
+        return
+    substitutions[family] = resolved
+    print(f"[Fonts] Font '{family}' nie je dostupný, používa sa '{resolved}'")
+
+
+def get_font(family, size, weight=None):
+    """Shared FontEntry for (family, size, weight); resolved and measured only once."""
+    key = (str(family), int(size), weight)
+    entry = _fonts.get(key)
+    if entry is None:
+        entry = _fonts[key] = FontEntry(key[0], key[1], weight)
+    return entry
+# ////-----------------------------------------------------------------------------------------
@@ -0,0 +1,40 @@
+# lifecycle.py
+# Životný cyklus widgetov podľa viditeľnosti (skryté widgety neprebúdzajú event loop)
+# Autor: Jastronit
+#
+# F9 skryje všetky overlaye, dock môže byť zbalený alebo schovaný za inou záložkou, no
+# časovače a watchery skrytých widgetov by inak bežali ďalej. Qt pošle hideEvent/showEvent
+# aj deťom skrývaného okna, takže stačí ich zachytiť v samotnom widgete:
+#
+#   suspend_widget()  - widget prestal byť viditeľný: zastaviť časovače, čítanie súborov
+#   resume_widget()   - widget je znova viditeľný: jedným krokom dobehnúť stav a obnoviť
+#
+# Zdieľané modely (models.py) sa pozastavia, až keď nie je viditeľný žiadny ich pohľad.
+
+
+# ////---- Mixin pre triedy widgetov (class W(VisibilityLifecycle, BaseClass)) ----////
+class VisibilityLifecycle:
+    _lifecycle_suspended = False
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._lifecycle_suspended:
+            self._lifecycle_suspended = False
+            self.resume_widget()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if not self._lifecycle_suspended:
+            self._lifecycle_suspended = True
+            self.suspend_widget()
+
+    @property
+    def widget_suspended(self):
+        return self._lifecycle_suspended
+
+    def suspend_widget(self):
+        pass
+
+    def resume_widget(self):
+        pass
+# ////-----------------------------------------------------------------------------------------
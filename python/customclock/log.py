@@ -0,0 +1,25 @@
+# log.py
+# Zápis do data/log.txt modulu (súbor, ktorý zobrazuje widget console)
+# Autor: Jastronit
+#
+# Rovnaký formát ako log_to_console v logic.py: "[HH:MM:SS] správa". Widgety zapisujú
+# len zriedkavé udalosti (kolízie skratiek, chyby configu), preto sa súbor otvára
+# pri každom zápise a nič sa nedrží otvorené.
+
+import os
+from datetime import datetime
+
+MODULE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DATA_DIR = os.path.join(MODULE_ROOT, "data")
+
+
+# ////---- Zápis riadku ----////
+def log_to_console(message, data_dir=None):
+    """Append "[HH:MM:SS] message" to log.txt in `data_dir` (the module's data/ by default)."""
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    try:
+        with open(os.path.join(data_dir or DATA_DIR, "log.txt"), "a", encoding="utf-8") as f:
+            f.write(f"[{timestamp}] {message}\n")
+    except Exception as e:
+        print(f"[Log] Chyba pri zápise do log.txt: {e}")
+# ////-----------------------------------------------------------------------------------------
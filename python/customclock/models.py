@@ -0,0 +1,75 @@
+# models.py
+# Zdieľané modely pre widgety, ktoré sú naraz v docku aj v jednom či viacerých overlayoch
+# Autor: Jastronit
+#
+# Model (čítanie configu, data.ini, časovače, simulácia) existuje raz na kľúč - typicky
+# cestu k configu - a všetky inštancie widgetu sú len pohľady, ktoré ho vykresľujú.
+# Ďalší overlay s rovnakým widgetom tak pridá len cenu vykreslenia, nie I/O ani polling.
+# Keď nie je viditeľný žiadny pohľad, model sa pozastaví (suspend/resume, lifecycle.py).
+
+
+# ////---- Register modelov (kľúč -> [model, počet pohľadov, skryté pohľady, pozastavený]) ----////
+_models = {}
+
+def acquire_model(key, factory):
+    """Return the shared model for `key`, creating it with factory() for the first view."""
+    entry = _models.get(key)
+    if entry is None:
+        entry = _models[key] = [factory(), 0, set(), False]
+    entry[1] += 1
+    # nový pohľad sa berie ako viditeľný - pozastavený model (všetky ostatné skryté) sa obnoví
+    _update_suspended(entry)
+    return entry[0]
+
+
+def release_model(key, view=None):
+    """Drop one view of the model; the last one calls model.shutdown() and forgets it."""
+    entry = _models.get(key)
+    if entry is None:
+        return
+    entry[1] -= 1
+    if entry[1] > 0:
+        if view is not None:
+            entry[2].discard(id(view))
+            _update_suspended(entry)
+        return
+    del _models[key]
+    shutdown = getattr(entry[0], "shutdown", None)
+    if callable(shutdown):
+        try:
+            shutdown()
+        except Exception:
+            pass
+
+
+def set_view_visible(key, view, visible):
+    """Report a view's visibility; the model is suspended while every view is hidden
+    and resumed (with one resync step) when the first one is shown again."""
+    entry = _models.get(key)
+    if entry is None:
+        return
+    if visible:
+        entry[2].discard(id(view))
+    else:
+        entry[2].add(id(view))
+    _update_suspended(entry)
+
+
+def _update_suspended(entry):
+    model, views, hidden, suspended = entry
+    want = len(hidden) >= views
+    if want == suspended:
+        return
+    entry[3] = want
+    method = getattr(model, "suspend" if want else "resume", None)
+    if callable(method):
+        try:
+            method()
+        except Exception:
+            pass
+
+
+def model_views(key):
+    entry = _models.get(key)
+    return entry[1] if entry is not None else 0
+# ////-----------------------------------------------------------------------------------------
@@ -0,0 +1,83 @@
+# perf.py
+# Ľahké výkonnostné počítadlá pre perf_hud (bez Qt - používa ich aj logic.py)
+# Autor: Jastronit
+#
+# Záznam je jedno pripočítanie do slovníka, takže ho možno nechať priamo v bežných
+# cestách (tick časovača, update widgetu, fázy hlavnej slučky logiky). HUD si raz za
+# interval urobí snapshot a z rozdielu počíta hodnoty za sekundu a priemerné časy.
+
+import os
+import sys
+import time
+
+# ////---- Počítadlá ----////
+# názvy: "wakeup.<zdroj>", "<widget>.update", "<widget>.paint", "logic.<fáza>", "logic.db_busy"
+counters = {}  # názov -> počet
+timings = {}  # názov -> [počet, súčet sekúnd, maximum]
+
+now = time.perf_counter
+
+
+def count(name, n=1):
+    counters[name] = counters.get(name, 0) + n
+
+
+def add_time(name, seconds):
+    entry = timings.get(name)
+    if entry is None:
+        entry = timings[name] = [0, 0.0, 0.0]
+    entry[0] += 1
+    entry[1] += seconds
+    if seconds > entry[2]:
+        entry[2] = seconds
+
+
+def snapshot():
+    """Copy of all counters: ({name: count}, {name: (count, total_s, max_s)})."""
+    return dict(counters), {name: tuple(entry) for name, entry in list(timings.items())}
+# ////-----------------------------------------------------------------------------------------
+
+
+# ////---- Pamäť procesu (RSS) ----////
+def rss_bytes():
+    """Resident set size of this process in bytes, or None if it can't be read."""
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/self/statm", "r") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except Exception:
+            return None
+    if sys.platform.startswith("win"):
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [
+                    ("cb", wintypes.DWORD),
+                    ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            pmc = PROCESS_MEMORY_COUNTERS()
+            pmc.cb = ctypes.sizeof(pmc)
+            handle = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(pmc), pmc.cb):
+                return int(pmc.WorkingSetSize)
+        except Exception:
+            return None
+        return None
+    try:
+        import resource
+        # macOS: ru_maxrss v bajtoch (maximum, nie aktuálna hodnota)
+        return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+    except Exception:
+        return None
+# ////-----------------------------------------------------------------------------------------
@@ -0,0 +1,81 @@
+# qtlog.py
+# Jeden spoločný odchytávač Qt správ (qWarning, qCritical, ...) pre všetky konzoly
+# Autor: Jastronit
+#
+# qInstallMessageHandler je globálny pre celý proces. Keď si ho každá konzola reťazila
+# sama a zatvárali sa v inom poradí, než sa otvárali, Qt ostalo ukazovať na handler už
+# zatvoreného widgetu alebo sa pôvodný handler hostiteľa stratil. Handler sa preto
+# inštaluje raz pri prvom odberateľovi, správy rozosiela všetkým odberateľom a pôvodný
+# handler sa vráti, až keď odíde posledný.
+
+import sys
+import time
+from collections import deque
+
+from PySide6.QtCore import qInstallMessageHandler
+
+BACKLOG_LINES = 1000  # posledné správy pre konzolu otvorenú neskôr
+
+
+# ////---- Odchytávač ----////
+class QtMessageCapture:
+    def __init__(self):
+        self.backlog = deque(maxlen=BACKLOG_LINES)  # (ts, mode, message)
+        self._subscribers = []
+        self._previous = None
+        self._installed = False
+        self._in_handler = False
+
+    def subscribe(self, callback):
+        """callback(ts, mode, message) is called for every Qt message (possibly from
+        another thread). The handler is installed with the first subscriber."""
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+        if not self._installed:
+            self._previous = qInstallMessageHandler(self._handler)
+            self._installed = True
+
+    def unsubscribe(self, callback):
+        try:
+            self._subscribers.remove(callback)
+        except ValueError:
+            return
+        if not self._subscribers and self._installed:
+            # posledný odberateľ - hostiteľ dostane späť svoj pôvodný handler
+            qInstallMessageHandler(self._previous)
+            self._previous = None
+            self._installed = False
+
+    def subscriber_count(self):
+        return len(self._subscribers)
+
+    def _handler(self, mode, context, message):
+        if self._previous is not None:
+            self._previous(mode, context, message)
+        else:
+            print(message, file=sys.stderr)
+        if self._in_handler:
+            # správa vyvolaná počas spracovania inej - nezacykliť sa
+            return
+        self._in_handler = True
+        try:
+            entry = (time.time(), mode, message)
+            self.backlog.append(entry)
+            for callback in list(self._subscribers):
+                try:
+                    callback(*entry)
+                except Exception:
+                    pass
+        finally:
+            self._in_handler = False
+# ////-----------------------------------------------------------------------------------------
+
+
+_capture = []
+
+def get_capture():
+    """Process-wide QtMessageCapture (created on first use)."""
+    if not _capture:
+        _capture.append(QtMessageCapture())
+    return _capture[0]
+# ////-----------------------------------------------------------------------------------------
@@ -0,0 +1,102 @@
+# render.py
+# Zdieľaná vrstva stavu vykreslenia - do Qt ide len to, čo sa naozaj zmenilo
+# Autor: Jastronit
+#
+# setText/setStyleSheet/setFont na QLabel vždy zneplatní layout a prekreslí priesvitný
+# overlay, aj keď je hodnota rovnaká. RenderedLabel si pamätá naposledy aplikovaný text,
+# štýl, font a viditeľnosť a Qt volá len pri rozdiele. Počítadlá na widget ukazujú úsporu.
+# Fonty idú cez zdieľanú cache (fonts.py), takže sa náhrada chýbajúcej rodiny hľadá raz.
+
+from PySide6.QtWidgets import QLabel
+from customclock import perf
+from customclock.fonts import get_font
+
+
+# ////---- Počítadlá (widget -> {"applied": n, "skipped": n}) ----////
+render_counters = {}
+
+def get_render_counters(owner):
+    counters = render_counters.get(owner)
+    if counters is None:
+        counters = render_counters[owner] = {"applied": 0, "skipped": 0}
+    return counters
+# ////-----------------------------------------------------------------------------------------
+
+
+# ////---- QLabel s pamäťou naposledy aplikovaného stavu ----////
+class RenderedLabel:
+    __slots__ = ("label", "counters", "_text", "_style", "_font", "_visible", "_entry", "_min_width")
+
+    def __init__(self, label, owner):
+        self.label = label
+        self.counters = get_render_counters(owner)
+        self._entry = None
+        self.invalidate()
+
+    def invalidate(self):
+        """Forget the applied state (the next call of each setter goes to Qt)."""
+        self._text = None
+        self._style = None
+        self._font = None
+        self._visible = None
+        self._min_width = None
+
+    def _skip(self):
+        self.counters["skipped"] += 1
+        return False
+
+    def _applied(self):
+        self.counters["applied"] += 1
+        return True
+
+    def text(self, text, fixed_digits=False):
+        """Set the label text; with fixed_digits the label keeps the width of the widest
+        digits of the current font, so a ticking clock never changes the layout."""
+        if fixed_digits and self._entry is not None:
+            width = self._entry.fixed_width(text)
+            if width != self._min_width:
+                self._min_width = width
+                self.label.setMinimumWidth(width)
+        if text == self._text:
+            return self._skip()
+        self._text = text
+        self.label.setText(text)
+        return self._applied()
+
+    def style(self, style):
+        if style == self._style:
+            return self._skip()
+        self._style = style
+        self.label.setStyleSheet(style)
+        return self._applied()
+
+    def font(self, family, size, weight=None):
+        key = (family, size, weight)
+        if key == self._font:
+            return self._skip()
+        self._font = key
+        self._entry = get_font(family, size, weight)
+        self.label.setFont(self._entry.font)
+        return self._applied()
+
+    def visible(self, visible):
+        visible = bool(visible)
+        if visible == self._visible:
+            return self._skip()
+        self._visible = visible
+        self.label.setVisible(visible)
+        return self._applied()
+# ////-----------------------------------------------------------------------------------------
+
+
+# ////---- QLabel, ktorý meria čas vlastného vykreslenia (pre perf_hud) ----////
+class TimedLabel(QLabel):
+    def __init__(self, text="", owner=""):
+        super().__init__(text)
+        self._paint_key = f"{owner}.paint"
+
+    def paintEvent(self, event):
+        started = perf.now()
+        super().paintEvent(event)
+        perf.add_time(self._paint_key, perf.now() - started)
+# ////-----------------------------------------------------------------------------------------
@@ -0,0 +1,228 @@
+# schema.py
+# Typované a overené configy widgetov (nemenné objekty so __slots__)
+# Autor: Jastronit
+#
+# Widgety predtým zlúčili JSON s DEFAULT_CONFIG.copy() - plytká kópia zdieľala vnorené
+# slovníky (countdown_colors) - pri každom načítaní znova prevádzali typy a chyby potichu
+# zahodili. Schéma sa zostaví raz pri importe widgetu, každé načítanie z nej vyrobí
+# nemenný objekt s overenými typmi, chybné hodnoty nahradí predvolenými a vypíše prečo,
+# a changed() povie presne, ktoré polia sa oproti predchádzajúcej verzii zmenili.
+
+import re
+from types import MappingProxyType
+from collections.abc import Mapping
+
+
+# ////---- Zmrazenie / rozmrazenie vnorených hodnôt ----////
+def freeze(value):
+    if isinstance(value, Mapping):
+        return MappingProxyType({str(k): freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value):
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return value
+# ////-----------------------------------------------------------------------------------------
+
+
+# ////---- Prevody typov (ValueError = neplatná hodnota) ----////
+def to_bool(value):
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str) and value.strip().lower() in ("true", "false", "1", "0", "yes", "no", "on", "off"):
+        return value.strip().lower() in ("true", "1", "yes", "on")
+    raise ValueError(f"expected true/false, got {value!r}")
+
+
+def to_int(value):
+    if isinstance(value, bool):
+        raise ValueError(f"expected a whole number, got {value!r}")
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"expected a whole number, got {value!r}")
+    return int(value)
+
+
+def to_number(value):
+    """int or float (JSON numbers like 300 and 2.5 both stay as written)."""
+    if isinstance(value, bool):
+        raise ValueError(f"expected a number, got {value!r}")
+    if isinstance(value, (int, float)):
+        return value
+    number = float(value)
+    return int(number) if number.is_integer() else number
+
+
+def to_str(value):
+    if isinstance(value, (Mapping, list, tuple)):
+        raise ValueError(f"expected text, got {type(value).__name__}")
+    return str(value)
+
+
+def to_mapping(value):
+    if not isinstance(value, Mapping):
+        raise ValueError(f"expected an object, got {type(value).__name__}")
+    return value
+
+
+def to_list(value):
+    if not isinstance(value, (list, tuple)):
+        raise ValueError(f"expected a list, got {type(value).__name__}")
+    return value
+
+
+_COERCE = {bool: to_bool, int: to_int, float: to_number, str: to_str, dict: to_mapping, list: to_list}
+# ////-----------------------------------------------------------------------------------------
+
+
+# ////---- Kontroly hodnôt (vracajú text chyby alebo None) ----////
+COLOR_RE = re.compile(r"^(#([0-9a-fA-F]{3}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})|[a-zA-Z]+)$")
+
+def is_color(value):
+    return None if COLOR_RE.match(value) else f"{value!r} is not a color (#rrggbb or a color name)"
+
+
+def at_least(minimum):
+    def check(value):
+        return None if value >= minimum else f"{value} is less than {minimum}"
+    return check
+
+
+def one_of(*choices):
+    def check(value):
+        return None if value in choices else f"{value!r} is not one of {', '.join(map(str, choices))}"
+    return check
+
+
+def values_are(check=None):
+    """Every value of a mapping field must be text (and pass `check`, if given)."""
+    def check_values(mapping):
+        for key, value in mapping.items():
+            if not isinstance(value, str):
+                problem = f"{value!r} is not text"
+            else:
+                problem = check(value) if check is not None else None
+            if problem:
+                return f"{key}: {problem}"
+        return None
+    return check_values
+# ////-----------------------------------------------------------------------------------------
+
+
+# ////---- Pole schémy ----////
+class Field:
+    __slots__ = ("name", "default", "coerce", "check", "normalize")
+
+    def __init__(self, name, default, check=None, coerce=None, normalize=None):
+        self.name = name
+        self.default = freeze(default)
+        self.coerce = coerce or _COERCE[type(default)]
+        self.check = check
+        self.normalize = normalize  # napr. str.lower pre voľby
+
+    def parse(self, raw):
+        value = self.coerce(raw)
+        if self.normalize is not None:
+            value = self.normalize(value)
+        value = freeze(value)
+        if self.check is not None:
+            problem = self.check(value)
+            if problem:
+                raise ValueError(problem)
+        return value
+# ////-----------------------------------------------------------------------------------------
+
+
+# ////---- Základ zostavených tried configu ----////
+class ConfigBase:
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other):
+        return type(other) is type(self) and all(
+            getattr(self, n) == getattr(other, n) for n in self.__slots__)
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, n) for n in self.__slots__ if not isinstance(getattr(self, n), Mapping)))
+
+    def __repr__(self):
+        fields = ", ".join(f"{n}={getattr(self, n)!r}" for n in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def get(self, name, default=None):
+        return getattr(self, name, default)
+
+    def changed(self, previous):
+        """Names of fields that differ from `previous` (all of them if previous is None)."""
+        if previous is None:
+            return frozenset(self.__slots__)
+        return frozenset(n for n in self.__slots__ if getattr(self, n) != getattr(previous, n))
+
+    def as_dict(self):
+        return {n: thaw(getattr(self, n)) for n in self.__slots__}
+# ////-----------------------------------------------------------------------------------------
+
+
+# ////---- Schéma (zostavená raz, zdieľaná všetkými inštanciami widgetu) ----////
+class Schema:
+    def __init__(self, name, fields):
+        self.name = name
+        self.fields = tuple(fields)
+        self.cls = type(name, (ConfigBase,), {"__slots__": tuple(f.name for f in self.fields)})
+        self._default = self._build({f.name: f.default for f in self.fields})
+        self._last = (None, None)  # (surový objekt, výsledok) - hub posiela všetkým ten istý
+
+    def _build(self, values):
+        obj = object.__new__(self.cls)
+        for name, value in values.items():
+            object.__setattr__(obj, name, value)
+        return obj
+
+    def default(self):
+        return self._default
+
+    def defaults(self):
+        """Plain JSON-ready dict of the defaults (for writing a new config file)."""
+        return self._default.as_dict()
+
+    def load(self, raw, source=None):
+        """Build a validated config from parsed JSON. Invalid fields fall back to their
+        default; problems are printed once per loaded content with `source` as prefix."""
+        last_raw, last_cfg = self._last
+        if raw is not None and raw is last_raw:
+            return last_cfg
+        if not isinstance(raw, Mapping):
+            if raw is not None:
+                print(f"[Config] {source or self.name}: expected an object, using defaults")
+            return self._default
+
+        values = {}
+        problems = []
+        for field in self.fields:
+            if field.name not in raw:
+                values[field.name] = field.default
+                continue
+            try:
+                values[field.name] = field.parse(raw[field.name])
+            except (ValueError, TypeError) as e:
+                values[field.name] = field.default
+                problems.append(f"{field.name}: {e} (using {thaw(field.default)!r})")
+        for problem in problems:
+            print(f"[Config] {source or self.name}: {problem}")
+
+        cfg = self._build(values)
+        self._last = (raw, cfg)
+        return cfg
+# ////-----------------------------------------------------------------------------------------
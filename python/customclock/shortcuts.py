@@ -0,0 +1,230 @@
+# shortcuts.py
+# Zdieľaný register klávesových skratiek nad shortcut_manager.get_bridge()
+# Autor: Jastronit
+#
+# Všetky skratky modulu (stopky, vlastné overlaye, ...) sú v jednom trie normalizovaných
+# akordov. Bridge dostane práve jeden handler na akord, bez ohľadu na počet widgetov,
+# a spracovanie udalosti je jedno vyhľadanie v slovníku aktuálneho uzla.
+
+import re
+import time
+
+from shortcut_manager import get_bridge
+
+# ////---- Konštanty ----////
+# poradie modifikátorov, v akom ich posiela ShortcutListener (a nahráva editor overlayov)
+MODIFIER_ORDER = ("ctrl", "alt", "shift", "meta")
+MODIFIER_ALIASES = {
+    "control": "ctrl",
+    "ctl": "ctrl",
+    "option": "alt",
+}
+# max. pauza medzi akordmi viacklávesovej skratky, napr. "ctrl+k, ctrl+s"
+SEQUENCE_TIMEOUT = 1.5
+# oddeľovač akordov - čiarka, ktorá nie je samotnou klávesou ("ctrl+,")
+_SEQUENCE_SPLIT = re.compile(r"(?<!\+),")
+# ////-----------------------------------------------------------------------------------------
+
+# ////---- Normalizácia ----////
+def normalize_chord(chord):
+    """Normalize one chord ('Shift + Ctrl + Up') to the bridge form ('ctrl+shift+up')."""
+    text = (chord or "").replace(" ", "").lower()
+    if not text:
+        return ""
+    parts = text.split("+")
+    if text.endswith("+"):
+        # klávesa "+" samotná, napr. "ctrl++"
+        parts = [p for p in parts if p] + ["+"]
+    mods = set()
+    keys = []
+    for part in parts:
+        if not part:
+            continue
+        part = MODIFIER_ALIASES.get(part, part)
+        if part in MODIFIER_ORDER:
+            mods.add(part)
+        else:
+            keys.append(part)
+    return "+".join([m for m in MODIFIER_ORDER if m in mods] + keys)
+
+
+def parse_sequence(text):
+    """Split a shortcut into a tuple of normalized chords ('ctrl+k, ctrl+s' -> 2 chords)."""
+    if not text:
+        return ()
+    chords = tuple(normalize_chord(c) for c in _SEQUENCE_SPLIT.split(text))
+    if not all(chords):
+        return ()
+    return chords
+
+
+def format_sequence(chords):
+    return ", ".join(chords)
+# ////-----------------------------------------------------------------------------------------
+
+# ////---- Trie ----////
+class _Node:
+    __slots__ = ("children", "bindings")
+
+    def __init__(self):
+        self.children = {}
+        self.bindings = []
+
+
+class Binding:
+    """One registered shortcut. `name` identifies what it does (e.g. 'stopwatch/start');
+    bindings with the same name may share a sequence (several instances of one widget),
+    different names on the same or a prefix sequence are reported as conflicts."""
+    __slots__ = ("sequence", "handler", "owner", "name", "conflicts")
+
+    def __init__(self, sequence, handler, owner, name):
+        self.sequence = sequence
+        self.handler = handler
+        self.owner = owner
+        self.name = name
+        self.conflicts = []
+# ////-----------------------------------------------------------------------------------------
+
+# ////---- Register ----////
+class ShortcutRegistry:
+    def __init__(self, bridge):
+        self.bridge = bridge
+        self._root = _Node()
+        self._bridge_handlers = {}  # chord -> [handler, počet použití]
+        self._pending = None  # uzol rozpracovanej sekvencie
+        self._pending_deadline = 0.0
+
+    def _walk(self, sequence):
+        node = self._root
+        for chord in sequence:
+            node = node.children.get(chord)
+            if node is None:
+                return None
+        return node
+
+    def _collect(self, node, out):
+        out.extend(node.bindings)
+        for child in node.children.values():
+            self._collect(child, out)
+
+    def find_conflicts(self, sequence, name):
+        """Bindings (with another name) whose sequence equals, extends or prefixes `sequence`."""
+        found = []
+        node = self._root
+        for chord in sequence[:-1]:
+            node = node.children.get(chord)
+            if node is None:
+                return found
+            found.extend(node.bindings)  # kratšia skratka je prefixom novej
+        node = node.children.get(sequence[-1]) if sequence else None
+        if node is not None:
+            self._collect(node, found)  # rovnaká alebo dlhšia skratka
+        return [b for b in found if b.name != name]
+
+    def register(self, text, handler, owner=None, name=""):
+        """Register `handler` (zero-arg) for shortcut `text`. Returns the Binding, or None
+        if the text is empty/invalid. Conflicts are listed in binding.conflicts."""
+        sequence = parse_sequence(text)
+        if not sequence:
+            return None
+        binding = Binding(sequence, handler, owner, name)
+        binding.conflicts = self.find_conflicts(sequence, name)
+        node = self._root
+        for chord in sequence:
+            node = node.children.setdefault(chord, _Node())
+            self._subscribe(chord)
+        node.bindings.append(binding)
+        return binding
+
+    def unregister(self, binding):
+        if binding is None:
+            return
+        path = [self._root]
+        for chord in binding.sequence:
+            node = path[-1].children.get(chord)
+            if node is None:
+                return
+            path.append(node)
+        try:
+            path[-1].bindings.remove(binding)
+        except ValueError:
+            return
+        # odstráň prázdne uzly a odhlás akordy, ktoré už nikto nepoužíva
+        for depth in range(len(binding.sequence), 0, -1):
+            chord = binding.sequence[depth - 1]
+            node = path[depth]
+            if not node.bindings and not node.children:
+                del path[depth - 1].children[chord]
+                if self._pending is node:
+                    self._pending = None
+            self._unsubscribe(chord)
+
+    def unregister_owner(self, owner):
+        bindings = []
+        self._collect(self._root, bindings)
+        for binding in bindings:
+            if binding.owner is owner:
+                self.unregister(binding)
+
+    def bindings(self):
+        out = []
+        self._collect(self._root, out)
+        return out
+
+    # ----- bridge -----
+    def _subscribe(self, chord):
+        entry = self._bridge_handlers.get(chord)
+        if entry is not None:
+            entry[1] += 1
+            return
+        # handler musí byť bez argumentov - bridge.emit nič neposiela
+        handler = lambda: self.dispatch(chord)
+        self._bridge_handlers[chord] = [handler, 1]
+        try:
+            self.bridge.on(f"shortcut.{chord}", handler)
+        except Exception:
+            pass
+
+    def _unsubscribe(self, chord):
+        entry = self._bridge_handlers.get(chord)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del self._bridge_handlers[chord]
+        try:
+            self.bridge.off(f"shortcut.{chord}", entry[0])
+        except Exception:
+            pass
+
+    def dispatch(self, chord):
+        """Feed one chord from the bridge; fires the bindings of a completed sequence."""
+        now = time.monotonic()
+        node = None
+        if self._pending is not None and now <= self._pending_deadline:
+            node = self._pending.children.get(chord)
+        if node is None:
+            node = self._root.children.get(chord)
+        if node is None:
+            self._pending = None
+            return
+        # uzol s deťmi čaká na ďalší akord (ak má aj vlastné bindingy, tie sa spustia hneď)
+        self._pending = node if node.children else None
+        self._pending_deadline = now + SEQUENCE_TIMEOUT
+        for binding in list(node.bindings):
+            try:
+                binding.handler()
+            except Exception as e:
+                print(f"[Shortcuts] Chyba v skratke {format_sequence(binding.sequence)} ({binding.name}): {e}")
+# ////-----------------------------------------------------------------------------------------
+
+# ////---- Jeden register pre celý proces ----////
+_registry = None
+
+def get_registry():
+    global _registry
+    if _registry is None:
+        _registry = ShortcutRegistry(get_bridge())
+    return _registry
+# ////-----------------------------------------------------------------------------------------
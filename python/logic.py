@@ -5,9 +5,15 @@ import sqlite3
 import time
 import configparser
 import os
+import sys
 import platform
 from datetime import datetime
 
+# ////---- Výkonnostné počítadlá pre perf_hud (python/customclock/perf.py) ----////
+if os.path.dirname(os.path.abspath(__file__)) not in sys.path:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from customclock import perf
+
 # ////---- Cesty k súborom ----////
 module_root = os.path.dirname(os.path.dirname(__file__))
 data_path = os.path.join(module_root, 'data', 'data.ini')
@@ -259,10 +265,21 @@ def write_time_to_ini(time_float, hours, minutes):
 def main_loop(conn=None, stop_event=None):
     while not (stop_event and stop_event.is_set()):
         try:
+            started = perf.now()
             user_profile_id = get_active_user_profile_id(conn)
             time_of_day = get_time_of_day(conn, user_profile_id)
+            queried = perf.now()
+            perf.add_time("logic.query", queried - started)
             hours, minutes = convert_float_time_to_hm(time_of_day)
+            converted = perf.now()
+            perf.add_time("logic.convert", converted - queried)
             write_time_to_ini(time_of_day,hours, minutes)
+            perf.add_time("logic.write", perf.now() - converted)
+        except sqlite3.OperationalError as e:
+            # databáza zamknutá hrou (busy/locked) - len sa započíta, ďalšia iterácia to skúsi znova
+            if "locked" in str(e) or "busy" in str(e):
+                perf.count("logic.db_busy")
+            log_to_console(f"Chyba: {e}")
         except Exception as e:
             log_to_console(f"Chyba: {e}")
 
@@ -1,19 +1,543 @@
-from PySide6.QtWidgets import QTextEdit, QVBoxLayout, QLabel, QApplication
-from PySide6.QtCore import QTimer, Qt
-from PySide6.QtGui import QPixmap, QPalette
+from PySide6.QtWidgets import (
+    QPlainTextEdit, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QLineEdit, QCheckBox
+)
+from PySide6.QtCore import QTimer, Qt, QFileSystemWatcher, QObject, Signal, QtMsgType
+from array import array
+from collections import deque
+from collections.abc import Mapping
+from datetime import datetime, timedelta
 import os
+import re
+import sys
+import json
+import time
+import heapq
+import itertools
 
-# ////---- Jednoduchá detekcia dark mode ----////
-# Táto funkcia by mala fungovať na všetkých platformách
-def is_dark_mode():
-    palette = QApplication.instance().palette()
-    window_color = palette.color(QPalette.Window)
-    # jednoduchá heuristika: ak je pozadie tmavé, berieme to ako dark mode
-    return window_color.lightness() < 128
+# ////---- Zdieľané pomocné moduly (python/customclock) ----////
+PYTHON_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "python")
+if PYTHON_DIR not in sys.path:
+    sys.path.append(PYTHON_DIR)
+from customclock import perf
+from customclock.assets import banner_pixmap
+from customclock.lifecycle import VisibilityLifecycle
+from customclock.qtlog import get_capture
+from customclock.schema import Schema, Field, at_least
+
+# ////---- Nastavenia konzoly ----////
+MAX_LINES = 1000          # maximumBlockCount - staršie riadky QPlainTextEdit sám zahodí
+INITIAL_TAIL_LINES = 64   # koľko posledných riadkov sa ukáže pri otvorení
+TAIL_CHUNK = 64 * 1024    # koľko bajtov od konca sa číta pri prvom načítaní
+READ_DEBOUNCE_MS = 50     # zlúčenie viacerých fileChanged notifikácií do jedného čítania
+INDEX_CHUNK = 64 * 1024   # koľko bajtov index spracuje v jednej iterácii event loopu
+MIN_SEARCH_CHARS = 3      # kratší text sa nehľadá (nemá trigramy - bol by to sken celého súboru)
+VERIFY_LIMIT = 5000       # najviac kandidátov z trigramov, ktorých text sa overí z disku
+
+# ////---- Úrovne závažnosti (stĺpec indexu) ----////
+LEVEL_INFO, LEVEL_WARNING, LEVEL_ERROR = 0, 1, 2
+LEVEL_FILTERS = [
+    ("All levels", LEVEL_INFO),
+    ("Warnings + errors", LEVEL_WARNING),
+    ("Errors only", LEVEL_ERROR)
+]
+ERROR_WORDS = ("error", "chyba", "exception", "traceback", "failed", "nepodarilo")
+WARNING_WORDS = ("warn", "varovanie", "not found", "nenájden", "nebol nájden")
+TAG_RE = re.compile(r"\[([A-Za-z][\w .-]*)\]")
+TS_RE = re.compile(r"(?:(\d{4})-(\d{2})-(\d{2})[ T])?(\d{1,2}):(\d{2}):(\d{2})(?:[.,](\d{1,6}))?")
+
+# ////---- Zdroje logov (config/console.json) ----////
+# path: relatívne ku koreňu modulu alebo absolútna cesta; "qt:" = Qt warnings tohto procesu
+CONFIG_SCHEMA = Schema("ConsoleConfig", [
+    Field("sources", [
+        {"name": "module", "path": "data/log.txt", "enabled": True},
+        {"name": "qt", "path": "qt:", "enabled": True}
+    ]),
+    Field("merge_delay_ms", 300, at_least(0)),  # ako dlho sa čaká na riadky z ostatných zdrojov pred zoradením
+    Field("merge_buffer_lines", 2000, at_least(1))  # strop bufferu pre zoradenie (pri prekročení sa vypíše hneď)
+])
+
+# ////---- Sledovanie konca súboru (tail -f) ----////
+class LogFollower:
+    """Remembers the byte offset in a log file and returns only complete new lines.
+       Truncation (size < offset) and rotation (different file identity) restart
+       reading from the beginning of the current file.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._offset = 0
+        self._file_id = None
+        self._pending = b""  # neukončený posledný riadok
+        self._pending_offset = 0  # bajtový offset začiatku neukončeného riadku
+        self.has_more = False  # read_new(max_bytes) nedočítal do konca
+
+    def read_tail(self, max_lines):
+        """Initial read: last max_lines lines, offset is left at the end of the file."""
+        try:
+            st = os.stat(self.path)
+            with open(self.path, "rb") as f:
+                start = max(0, st.st_size - TAIL_CHUNK)
+                f.seek(start)
+                data = f.read()
+        except OSError:
+            self._reset(None)
+            return []
+        self._file_id = (st.st_dev, st.st_ino)
+        self._offset = start + len(data)
+        if start > 0:
+            # prvý riadok môže byť odrezaný v strede
+            if b"\n" in data:
+                cut, data = data.split(b"\n", 1)
+                start += len(cut) + 1
+            else:
+                start, data = self._offset, b""
+        self._pending_offset = start
+        return [text for _, text in self._split(data)][-max_lines:]
+
+    @property
+    def lines_end(self):
+        """Byte offset right after the last complete line read so far."""
+        return self._pending_offset
+
+    def read_new(self, max_bytes=None, with_offsets=False):
+        """Return (lines, truncated). truncated=True means the view should be cleared.
+           With with_offsets=True lines are (byte_offset, text) pairs; max_bytes limits
+           one read and sets has_more when the file wasn't read to the end.
+        """
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            self._reset(None)
+            return [], False
+        file_id = (st.st_dev, st.st_ino)
+        truncated = False
+        if file_id != self._file_id:
+            # rotácia - nový súbor sa číta od začiatku
+            self._reset(file_id)
+        elif st.st_size < self._offset:
+            # skrátenie (napr. logic.py log pri štarte vyčistí)
+            self._reset(file_id)
+            truncated = True
+        self.has_more = False
+        if st.st_size == self._offset:
+            return [], truncated
+        size = st.st_size - self._offset
+        if max_bytes is not None and size > max_bytes:
+            size = max_bytes
+            self.has_more = True
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(self._offset)
+                data = f.read(size)
+        except OSError:
+            return [], truncated
+        self._offset += len(data)
+        lines = self._split(data)
+        if not with_offsets:
+            lines = [text for _, text in lines]
+        return lines, truncated
+
+    def _reset(self, file_id):
+        self._offset = 0
+        self._file_id = file_id
+        self._pending = b""
+        self._pending_offset = 0
+
+    def _split(self, data):
+        data = self._pending + data
+        parts = data.split(b"\n")
+        self._pending = parts.pop()
+        result = []
+        offset = self._pending_offset
+        for p in parts:
+            result.append((offset, p.decode("utf-8", errors="replace").rstrip("\r")))
+            offset += len(p) + 1
+        self._pending_offset = offset
+        return result
+
+# ////---- Klasifikácia riadku logu ----////
+def classify_line(text):
+    """Return (level, tag) of a log line like "[12:00:00] [LOGIC] Chyba: ..."."""
+    lower = text.lower()
+    if any(w in lower for w in ERROR_WORDS):
+        level = LEVEL_ERROR
+    elif any(w in lower for w in WARNING_WORDS):
+        level = LEVEL_WARNING
+    else:
+        level = LEVEL_INFO
+    match = TAG_RE.search(text)
+    return level, (match.group(1) if match else "")
+
+def line_trigrams(lower):
+    return {lower[i:i + 3] for i in range(len(lower) - 2)}
+
+# ////---- Index riadkov logu (offset, úroveň, tag, trigramy) ----////
+class LogIndex:
+    """In-memory line index of log.txt, built incrementally.
+
+    Per line only the byte offset, level and tag id are kept (compact arrays) plus
+    trigram posting lists for substring search. Line texts stay on disk and are
+    read lazily by offset for the lines that are actually shown.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.follower = LogFollower(path)
+        self.tag_names = [""]
+        self._reset()
+
+    def _reset(self):
+        self.offsets = array("Q")
+        self.levels = array("B")
+        self.tags = array("H")
+        self._tag_ids = {name: i for i, name in enumerate(self.tag_names)}
+        self._trigrams = {}
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def update(self, max_bytes=INDEX_CHUNK):
+        """Index new bytes. Returns (new_entries, reset) where new_entries are
+           (offset, text) pairs and reset means the file was truncated or rotated;
+           follower.has_more tells whether another call is needed to catch up.
+        """
+        entries, truncated = self.follower.read_new(max_bytes, with_offsets=True)
+        if truncated or (entries and entries[0][0] == 0 and len(self.offsets)):
+            self._reset()
+            truncated = True
+        for offset, text in entries:
+            self.add(offset, text)
+        return entries, truncated
+
+    def tag_id(self, tag):
+        tid = self._tag_ids.get(tag)
+        if tid is None:
+            tid = len(self.tag_names)
+            self.tag_names.append(tag)
+            self._tag_ids[tag] = tid
+        return tid
+
+    def add(self, offset, text):
+        line_no = len(self.offsets)
+        level, tag = classify_line(text)
+        self.offsets.append(offset)
+        self.levels.append(level)
+        self.tags.append(self.tag_id(tag))
+        for tri in line_trigrams(text.lower()):
+            posting = self._trigrams.get(tri)
+            if posting is None:
+                posting = self._trigrams[tri] = array("I")
+            posting.append(line_no)
+
+    def query(self, min_level=LEVEL_INFO, tag=None, needle="", limit=MAX_LINES):
+        """Return the last `limit` matching line texts (oldest first)."""
+        needle = needle.lower()
+        tid = self._tag_ids.get(tag) if tag else None
+        if tag and tid is None:
+            return []
+
+        if len(needle) < MIN_SEARCH_CHARS:
+            needle = ""
+
+        # kandidáti z trigramov (nadmnožina, overí sa textom z disku)
+        if needle:
+            postings = []
+            for tri in line_trigrams(needle):
+                posting = self._trigrams.get(tri)
+                if posting is None:
+                    return []
+                postings.append(posting)
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates.intersection_update(posting)
+                if not candidates:
+                    return []
+            line_nos = sorted(candidates, reverse=True)
+            wanted = VERIFY_LIMIT  # časté trigramy - overí sa len najnovšia časť
+        else:
+            line_nos = range(len(self.offsets) - 1, -1, -1)
+            wanted = limit
+
+        # úroveň a tag sa filtrujú v pamäti, z disku sa číta až výsledný výber
+        picked = []
+        for n in line_nos:
+            if self.levels[n] < min_level or (tid is not None and self.tags[n] != tid):
+                continue
+            picked.append(n)
+            if len(picked) >= wanted:
+                break
+        picked.reverse()
+
+        with self._open() as f:
+            texts = self._read_lines(f, picked)
+        result = [texts[n] for n in picked]
+        if needle:
+            result = [text for text in result if needle in text.lower()]
+        return result[-limit:]
+
+    def _read_lines(self, f, line_nos):
+        """{line_no: text} for ascending line_nos; consecutive lines are read as one block."""
+        texts = {}
+        run = []
+        for n in itertools.chain(line_nos, [None]):
+            if run and (n is None or n != run[-1] + 1):
+                start = self.offsets[run[0]]
+                last = run[-1]
+                f.seek(start)
+                if last + 1 < len(self.offsets):
+                    data = f.read(self.offsets[last + 1] - start)
+                else:
+                    data = f.read(self.offsets[last] - start) + f.readline()
+                for line_no, raw in zip(run, data.split(b"\n")):
+                    texts[line_no] = raw.decode("utf-8", errors="replace").rstrip("\r")
+                run = []
+            if n is not None:
+                run.append(n)
+        return texts
+
+    def _open(self):
+        try:
+            return open(self.path, "rb")
+        except OSError:
+            return open(os.devnull, "rb")
+
+# ////---- Časová značka riadku logu ----////
+def parse_timestamp(text, fallback=None):
+    """Epoch seconds of the first "[YYYY-MM-DD ]HH:MM:SS[.fff]" in the line head, else fallback.
+       Lines with time only are placed on today's date (yesterday if that would be in the future).
+    """
+    match = TS_RE.search(text, 0, 48)
+    if not match:
+        return fallback
+    year, month, day, hh, mm, ss, frac = match.groups()
+    try:
+        if year:
+            base = datetime(int(year), int(month), int(day))
+        else:
+            base = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        stamp = base + timedelta(hours=int(hh), minutes=int(mm), seconds=int(ss))
+    except ValueError:
+        return fallback
+    ts = stamp.timestamp() + (float("0." + frac) if frac else 0.0)
+    if not year and ts > time.time() + 3600:
+        ts -= 86400
+    return ts
+
+def with_timestamps(name, texts, last_ts=None):
+    """[(ts, name, text)] - riadky bez časovej značky dedia čas predchádzajúceho riadku."""
+    result = []
+    for text in texts:
+        last_ts = parse_timestamp(text, last_ts if last_ts is not None else 0.0)
+        result.append((last_ts, name, text))
+    return result
+
+# ////---- Zdroj: súbor s logom ----////
+class FileLogSource:
+    """Log file shown live and searchable. The index follower is the only reader of
+       new bytes; lines past the start of the live view are queued for read_new().
+    """
+    def __init__(self, name, path, enabled=True):
+        self.name = name
+        self.path = path
+        self.enabled = enabled
+        self.index = LogIndex(path)  # pre filter/vyhľadávanie aj živé zobrazenie
+        self._live_offset = None  # bajtový offset, od ktorého riadky ešte nie sú v zobrazení
+        self._unread = []  # (offset, text) nových riadkov pre zobrazenie
+        self._last_ts = None
+
+    @property
+    def tag_names(self):
+        return self.index.tag_names[1:]
+
+    def watch(self, watcher):
+        try:
+            log_dir = os.path.dirname(self.path)
+            if os.path.isdir(log_dir) and log_dir not in watcher.directories():
+                watcher.addPath(log_dir)
+            if os.path.exists(self.path) and self.path not in watcher.files():
+                watcher.addPath(self.path)
+        except Exception:
+            pass
+
+    def tail(self, max_lines):
+        # koniec súboru sa prečíta jednorazovo; ďalšie riadky už prinesie index
+        follower = LogFollower(self.path)
+        entries = with_timestamps(self.name, follower.read_tail(max_lines))
+        self._live_offset = follower.lines_end
+        self._unread = [e for e in self._unread if e[0] >= self._live_offset]
+        self._last_ts = entries[-1][0] if entries else None
+        return entries
+
+    def read_new(self):
+        """Lines the index read past the live view since the last call (no file I/O)."""
+        lines, self._unread = self._unread, []
+        entries = with_timestamps(self.name, [text for _, text in lines], self._last_ts)
+        if entries:
+            self._last_ts = entries[-1][0]
+        return entries, False
+
+    def update_index(self):
+        """Returns (truncated, has_more)."""
+        entries, truncated = self.index.update()
+        if truncated:
+            # nový obsah sa zobrazí od začiatku (pohľad sa aj tak prestavia)
+            self._unread = []
+            if self._live_offset is not None:
+                self._live_offset = 0
+        if self.enabled and self._live_offset is not None:
+            # vypnutý zdroj si riadky nedrží - po zapnutí sa pohľad prestaví cez tail()
+            self._unread.extend(e for e in entries if e[0] >= self._live_offset)
+        return truncated, self.index.follower.has_more
+
+    def has_unread(self):
+        return bool(self._unread)
+
+    def query(self, min_level, tag, needle, limit):
+        # výsledok obsahuje všetko zaindexované, teda aj riadky čakajúce na zobrazenie
+        self._unread = []
+        return with_timestamps(self.name, self.index.query(min_level, tag, needle, limit))
+
+# ////---- Zdroj: Qt správy (qWarning, qCritical, ...) tohto procesu ----////
+class QtMessageSource(QObject):
+    """Qt messages of this process from the shared capture (customclock.qtlog) in a
+       bounded in-memory buffer. The host's previous handler is still called there.
+    """
+    message_logged = Signal()  # emitované aj z iných vlákien -> queued do hlavného vlákna
+
+    LEVELS = {
+        QtMsgType.QtWarningMsg: LEVEL_WARNING,
+        QtMsgType.QtCriticalMsg: LEVEL_ERROR,
+        QtMsgType.QtFatalMsg: LEVEL_ERROR
+    }
+
+    def __init__(self, name, enabled=True):
+        super().__init__()
+        self.name = name
+        self.enabled = enabled
+        self._buffer = deque(maxlen=MAX_LINES)  # (ts, level, text)
+        self._unread = deque(maxlen=MAX_LINES)  # ohraničené aj pre skrytú konzolu
+        self._installed = False
+
+    @property
+    def tag_names(self):
+        return ["Qt"]
+
+    def install(self):
+        if not self._installed:
+            capture = get_capture()
+            # správy zachytené skôr (napr. pre inú konzolu) tvoria začiatok bufferu
+            for ts, mode, message in list(capture.backlog)[-MAX_LINES:]:
+                self._buffer.append(self._entry(ts, mode, message))
+            capture.subscribe(self._on_message)
+            self._installed = True
+
+    def uninstall(self):
+        if self._installed:
+            get_capture().unsubscribe(self._on_message)
+            self._installed = False
+
+    def _entry(self, ts, mode, message):
+        kind = getattr(mode, "name", str(mode)).replace("Qt", "").replace("Msg", "").lower()
+        text = f"[{datetime.fromtimestamp(ts).strftime('%H:%M:%S')}] [Qt] {kind}: {message}"
+        return ts, self.LEVELS.get(mode, LEVEL_INFO), text
+
+    def _on_message(self, ts, mode, message):
+        entry = self._entry(ts, mode, message)
+        self._buffer.append(entry)
+        if not self.enabled:
+            # vypnutý zdroj nové riadky nedrží - po zapnutí sa pohľad prestaví cez tail()
+            return
+        self._unread.append(entry)
+        self.message_logged.emit()
+
+    def watch(self, watcher):
+        pass
+
+    def tail(self, max_lines):
+        self._unread.clear()
+        return [(ts, self.name, text) for ts, _level, text in list(self._buffer)[-max_lines:]]
+
+    def read_new(self):
+        entries = []
+        while self._unread:
+            ts, _level, text = self._unread.popleft()
+            entries.append((ts, self.name, text))
+        return entries, False
+
+    def update_index(self):
+        return False, False
+
+    def has_unread(self):
+        return bool(self._unread)
+
+    def query(self, min_level, tag, needle, limit):
+        if tag and tag != "Qt":
+            return []
+        needle = needle.lower()
+        result = [(ts, self.name, text) for ts, level, text in self._buffer
+                  if level >= min_level and (not needle or needle in text.lower())]
+        return result[-limit:]
+
+# ////---- Zoradenie riadkov z viacerých zdrojov podľa času (streaming heap merge) ----////
+class StreamMerger:
+    """Holds freshly read lines for a short delay and releases them in timestamp order.
+       Memory is bounded: past max_lines the oldest lines are released immediately.
+    """
+    def __init__(self, delay, max_lines):
+        self.delay = delay
+        self.max_lines = max_lines
+        self._heap = []
+        self._seq = itertools.count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, entries):
+        now = time.time()
+        for ts, name, text in entries:
+            # (časová značka, poradie príchodu, čas príchodu, zdroj, text)
+            heapq.heappush(self._heap, (ts, next(self._seq), now, name, text))
+
+    def pop_ready(self, flush=False):
+        """Release lines whose hold-back delay has passed (or all with flush=True)."""
+        now = time.time()
+        ready = []
+        while self._heap:
+            ts, _seq, arrived, name, text = self._heap[0]
+            if not (flush or len(self._heap) > self.max_lines or arrived + self.delay <= now):
+                break
+            heapq.heappop(self._heap)
+            ready.append((ts, name, text))
+        return ready
+
+    def next_release_in(self):
+        if not self._heap:
+            return None
+        return max(0.0, min(item[2] for item in self._heap) + self.delay - time.time())
+
+    def clear(self):
+        self._heap.clear()
+
+# ////---- Načítanie zdrojov z configu ----////
+def build_sources(cfg, module_root):
+    sources = []
+    for spec in cfg.sources:
+        # neúplná položka sa preskočí, ostatné zdroje ostávajú
+        if not isinstance(spec, Mapping) or not spec.get("path"):
+            continue
+        name = str(spec.get("name") or spec["path"])
+        enabled = bool(spec.get("enabled", True))
+        path = str(spec["path"])
+        if path == "qt:":
+            sources.append(QtMessageSource(name, enabled))
+        else:
+            if not os.path.isabs(path):
+                path = os.path.normpath(os.path.join(module_root, path))
+            sources.append(FileLogSource(name, path, enabled))
+    return sources
 
 # ////---- Vytvorenie widgetu konzoly ----////
 def create_widget(BaseClass, module_name):
-    class ConsoleWidget(BaseClass):
+    class ConsoleWidget(VisibilityLifecycle, BaseClass):
         def __init__(self):
             super().__init__(module_name)
 
@@ -23,51 +547,256 @@ def create_widget(BaseClass, module_name):
 
             self.setMinimumSize(333, 100)
 
-            # banner
-            if is_dark_mode():
-                banner_path = os.path.join(os.path.dirname(__file__), "../assets/banners/CONSOLE.png")
-            else:
-                banner_path = os.path.join(os.path.dirname(__file__), "../assets/banners/CONSOLE_DARK.png")
-            if os.path.exists(banner_path):
+            # banner (predškálovaný a cachovaný podľa témy a DPI)
+            pixmap = banner_pixmap("CONSOLE", 32)
+            if pixmap is not None:
                 self.banner = QLabel()
-                pixmap = QPixmap(banner_path)
-                self.banner.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                # zväčšenie / prispôsobenie na šírku widgetu
-                self.banner.setPixmap(pixmap.scaledToHeight(32, Qt.SmoothTransformation))
+                self.banner.setPixmap(pixmap)
                 self.banner.setAlignment(Qt.AlignCenter)
                 layout.addWidget(self.banner)
 
-            # konzola
-            self.text = QTextEdit()
+            # zdroje logov (config/console.json)
+            self._config_path = self.get_config_path("console.json")
+            cfg = self._load_config()
+            module_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            self._sources = build_sources(cfg, module_root)
+            self._merger = StreamMerger(cfg.merge_delay_ms / 1000.0, cfg.merge_buffer_lines)
+
+            # prepínače zdrojov
+            source_row = QHBoxLayout()
+            source_row.addWidget(QLabel("Sources:"))
+            self._source_toggles = {}
+            for source in self._sources:
+                toggle = QCheckBox(source.name)
+                toggle.setChecked(source.enabled)
+                toggle.toggled.connect(lambda checked, src=source: self._on_source_toggled(src, checked))
+                source_row.addWidget(toggle)
+                self._source_toggles[source.name] = toggle
+            source_row.addStretch(1)
+            layout.addLayout(source_row)
+
+            # filter a vyhľadávanie (úroveň, tag, text) nad indexom logu
+            filter_row = QHBoxLayout()
+            self.level_filter = QComboBox()
+            for label, _level in LEVEL_FILTERS:
+                self.level_filter.addItem(label)
+            self.tag_filter = QComboBox()
+            self.tag_filter.addItem("All tags", "")
+            self.search_field = QLineEdit()
+            self.search_field.setPlaceholderText("Search...")
+            self.search_field.setClearButtonEnabled(True)
+            filter_row.addWidget(self.level_filter)
+            filter_row.addWidget(self.tag_filter)
+            filter_row.addWidget(self.search_field, 1)
+            layout.addLayout(filter_row)
+
+            # konzola - QPlainTextEdit s limitom riadkov, nové riadky sa len pripájajú
+            self.text = QPlainTextEdit()
             self.text.setReadOnly(True)
+            self.text.setMaximumBlockCount(MAX_LINES)
             layout.addWidget(self.text)
 
-            # test counter
-            self.counter = 0
-
-            # timer na pravidelný update
+            # čítanie je riadené zmenami súborov, nie periodickým timerom;
+            # krátky single-shot timer zlúči sériu zápisov do jedného čítania
             self.timer = QTimer(self)
-            self.timer.timeout.connect(self.update_widget)
-            self.timer.start(1000)  # každú sekundu
+            self.timer.setSingleShot(True)
+            self.timer.timeout.connect(lambda: self._on_wakeup(self.update_widget))
 
-        def update_widget(self):
-            log_file = self.get_data_path("log.txt")
+            # vypustenie zadržaných riadkov z mergera (len ak nejaké čakajú)
+            self._merge_timer = QTimer(self)
+            self._merge_timer.setSingleShot(True)
+            self._merge_timer.timeout.connect(lambda: self._on_wakeup(self._flush_merger))
+
+            # indexy sa stavajú po kúskoch na pozadí event loopu, aby otvorenie konzoly nečakalo
+            self._index_timer = QTimer(self)
+            self._index_timer.setSingleShot(True)
+            self._index_timer.timeout.connect(lambda: self._on_wakeup(self._update_index))
+            self._index_timer.start(0)
+
+            # skrytá konzola nečíta logy - len si poznačí, že pri zobrazení má dobehnúť
+            self._logs_dirty = False
 
-            log_lines = []
+            self._watcher = QFileSystemWatcher(self)
+            self._watcher.fileChanged.connect(self._on_log_changed)
+            # adresár sa sleduje kvôli znovuvytvoreniu / rotácii logov
+            self._watcher.directoryChanged.connect(self._on_log_changed)
+            for source in self._sources:
+                source.watch(self._watcher)
+                if isinstance(source, QtMessageSource):
+                    source.message_logged.connect(self._on_log_changed)
+                    source.install()
 
-            # načítanie log.txt
-            if os.path.exists(log_file):
-                with open(log_file, "r", encoding="utf-8") as f:
-                    log_lines = f.readlines()[-64:]  # posledných 64 riadkov
+            self.level_filter.currentIndexChanged.connect(self._apply_filter)
+            self.tag_filter.currentIndexChanged.connect(self._apply_filter)
+            self.search_field.textChanged.connect(self._apply_filter)
 
-            # vyčistenie a vypísanie do konzoly
+            # prvé zobrazenie - posledné riadky zo všetkých zapnutých zdrojov
+            self._apply_filter()
+
+        def _load_config(self):
+            user_cfg = None
+            try:
+                if not os.path.exists(self._config_path):
+                    os.makedirs(os.path.dirname(self._config_path), exist_ok=True)
+                    with open(self._config_path, "w", encoding="utf-8") as f:
+                        json.dump(CONFIG_SCHEMA.defaults(), f, indent=2)
+                with open(self._config_path, "r", encoding="utf-8") as f:
+                    user_cfg = json.load(f)
+            except Exception as e:
+                print(f"[Console] console.json sa nedá načítať: {e}")
+            return CONFIG_SCHEMA.load(user_cfg, "console.json")
+
+        def _enabled_sources(self):
+            return [s for s in self._sources if s.enabled]
+
+        def _on_source_toggled(self, source, checked):
+            source.enabled = checked
+            self._apply_filter()
+
+        def _on_log_changed(self, _path=None):
+            if self.widget_suspended:
+                self._logs_dirty = True
+                return
+            if not self.timer.isActive():
+                self.timer.start(READ_DEBOUNCE_MS)
+
+        def _format(self, name, text):
+            # pri viacerých zdrojoch sa riadok označí menom zdroja
+            if len(self._enabled_sources()) > 1:
+                return f"{name} | {text}"
+            return text
+
+        def _append_lines(self, entries):
+            if not entries:
+                return
+            bar = self.text.verticalScrollBar()
+            at_bottom = bar.value() >= bar.maximum()
+            old_value = bar.value()
+            for _ts, name, text in entries:
+                self.text.appendPlainText(self._format(name, text))
+            # pozícia sa drží, ak používateľ odscrolloval vyššie
+            if at_bottom:
+                bar.setValue(bar.maximum())
+            else:
+                bar.setValue(old_value)
+
+        # ////---- Filter ----////
+        def _filter_state(self):
+            min_level = LEVEL_FILTERS[max(0, self.level_filter.currentIndex())][1]
+            tag = self.tag_filter.currentData() or ""
+            needle = self.search_field.text()
+            if len(needle) < MIN_SEARCH_CHARS:
+                # rovnaké pravidlo ako LogIndex.query - krátky text ešte nefiltruje
+                needle = ""
+            return min_level, tag, needle
+
+        def _filter_active(self):
+            min_level, tag, needle = self._filter_state()
+            return min_level > LEVEL_INFO or bool(tag) or bool(needle)
+
+        def _apply_filter(self, *_args):
+            """Rebuild the view: last lines (or filter matches) of every enabled source,
+               merged by timestamp."""
+            min_level, tag, needle = self._filter_state()
+            active = self._filter_active()
+            limit = MAX_LINES if active else INITIAL_TAIL_LINES
+            parts = []
+            for source in self._enabled_sources():
+                if active:
+                    parts.append(source.query(min_level, tag, needle, limit))
+                else:
+                    parts.append(source.tail(limit))
+            merged = list(heapq.merge(*parts, key=lambda entry: entry[0]))[-limit:]
+            self._merger.clear()
             self.text.clear()
-            for line in log_lines:
-                self.text.append(line.strip())
+            self._append_lines(merged)
+
+        def _matches_filter(self, text):
+            min_level, tag, needle = self._filter_state()
+            level, line_tag = classify_line(text)
+            if level < min_level or (tag and line_tag != tag):
+                return False
+            return not needle or needle.lower() in text.lower()
+
+        def _update_index(self):
+            more = False
+            rebuild = False
+            for source in self._sources:
+                truncated, has_more = source.update_index()
+                more = more or has_more
+                rebuild = rebuild or (truncated and source.enabled)
+                # nové tagy do výberu
+                for name in source.tag_names:
+                    if self.tag_filter.findData(name) < 0:
+                        self.tag_filter.addItem(name, name)
+            if more:
+                self._index_timer.start(0)
+            if rebuild:
+                self._apply_filter()
+            elif any(source.has_unread() for source in self._enabled_sources()):
+                self._show_new()
+
+        def _on_wakeup(self, handler):
+            # počítadlá pre perf_hud (prebudenia a čas práce konzoly)
+            perf.count("wakeup.console")
+            started = perf.now()
+            handler()
+            perf.add_time("console.update", perf.now() - started)
+
+        # ////---- Nové riadky ----////
+        def update_widget(self):
+            for source in self._enabled_sources():
+                # log mohol byť zmazaný a vytvorený nanovo - watcher stratí cestu
+                source.watch(self._watcher)
+            # nové bajty číta len index; riadky pre zobrazenie odovzdá _show_new
+            if not self._index_timer.isActive():
+                self._update_index()
+            else:
+                self._show_new()
+
+        def _show_new(self):
+            for source in self._enabled_sources():
+                entries, _truncated = source.read_new()
+                if self._filter_active():
+                    entries = [e for e in entries if self._matches_filter(e[2])]
+                self._merger.push(entries)
+            self._flush_merger()
+
+        def _flush_merger(self):
+            self._append_lines(self._merger.pop_ready())
+            # zvyšok sa vypustí až po uplynutí oneskorenia - žiadny periodický timer
+            delay = self._merger.next_release_in()
+            if delay is not None:
+                self._merge_timer.start(int(delay * 1000) + 1)
+
+        # ////---- Viditeľnosť ----////
+        def suspend_widget(self):
+            # rozpracované čítanie / index / merger sa dokončí po zobrazení
+            if self.timer.isActive() or self._merge_timer.isActive() or self._index_timer.isActive():
+                self._logs_dirty = True
+            self.timer.stop()
+            self._merge_timer.stop()
+            self._index_timer.stop()
+
+        def resume_widget(self):
+            # nové riadky od posledného čítania naraz (LogFollower si pamätá offset)
+            if self._logs_dirty:
+                self._logs_dirty = False
+                self._on_wakeup(self.update_widget)
 
         def close_widget(self):
-            # zastavenie timeru a vyčistenie textu
+            # zastavenie sledovania a vyčistenie textu
             self.timer.stop()
+            self._merge_timer.stop()
+            self._index_timer.stop()
+            for source in self._sources:
+                if isinstance(source, QtMessageSource):
+                    source.uninstall()
+            try:
+                self._watcher.fileChanged.disconnect(self._on_log_changed)
+                self._watcher.directoryChanged.disconnect(self._on_log_changed)
+            except Exception:
+                pass
             self.text.clear()
 
     return ConsoleWidget()
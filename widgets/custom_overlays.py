@@ -7,17 +7,30 @@
 # ////---- Importovanie potrebných knižníc ----////
 # /////////////////////////////////////////////////////////////////////////////////////////////
 import os
+import sys
+import ast
+import copy
 import json
+import time
 import importlib.util
+import importlib.machinery
 import glob
+from collections import deque
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QPushButton, QLabel, QListWidget, QListWidgetItem,
-    QHBoxLayout, QSpinBox, QMessageBox, QApplication, QColorDialog, QLineEdit
+    QHBoxLayout, QSpinBox, QMessageBox, QColorDialog, QLineEdit, QCheckBox
 )
-from PySide6.QtCore import Qt, QEvent
-from PySide6.QtGui import QPixmap, QPalette, QColor
+from PySide6.QtCore import Qt, QEvent, QTimer, QRect, QPoint
+from PySide6.QtGui import QColor, QGuiApplication, QPainter, QPen
 import overlay_manager
-from shortcut_manager import get_bridge
+
+# ////---- Zdieľané pomocné moduly (python/customclock) ----////
+PYTHON_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "python")
+if PYTHON_DIR not in sys.path:
+    sys.path.append(PYTHON_DIR)
+from customclock.shortcuts import get_registry, format_sequence
+from customclock.assets import banner_pixmap, detect_rgba_mode
+from customclock.log import log_to_console
 
 DEAD_KEYS = {"ˇ", "´", "`", "^", "˚", "¨", "¸", "~"}
 INVALID_CHARS = {"?", "_", "ˇ"}
@@ -26,18 +39,7 @@ INVALID_CHARS = {"?", "_", "ˇ"}
 # ////---- Pomocné funkcie ----////
 # /////////////////////////////////////////////////////////////////////////////////////////////
 
-# ////---- Detekcia režimu RGBA pre štýly ----////
-def detect_rgba_mode():
-    test = QLabel()
-    try:
-        test.setStyleSheet("background-color: rgba(0,0,0,128);")
-        effective = test.palette().color(test.backgroundRole()).alpha()
-        if 120 <= effective <= 135:
-            return "int"
-    except Exception:
-        pass
-    return "float"
-
+# ////---- Detekcia režimu RGBA pre štýly (zisťuje sa raz za proces, customclock.assets) ----////
 RGBA_MODE = detect_rgba_mode()
 # ////-----------------------------------------------------------------------------------------
 
@@ -52,13 +54,6 @@ class DraggableListWidget(QListWidget):
         self.setDragDropMode(QListWidget.InternalMove)
 # ////-----------------------------------------------------------------------------------------
 
-# ////---- Deteckia tmavého režimu ----////
-def is_dark_mode():
-    palette = QApplication.instance().palette()
-    window_color = palette.color(QPalette.Window)
-    return window_color.lightness() < 128
-# ////-----------------------------------------------------------------------------------------
-
 # ////---- Cesty a načítanie/ukladanie konfigurácie ----////
 def get_config_path(module_name):
     return os.path.join("modules", module_name, "config", "custom_overlays.json")
@@ -88,22 +83,337 @@ def load_custom_overlays(module_name):
     return {}
 
 def save_custom_overlays(module_name, data):
+    # zápis cez dočasný súbor + os.replace - nikdy nezostane polovičný JSON
     path = get_config_path(module_name)
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+# ////-----------------------------------------------------------------------------------------
+
+# ////---- Nastavenia správcu overlayov (custom_overlays_settings.json) ----////
+def get_settings_path(module_name):
+    return os.path.join("modules", module_name, "config", "custom_overlays_settings.json")
+
+def load_overlay_settings(module_name):
+    # "compositor": všetky overlaye ako oblasti jedného celoobrazovkového okna
+    settings = {"compositor": False}
+    try:
+        with open(get_settings_path(module_name), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            settings.update(data)
+    except Exception:
+        pass
+    return settings
+
+def save_overlay_settings(module_name, settings):
+    path = get_settings_path(module_name)
+    tmp_path = path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(settings, f, indent=2)
+        os.replace(tmp_path, path)
+    except Exception:
+        pass
+# ////-----------------------------------------------------------------------------------------
+
+# ////---- Pamäťové úložisko overlayov s oneskoreným zápisom ----////
+STORE_SAVE_DELAY_MS = 500
+
+def merge_overlays(base, mine, theirs):
+    """Three-way merge of overlay configs. Overlays and fields changed in `mine` since
+    `base` win; everything else comes from `theirs` (the file as another writer left it)."""
+    merged = copy.deepcopy(theirs)
+    for cname in base:
+        if cname not in mine:
+            # overlay sme zmazali
+            merged.pop(cname, None)
+    for cname, params in mine.items():
+        old = base.get(cname)
+        if params == old:
+            continue
+        theirs_params = merged.get(cname)
+        if old is None or not isinstance(params, dict) or not isinstance(old, dict) or not isinstance(theirs_params, dict):
+            # nový overlay alebo iný tvar záznamu - platí náš celý
+            merged[cname] = copy.deepcopy(params)
+            continue
+        for key, value in params.items():
+            if key not in old or value != old[key]:
+                theirs_params[key] = copy.deepcopy(value)
+        for key in old:
+            if key not in params:
+                theirs_params.pop(key, None)
+    return merged
+
+
+class OverlayStore:
+    """In-memory, authoritative copy of custom_overlays.json.
+
+    Changes are marked dirty and written after STORE_SAVE_DELAY_MS of quiet with an
+    atomic temp-file + os.replace. The file is re-read only when its (mtime, size)
+    differs from what we last read or wrote, i.e. after an external edit. An external
+    edit that arrives while our changes are pending is merged with them (our changed
+    fields win, see merge_overlays), both on reload and right before the write. A file
+    that can't be parsed never replaces the data we already have; it is kept aside as
+    custom_overlays.json.bad before our next save overwrites it.
+    """
+    def __init__(self, module_name):
+        self.module_name = module_name
+        self.path = get_config_path(module_name)
+        self.data = {}
+        self.dirty = False
+        self._base = {}  # obsah súboru, ako sme ho naposledy načítali alebo zapísali
+        self._stamp = None
+        self._bad_stamp = None
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self.flush)
+        self.reload_if_changed()
+
+    def _disk_stamp(self):
+        try:
+            return _file_stamp(self.path)
+        except OSError:
+            return None
+
+    def _read(self, stamp):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError("custom_overlays.json must contain an object")
+        except Exception as e:
+            self._bad_stamp = stamp
+            log_to_console(f"[CustomOverlays] custom_overlays.json sa nedá načítať ({e}), ponechávam posledný platný stav")
+            return None
+        return data
+
+    def reload_if_changed(self):
+        """Re-read the file if it changed on disk. Returns True if data was replaced."""
+        stamp = self._disk_stamp()
+        if stamp == self._stamp or stamp == self._bad_stamp:
+            return False
+        if stamp is None:
+            # súbor zmizol - ponecháme dáta v pamäti, pri ďalšom zápise sa vytvorí znova
+            self._stamp = None
+            return False
+        data = self._read(stamp)
+        if data is None:
+            return False
+        if self.dirty:
+            # neuložené zmeny v pamäti sa zlúčia s cudzou úpravou, zápis pošle výsledok
+            self.data = merge_overlays(self._base, self.data, data)
+        else:
+            self.data = copy.deepcopy(data)
+        self._base = data
+        self._stamp = stamp
+        self._bad_stamp = None
+        return True
+
+    def mark_dirty(self):
+        self.dirty = True
+        self._save_timer.start(STORE_SAVE_DELAY_MS)
+
+    def flush(self):
+        """Write pending changes now (no-op if nothing changed)."""
+        self._save_timer.stop()
+        if not self.dirty:
+            return
+        # súbor mohol medzitým zmeniť iný zapisovateľ (napr. overlay_manager) - zlúčiť
+        self.reload_if_changed()
+        if self._bad_stamp is not None and self._disk_stamp() == self._bad_stamp:
+            try:
+                os.replace(self.path, self.path + ".bad")
+            except Exception:
+                pass
+        try:
+            save_custom_overlays(self.module_name, self.data)
+        except Exception as e:
+            log_to_console(f"[CustomOverlays] Chyba pri ukladaní custom_overlays.json: {e}")
+            return
+        self.dirty = False
+        self._bad_stamp = None
+        self._base = copy.deepcopy(self.data)
+        self._stamp = self._disk_stamp()
+# ////-----------------------------------------------------------------------------------------
+
+# ////---- Zlučovanie úprav farieb pozadia (max. raz za snímku, uloženie po ustálení) ----////
+BG_APPLY_INTERVAL_MS = 16
+# ////-----------------------------------------------------------------------------------------
+
+# ////---- Cache načítaných widget modulov (cesta -> (mtime, veľkosť), modul) ----////
+_module_cache = {}
+_code_cache = {}
+cache_stats = {"hits": 0, "misses": 0}
+
+def _file_stamp(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+def get_widget_code(widget_name, widget_path):
+    # bytecode cez loader (využije a zapíše __pycache__), v pamäti podľa mtime
+    stamp = _file_stamp(widget_path)
+    cached = _code_cache.get(widget_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    loader = importlib.machinery.SourceFileLoader(widget_name, widget_path)
+    code = loader.get_code(widget_name)
+    _code_cache[widget_path] = (stamp, code)
+    return code
+
+def load_widget_module(widget_name, widget_path):
+    """Return the executed widget module, re-importing it only when the file changed."""
+    stamp = _file_stamp(widget_path)
+    cached = _module_cache.get(widget_path)
+    if cached is not None and cached[0] == stamp:
+        cache_stats["hits"] += 1
+        return cached[1]
+    cache_stats["misses"] += 1
+    spec = importlib.util.spec_from_file_location(widget_name, widget_path)
+    mod = importlib.util.module_from_spec(spec)
+    exec(get_widget_code(widget_name, widget_path), mod.__dict__)
+    _module_cache[widget_path] = (stamp, mod)
+    return mod
+
+def prewarm_widget_modules(module_name):
+    """Compile every widget of the module to bytecode up front (no widget code is executed)."""
+    for wname, file in _widget_files(module_name):
+        try:
+            get_widget_code(wname, file)
+        except Exception as e:
+            print(f"Widget {wname} for module {module_name} could not be compiled: {e}")
+# ////-----------------------------------------------------------------------------------------
+
+# ////---- Manifest widgetov (bez importovania widget kódu) ----////
+MANIFEST_VERSION = 1
+
+def get_manifest_path(module_name):
+    return os.path.join("modules", module_name, "data", "widgets_manifest.json")
+
+def _widget_files(module_name):
+    widgets_path = os.path.join("modules", module_name, "widgets")
+    files = sorted(glob.glob(os.path.join(widgets_path, "*.py"))) if os.path.isdir(widgets_path) else []
+    result = []
+    for file in files:
+        wname = os.path.splitext(os.path.basename(file))[0]
+        if wname.startswith("custom_overlays") or wname == "__init__":
+            continue
+        result.append((wname, file))
+    return result
+
+def _dir_stamp(files):
+    stamp = []
+    for wname, file in files:
+        try:
+            mtime_ns, size = _file_stamp(file)
+        except OSError:
+            continue
+        stamp.append([wname, mtime_ns, size])
+    return stamp
+
+def _literal(node):
+    # "Qt.LeftDockWidgetArea" -> "LeftDockWidgetArea", konštanty priamo
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    try:
+        return ast.literal_eval(node)
+    except Exception:
+        return None
+
+def scan_widget_source(widget_name, widget_path):
+    """Read what the overlay editor needs from a widget file using ast only."""
+    entry = {
+        "name": widget_name,
+        "file": os.path.basename(widget_path),
+        "entry_points": [],
+        "dock_position": None,
+        "default_size": {},
+        "config_files": []
+    }
+    try:
+        with open(widget_path, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), widget_path)
+    except Exception as e:
+        entry["error"] = str(e)
+        return entry
+
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name in ("create_widget", "get_widget_dock_position"):
+            entry["entry_points"].append(node.name)
+            if node.name == "get_widget_dock_position":
+                for ret in ast.walk(node):
+                    if isinstance(ret, ast.Return) and ret.value is not None:
+                        values = ret.value.elts if isinstance(ret.value, ast.Tuple) else [ret.value]
+                        area = _literal(values[0])
+                        order = _literal(values[1]) if len(values) > 1 else None
+                        entry["dock_position"] = {"area": area, "order": order}
+                        break
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Attribute):
+            continue
+        args = [_literal(a) for a in node.args]
+        if node.func.attr in ("setMinimumSize", "setMaximumSize") and len(args) == 2 and all(isinstance(a, int) for a in args):
+            key = "min" if node.func.attr == "setMinimumSize" else "max"
+            entry["default_size"].setdefault(key, args)
+        elif node.func.attr == "get_config_path" and args and isinstance(args[0], str):
+            if args[0] not in entry["config_files"]:
+                entry["config_files"].append(args[0])
+    return entry
+
+def load_widget_manifest(module_name):
+    """Return {widget_name: entry}. The manifest is regenerated only when a widget
+       file was added, removed or changed since it was written.
+    """
+    files = _widget_files(module_name)
+    stamp = _dir_stamp(files)
+    path = get_manifest_path(module_name)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") == MANIFEST_VERSION and manifest.get("stamp") == stamp:
+            return manifest.get("widgets", {})
+    except Exception:
+        pass
+
+    widgets = {wname: scan_widget_source(wname, file) for wname, file in files}
+    manifest = {"version": MANIFEST_VERSION, "stamp": stamp, "widgets": widgets}
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+    except Exception as e:
+        print(f"Widget manifest for module {module_name} could not be saved: {e}")
+    return widgets
+
+def manifest_dock_position(entry):
+    """Dock position from a manifest entry as Qt values, e.g. (Qt.LeftDockWidgetArea, 3)."""
+    pos = (entry or {}).get("dock_position") or {}
+    area = getattr(Qt, str(pos.get("area")), None)
+    if area is None:
+        return None
+    return area, pos.get("order")
 # ////-----------------------------------------------------------------------------------------
 
 # ////---- Načítanie widgetu podľa názvu ----////
-def load_widget(widget_name, BaseClass, module_name):
+def load_widget(widget_name, BaseClass, module_name, manifest=None):
     widget_path = os.path.join("modules", module_name, "widgets", f"{widget_name}.py")
     if not os.path.exists(widget_path):
         print(f"Widget {widget_name} for module {module_name} does not exist.")
         return None
 
-    spec = importlib.util.spec_from_file_location(widget_name, widget_path)
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
+    # manifest povie, či má zmysel modul vôbec spúšťať
+    entry = (manifest or {}).get(widget_name)
+    if entry is not None and "create_widget" not in entry.get("entry_points", []):
+        print(f"Widget {widget_name} for module {module_name} has no create_widget.")
+        return None
+
+    mod = load_widget_module(widget_name, widget_path)
 
     if hasattr(mod, "create_widget"):
         return mod.create_widget(BaseClass, module_name)
@@ -111,14 +421,14 @@ def load_widget(widget_name, BaseClass, module_name):
 # ////-----------------------------------------------------------------------------------------
 
 # ////---- Vytvorenie overlay okna ----////
-def build_overlay_window(name, params, BaseClass, module_name, parent_widget):
+def build_overlay_root(name, params, BaseClass, module_name, manifest=None):
     # create overlay root widget
     overlay_widget = QWidget()
     vbox = QVBoxLayout(overlay_widget)
     overlay_widget.setStyleSheet(f"background-color: {params.get('bg','rgba(0,0,0,0)')}; border: none;")
 
     for widget_name in params.get("widgets", []):
-        w = load_widget(widget_name, BaseClass, module_name)
+        w = load_widget(widget_name, BaseClass, module_name, manifest)
         if w:
             try:
                 w.setObjectName(widget_name)
@@ -131,6 +441,14 @@ def build_overlay_window(name, params, BaseClass, module_name, parent_widget):
                 pass
             vbox.addWidget(w)
 
+    # attach metadata so we can find it later
+    overlay_widget._overlay_name = name
+    overlay_widget._overlay_module = module_name
+    return overlay_widget
+
+def build_overlay_window(name, params, BaseClass, module_name, parent_widget, manifest=None):
+    overlay_widget = build_overlay_root(name, params, BaseClass, module_name, manifest)
+
     mgr = overlay_manager.start_overlay_manager()
     full_name = f"{module_name}:{name}"
     mgr.add_overlay(
@@ -147,10 +465,6 @@ def build_overlay_window(name, params, BaseClass, module_name, parent_widget):
         module_name=module_name
     )
 
-    # attach metadata so we can find it later
-    overlay_widget._overlay_name = name
-    overlay_widget._overlay_module = module_name
-
     win = mgr.overlays.get(full_name)
     if win is not None:
         win.user_visible = params.get("user_visible", True)
@@ -168,6 +482,116 @@ def build_overlay_window(name, params, BaseClass, module_name, parent_widget):
     return overlay_widget, full_name
     # ////-------------------------------------------------------------------------------------
 
+# ////---- Jedno celoobrazovkové okno pre všetky overlaye (režim "compositor") ----////
+class CompositorRegion(QWidget):
+    """One overlay inside the compositor window. In edit mode (F10) left drag moves
+    and right drag resizes it, like a standalone overlay window."""
+    def __init__(self, compositor, name, root):
+        super().__init__(compositor)
+        self.compositor = compositor
+        self.name = name
+        self._overlay_root = root  # rovnaký atribút ako okno z overlay_managera
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(root)
+        self._drag = None  # (tlačidlo, pozícia myši, pôvodná geometria)
+
+    def mousePressEvent(self, event):
+        if not self.compositor.editing:
+            return super().mousePressEvent(event)
+        pos = event.globalPosition().toPoint()
+        self._drag = (event.button(), pos, self.geometry())
+        self.raise_()
+
+    def mouseMoveEvent(self, event):
+        if self._drag is None:
+            return super().mouseMoveEvent(event)
+        button, start, geo = self._drag
+        delta = event.globalPosition().toPoint() - start
+        if button == Qt.LeftButton:
+            self.move(geo.topLeft() + delta)
+        elif button == Qt.RightButton:
+            self.resize(max(40, geo.width() + delta.x()), max(20, geo.height() + delta.y()))
+
+    def mouseReleaseEvent(self, event):
+        if self._drag is None:
+            return super().mouseReleaseEvent(event)
+        self._drag = None
+        self.compositor.region_moved(self)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.compositor.editing:
+            painter = QPainter(self)
+            painter.setPen(QPen(QColor(255, 255, 255, 160), 1, Qt.DashLine))
+            painter.drawRect(self.rect().adjusted(0, 0, -1, -1))
+            painter.end()
+
+
+class OverlayCompositor(QWidget):
+    """Frameless, translucent, click-through window over the whole virtual desktop.
+    Overlays are child regions of it, so the window system composites one surface and
+    Qt repaints only the dirty region rectangles in one synchronized paint pass."""
+    def __init__(self, on_region_moved):
+        super().__init__(None, Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool | Qt.WindowTransparentForInput)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setAttribute(Qt.WA_ShowWithoutActivating)
+        self.regions = {}  # overlay name -> CompositorRegion
+        self.editing = False
+        self.shown = True
+        self._on_region_moved = on_region_moved
+        self.fit_screens()
+
+    def fit_screens(self):
+        rect = QRect()
+        for screen in QGuiApplication.screens():
+            rect = rect.united(screen.geometry())
+        self.setGeometry(rect)
+
+    def add_region(self, name, root, params):
+        region = CompositorRegion(self, name, root)
+        origin = self.geometry().topLeft()
+        region.setGeometry(QRect(
+            QPoint(int(params.get("x", 100)), int(params.get("y", 100))) - origin,
+            QRect(0, 0, int(params.get("w", 400)), int(params.get("h", 200))).size()
+        ))
+        self.regions[name] = region
+        region.show()
+        self._update_visibility()
+        return region
+
+    def remove_region(self, name):
+        region = self.regions.pop(name, None)
+        if region is not None:
+            region.hide()
+            region.deleteLater()
+        self._update_visibility()
+
+    def region_moved(self, region):
+        # späť na globálne súradnice (tak ich ukladá aj overlay_manager)
+        geo = region.geometry().translated(self.geometry().topLeft())
+        self._on_region_moved(region.name, geo)
+
+    def set_editing(self, editing):
+        if editing == self.editing:
+            return
+        self.editing = editing
+        # v edit režime okno prijíma myš, inak je priehľadné pre vstup
+        self.setWindowFlag(Qt.WindowTransparentForInput, not editing)
+        for region in self.regions.values():
+            region.update()
+        self._update_visibility(force=True)
+
+    def set_shown(self, shown):
+        self.shown = shown
+        self._update_visibility()
+
+    def _update_visibility(self, force=False):
+        visible = self.shown and bool(self.regions)
+        if force or visible != self.isVisible():
+            self.setVisible(visible)
+# ////-----------------------------------------------------------------------------------------
+
 # ////---- Vytvorenie náhľadu farby pre RGBA spinboxy ----////
 def create_color_preview(spins, on_color_changed=None):
     preview = QLabel()
@@ -208,10 +632,8 @@ def create_widget(BaseClass, module_name):
             self.setWindowTitle("Vlastné Overlays (drag & drop)")
             self._suppress_widget_updates = False
 
-            # Bridge and handler datastore
-            self.bridge = get_bridge()
-            # maps normalized combo string -> handler callable
-            self._bridge_handlers = {}
+            # skratky overlayov v zdieľanom registri (spolu so stopkami)
+            self.shortcuts = get_registry()
             # maps overlay cname -> full_name in overlay_manager
             self._overlay_fullnames = {}
 
@@ -220,12 +642,10 @@ def create_widget(BaseClass, module_name):
 
             # banner
             try:
-                banner_path = os.path.join(os.path.dirname(__file__),
-                                           "../assets/banners/CUSTOM_OVERLAY.png" if is_dark_mode() else "../assets/banners/CUSTOM_OVERLAY_DARK.png")
-                if os.path.exists(banner_path):
+                pixmap = banner_pixmap("CUSTOM_OVERLAY", 32)
+                if pixmap is not None:
                     self.banner = QLabel()
-                    pixmap = QPixmap(banner_path)
-                    self.banner.setPixmap(pixmap.scaledToHeight(32, Qt.SmoothTransformation))
+                    self.banner.setPixmap(pixmap)
                     self.banner.setAlignment(Qt.AlignCenter)
                     layout.addWidget(self.banner)
             except Exception:
@@ -252,12 +672,11 @@ def create_widget(BaseClass, module_name):
             self.widget_list.setSelectionMode(QListWidget.SingleSelection)
             layout.addWidget(self.widget_list)
 
+            # zoznam widgetov z manifestu - bez spúšťania widget kódu
             self.widget_bg_spins = {}
-            widgets_path = os.path.join("modules", module_name, "widgets")
-            files = sorted(glob.glob(os.path.join(widgets_path, "*.py"))) if os.path.isdir(widgets_path) else []
-            for file in files:
-                wname = os.path.splitext(os.path.basename(file))[0]
-                if wname.startswith("custom_overlays") or wname == "__init__":
+            self.widget_manifest = load_widget_manifest(module_name)
+            for wname, entry in self.widget_manifest.items():
+                if "create_widget" not in entry.get("entry_points", []):
                     continue
                 item = QListWidgetItem(wname)
                 flags = Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsUserCheckable | Qt.ItemIsDragEnabled
@@ -312,6 +731,13 @@ def create_widget(BaseClass, module_name):
 
             layout.addWidget(QLabel("Game must be borderless windowed for overlays to work properly!"))
 
+            # režim jedného okna pre všetky overlaye
+            self.overlay_settings = load_overlay_settings(module_name)
+            self.compositor_check = QCheckBox("Draw all overlays in one window (compositor)")
+            self.compositor_check.setChecked(bool(self.overlay_settings.get("compositor", False)))
+            self.compositor_check.toggled.connect(self._set_compositor_mode)
+            layout.addWidget(self.compositor_check)
+
             btn_create = QPushButton("Create new overlay")
             btn_create.clicked.connect(self.create_overlay)
             layout.addWidget(btn_create)
@@ -328,13 +754,35 @@ def create_widget(BaseClass, module_name):
             layout.addWidget(QLabel("Edit mode: left mouse drag to move, right mouse drag to resize"))
 
             self.selected_overlay = None
-            self.custom_overlays = load_custom_overlays(module_name)
-
-            # build existing overlays and remember fullnames
-            mgr = overlay_manager.start_overlay_manager()
-            for cname, params in self.custom_overlays.items():
-                overlay_root, full_name = build_overlay_window(cname, params, BaseClass, module_name, self)
-                self._overlay_fullnames[cname] = full_name
+            self.store = OverlayStore(module_name)
+            self._shortcut_bindings = {}  # cname -> (combo, Binding)
+            self._logged_conflicts = set()  # dvojice mien skratiek, ktorých kolízia už bola zapísaná
+            self._compositor = None
+            if self.overlay_settings.get("compositor", False):
+                self._start_compositor()
+
+            # overlaye sa stavajú lenivo: skryté až pri prvom zobrazení, viditeľné
+            # po jednom v ďalších iteráciách event loopu, aby sa hlavné okno ukázalo hneď
+            prewarm_widget_modules(module_name)
+            self._pending_builds = deque(
+                cname for cname, params in self.custom_overlays.items() if params.get("user_visible", True)
+            )
+            self._build_stats = {
+                "started": time.perf_counter(),
+                "built": 0,
+                "hits": cache_stats["hits"],
+                "misses": cache_stats["misses"]
+            }
+            self._build_timer = QTimer(self)
+            self._build_timer.setSingleShot(True)
+            self._build_timer.timeout.connect(self._build_next_overlay)
+            self._build_timer.start(0)
+
+            # úpravy farieb: (cname, widget alebo None) -> posledná rgba hodnota
+            self._pending_bgs = {}
+            self._bg_apply_timer = QTimer(self)
+            self._bg_apply_timer.setSingleShot(True)
+            self._bg_apply_timer.timeout.connect(self._apply_pending_bgs)
 
             # register shortcuts based on JSON
             self._register_shortcuts()
@@ -342,72 +790,253 @@ def create_widget(BaseClass, module_name):
             # populate UI list
             self.refresh_overlay_list()
 
-        # ----- Shortcut management -----
-        def _normalize_combo(self, combo: str) -> str:
-            if not combo:
-                return ""
-            return combo.replace(" ", "").lower()
-
-        def _register_shortcuts(self):
-            # unregister old handlers
+        @property
+        def custom_overlays(self):
+            return self.store.data
+
+        # ----- Lazy overlay construction -----
+        def _build_next_overlay(self):
+            # jeden overlay na iteráciu event loopu
+            while self._pending_builds:
+                cname = self._pending_builds.popleft()
+                if self._ensure_overlay_built(cname):
+                    self._build_stats["built"] += 1
+                    break
+            if self._pending_builds:
+                self._build_timer.start(0)
+                return
+            stats = self._build_stats
+            log_to_console((
+                f"[CustomOverlays] {stats['built']} of {len(self.custom_overlays)} overlays built in "
+                f"{(time.perf_counter() - stats['started']) * 1000:.1f} ms "
+                f"(widget modules: {cache_stats['misses'] - stats['misses']} imported, "
+                f"{cache_stats['hits'] - stats['hits']} reused from cache)"
+            ))
+
+        def _ensure_overlay_built(self, cname):
+            """Build the overlay window if it doesn't exist yet. Returns True if it was built."""
+            params = self.custom_overlays.get(cname)
+            if params is None or self._overlay_built(cname):
+                return False
             try:
-                for combo_norm, handler in list(self._bridge_handlers.items()):
-                    try:
-                        self.bridge.off(f"shortcut.{combo_norm}", handler)
-                    except Exception:
-                        pass
-            except Exception:
+                self._pending_builds.remove(cname)
+            except ValueError:
                 pass
-            self._bridge_handlers.clear()
+            if self._compositor is not None:
+                root = build_overlay_root(cname, params, BaseClass, self.module_name, self.widget_manifest)
+                self._compositor.add_region(cname, root, params)
+                self._overlay_fullnames[cname] = f"{self.module_name}:{cname}"
+                return True
+            overlay_root, fullname = build_overlay_window(cname, params, BaseClass, self.module_name, self, self.widget_manifest)
+            self._overlay_fullnames[cname] = fullname
+            return True
+
+        def _overlay_built(self, cname):
+            if self._compositor is not None:
+                return cname in self._compositor.regions
+            mgr = overlay_manager.start_overlay_manager()
+            return f"{self.module_name}:{cname}" in mgr.overlays
 
-            # read fresh from JSON (self.custom_overlays should already be current but read to be safe)
-            overlays_cfg = load_custom_overlays(self.module_name)
-            self.custom_overlays = overlays_cfg
+        def _overlay_container(self, cname):
+            """Widget holding the overlay's widgets: compositor region or overlay window."""
+            if self._compositor is not None:
+                return self._compositor.regions.get(cname)
+            mgr = overlay_manager.start_overlay_manager()
+            return mgr.overlays.get(f"{self.module_name}:{cname}")
 
-            for cname, params in overlays_cfg.items():
-                combo = params.get("shortcut", "")
-                combo_norm = self._normalize_combo(combo)
-                if not combo_norm:
-                    continue
-                # create zero-arg handler that toggles the specific overlay
-                def make_handler(fullname):
-                    return lambda: self._on_shortcut_for_overlay(fullname)
-                full_name = f"{self.module_name}:{cname}"
-                handler = make_handler(full_name)
-                event_name = f"shortcut.{combo_norm}"
+        def _destroy_overlay_window(self, cname):
+            """Close all widgets of the overlay and remove its window (no live widgets/timers remain)."""
+            try:
+                self._pending_builds.remove(cname)
+            except ValueError:
+                pass
+            mgr = overlay_manager.start_overlay_manager()
+            full_name = f"{self.module_name}:{cname}"
+
+            # cleanup – ak overlay existuje, odregistrovať všetky child widgety
+            win = self._overlay_container(cname)
+            if win is not None:
                 try:
-                    self.bridge.on(event_name, handler)
-                    self._bridge_handlers[combo_norm] = handler
+                    # prechádzame všetky widgety v overlayi
+                    for child in win.findChildren(QWidget):
+                        # ak má cleanup/close_widget, zavoláme ju
+                        if hasattr(child, "close_widget") and callable(child.close_widget):
+                            try:
+                                child.close_widget()
+                            except Exception:
+                                pass
+                        elif hasattr(child, "cleanup") and callable(child.cleanup):
+                            try:
+                                child.cleanup()
+                            except Exception:
+                                pass
                 except Exception:
                     pass
 
-        def _on_shortcut_for_overlay(self, full_name: str):
-            """Called in main thread by QtBridge when a shortcut is triggered."""
+                # nakoniec odstráň overlay
+                if self._compositor is not None:
+                    self._compositor.remove_region(cname)
+                else:
+                    mgr.remove_overlay(full_name)
+
+            # vyčisti mapovanie
+            if cname in self._overlay_fullnames:
+                del self._overlay_fullnames[cname]
+
+        def _set_overlay_visible(self, cname, visible):
+            """Show (building it on first show) or hide (tearing it down) one overlay."""
             mgr = overlay_manager.start_overlay_manager()
+            full_name = f"{self.module_name}:{cname}"
+            if not visible:
+                self._destroy_overlay_window(cname)
+                return
+            self._ensure_overlay_built(cname)
+            if self._compositor is not None:
+                return
             win = mgr.overlays.get(full_name)
             if win is None:
-                # overlay not present (maybe deleted) - nothing to do
                 return
-            new_state = not getattr(win, 'user_visible', True)
-            win.user_visible = new_state
+            win.user_visible = True
             try:
-                win.set_overlay_visible(new_state and mgr.global_show)
+                win.set_overlay_visible(mgr.global_show)
             except Exception:
                 try:
-                    win.setVisible(new_state and mgr.global_show)
+                    win.setVisible(mgr.global_show)
                 except Exception:
                     pass
-            # update JSON persistently
+
+        # ----- Compositor mode -----
+        def _start_compositor(self):
+            self._compositor = OverlayCompositor(self._on_region_moved)
+            # F9/F10 spracúva overlay_manager; kompozítor sa len zosynchronizuje s jeho stavom
+            binding = self.shortcuts.register("f9", lambda: QTimer.singleShot(0, self._sync_compositor), owner=self._compositor,
+                                              name="custom_overlays:compositor/show_all")
+            self._log_conflicts(binding, "compositor")
+            binding = self.shortcuts.register("f10", self._on_compositor_edit_key, owner=self._compositor,
+                                              name="custom_overlays:compositor/edit_mode")
+            self._log_conflicts(binding, "compositor")
+            self._sync_compositor()
+
+        def _stop_compositor(self):
+            compositor, self._compositor = self._compositor, None
+            if compositor is None:
+                return
+            self.shortcuts.unregister_owner(compositor)
+            compositor.close()
+            compositor.deleteLater()
+
+        def _sync_compositor(self):
+            if self._compositor is None:
+                return
+            mgr = overlay_manager.start_overlay_manager()
+            self._compositor.set_shown(bool(getattr(mgr, "global_show", True)))
+            editing = getattr(mgr, "edit_mode", None)
+            if editing is not None:
+                self._compositor.set_editing(bool(editing))
+
+        def _on_compositor_edit_key(self):
+            if self._compositor is None:
+                return
+            mgr = overlay_manager.start_overlay_manager()
+            if getattr(mgr, "edit_mode", None) is None:
+                # manager stav nevystavuje - prepíname sami
+                self._compositor.set_editing(not self._compositor.editing)
+            else:
+                QTimer.singleShot(0, self._sync_compositor)
+
+        def _on_region_moved(self, cname, geo):
+            self.store.reload_if_changed()
+            params = self.custom_overlays.get(cname)
+            if params is None:
+                return
+            params.update({"x": geo.x(), "y": geo.y(), "w": geo.width(), "h": geo.height()})
+            self.store.mark_dirty()
+
+        def _set_compositor_mode(self, enabled):
+            enabled = bool(enabled)
+            if enabled == (self._compositor is not None):
+                return
+            # postavené overlaye sa zrušia a znova postavia v novom režime
+            built = [cname for cname in self.custom_overlays if self._overlay_built(cname)]
+            for cname in built:
+                self._destroy_overlay_window(cname)
+            if enabled:
+                self._start_compositor()
+            else:
+                self._stop_compositor()
+            self.overlay_settings["compositor"] = enabled
+            save_overlay_settings(self.module_name, self.overlay_settings)
+            self._pending_builds.extend(built)
+            self._build_stats = {
+                "started": time.perf_counter(),
+                "built": 0,
+                "hits": cache_stats["hits"],
+                "misses": cache_stats["misses"]
+            }
+            self._build_timer.start(0)
+
+        # ----- Shortcut management -----
+        def _register_shortcuts(self):
+            """Sync overlay shortcuts into the shared registry; only added, removed or
+               changed ones touch it (unchanged bindings keep a pending key sequence).
+            """
+            # pick up external edits of the JSON (store is authoritative otherwise)
+            self.store.reload_if_changed()
+
+            wanted = {}
+            for cname, params in self.custom_overlays.items():
+                combo = params.get("shortcut", "") if isinstance(params, dict) else ""
+                if combo:
+                    wanted[cname] = combo
+
+            # unregister removed/changed
+            for cname, (combo, binding) in list(self._shortcut_bindings.items()):
+                if wanted.get(cname) == combo:
+                    continue
+                self.shortcuts.unregister(binding)
+                del self._shortcut_bindings[cname]
+
+            # register new
+            for cname, combo in wanted.items():
+                if cname in self._shortcut_bindings:
+                    continue
+                # create zero-arg handler that toggles the specific overlay
+                def make_handler(fullname):
+                    return lambda: self._on_shortcut_for_overlay(fullname)
+                full_name = f"{self.module_name}:{cname}"
+                binding = self.shortcuts.register(
+                    combo, make_handler(full_name), owner=self,
+                    name=f"custom_overlays:{full_name}"
+                )
+                self._shortcut_bindings[cname] = (combo, binding)
+                self._log_conflicts(binding, cname)
+
+        def _log_conflicts(self, binding, label):
+            # kolízia sa zapíše len raz, nie pri každom zobrazení alebo uložení
+            if binding is None or not binding.conflicts:
+                return
+            new_others = set()
+            for other in binding.conflicts:
+                pair = frozenset((binding.name, other.name))
+                if pair not in self._logged_conflicts:
+                    self._logged_conflicts.add(pair)
+                    new_others.add(other.name)
+            if new_others:
+                others = ", ".join(sorted(new_others))
+                log_to_console(f"[CustomOverlays] Skratka {format_sequence(binding.sequence)} ({label}) koliduje s: {others}")
+
+        def _on_shortcut_for_overlay(self, full_name: str):
+            """Called in main thread by QtBridge when a shortcut is triggered."""
             module_name, cname = full_name.split(":", 1)
-            try:
-                cfg = load_custom_overlays(module_name)
-                if cname in cfg:
-                    cfg[cname]['user_visible'] = new_state
-                    save_custom_overlays(module_name, cfg)
-                    # update in-memory copy
-                    self.custom_overlays = cfg
-            except Exception:
-                pass
+            # cudzia úprava súboru sa prevezme pred zmenou (inak by ju zápis prepísal)
+            self.store.reload_if_changed()
+            if cname not in self.custom_overlays:
+                # overlay not present (maybe deleted) - nothing to do
+                return
+            new_state = not self.custom_overlays[cname].get('user_visible', True)
+            self.custom_overlays[cname]['user_visible'] = new_state
+            self._set_overlay_visible(cname, new_state)
+            self.store.mark_dirty()
             # refresh UI
             self.refresh_overlay_list()
 
@@ -434,10 +1063,11 @@ def create_widget(BaseClass, module_name):
                     self.shortcut_field.setText(shortcut)
                     # uloz do JSON a re-register
                     if self.selected_overlay:
+                        self.store.reload_if_changed()
                         if self.selected_overlay not in self.custom_overlays:
                             self.custom_overlays[self.selected_overlay] = get_default_overlay_params()
                         self.custom_overlays[self.selected_overlay]["shortcut"] = shortcut
-                        save_custom_overlays(self.module_name, self.custom_overlays)
+                        self.store.mark_dirty()
                         # re-register all shortcuts so change is immediate
                         self._register_shortcuts()
                         # aktualizuj UI
@@ -504,7 +1134,6 @@ def create_widget(BaseClass, module_name):
         def refresh_overlay_list(self):
             self.overlay_list.clear()
             mgr = overlay_manager.start_overlay_manager()
-            self.custom_overlays = load_custom_overlays(self.module_name)
             for cname, params in self.custom_overlays.items():
                 name = f"{self.module_name}:{cname}"
                 if name in mgr.overlays:
@@ -529,21 +1158,24 @@ def create_widget(BaseClass, module_name):
             if not widgets:
                 QMessageBox.warning(self, "Error", "Select at least one widget!")
                 return
+            self.store.reload_if_changed()
             params = get_default_overlay_params()
             params['widgets'] = widgets
+            # veľkosť podľa minimálnych rozmerov widgetov z manifestu
+            min_sizes = [self.widget_manifest.get(w, {}).get("default_size", {}).get("min") for w in widgets]
+            min_sizes = [m for m in min_sizes if m]
+            if min_sizes:
+                params['w'] = max(params['w'], max(m[0] for m in min_sizes) + 20)
+                params['h'] = max(params['h'], sum(m[1] for m in min_sizes) + 20)
             params['bg'] = self.get_overlay_bg()
             params['widget_bgs'] = {w: self.get_widget_bg(w) for w in widgets}
             params['user_visible'] = True
             params['shortcut'] = self.shortcut_field.text()
             self.custom_overlays[name] = params
-            save_custom_overlays(self.module_name, self.custom_overlays)
+            self.store.mark_dirty()
             self.refresh_overlay_list()
-            # Pridaj overlay len ak ešte nie je v manageri
-            mgr = overlay_manager.start_overlay_manager()
-            full_name = f"{self.module_name}:{name}"
-            if full_name not in mgr.overlays:
-                overlay_root, fullname = build_overlay_window(name, params, BaseClass, self.module_name, self)
-                self._overlay_fullnames[name] = fullname
+            # Pridaj overlay len ak ešte nie je postavený
+            self._ensure_overlay_built(name)
             # re-register shortcuts because new overlay might have shortcut
             self._register_shortcuts()
 
@@ -560,41 +1192,14 @@ def create_widget(BaseClass, module_name):
                 return
 
             # odstráň z konfigurácie
+            self.store.reload_if_changed()
             if self.selected_overlay in self.custom_overlays:
                 del self.custom_overlays[self.selected_overlay]
-                save_custom_overlays(self.module_name, self.custom_overlays)
-
-            mgr = overlay_manager.start_overlay_manager()
-            full_name = f"{self.module_name}:{self.selected_overlay}"
+                self.store.mark_dirty()
 
-            # cleanup – ak overlay existuje, odregistrovať všetky child widgety
-            if full_name in mgr.overlays:
-                win = mgr.overlays[full_name]
-                try:
-                    # prechádzame všetky widgety v overlayi
-                    for child in win.findChildren(QWidget):
-                        # ak má cleanup/close_widget, zavoláme ju
-                        if hasattr(child, "close_widget") and callable(child.close_widget):
-                            try:
-                                child.close_widget()
-                            except Exception:
-                                pass
-                        elif hasattr(child, "cleanup") and callable(child.cleanup):
-                            try:
-                                child.cleanup()
-                            except Exception:
-                                pass
-                except Exception:
-                    pass
+            self._destroy_overlay_window(self.selected_overlay)
 
-                # nakoniec odstráň overlay
-                mgr.remove_overlay(full_name)
-
-            # vyčisti mapovanie
-            if self.selected_overlay in self._overlay_fullnames:
-                del self._overlay_fullnames[self.selected_overlay]
-
-            # odregistrovať všetky skratky z bridge
+            # preregistrovať skratky v registri
             self._register_shortcuts()
 
             # obnoviť UI
@@ -605,20 +1210,12 @@ def create_widget(BaseClass, module_name):
             if not items:
                 return
             cname = items[0].data(Qt.UserRole)
-            mgr = overlay_manager.start_overlay_manager()
-            full_name = f"{self.module_name}:{cname}"
-            if full_name in mgr.overlays:
-                win = mgr.overlays[full_name]
-                new_state = not getattr(win, 'user_visible', True)
-                win.user_visible = new_state
-                try:
-                    win.set_overlay_visible(new_state and mgr.global_show)
-                except Exception:
-                    win.setVisible(new_state and mgr.global_show)
-            self.custom_overlays = load_custom_overlays(self.module_name)
+            self.store.reload_if_changed()
             if cname in self.custom_overlays:
-                self.custom_overlays[cname]['user_visible'] = not self.custom_overlays[cname].get('user_visible', True)
-                save_custom_overlays(self.module_name, self.custom_overlays)
+                new_state = not self.custom_overlays[cname].get('user_visible', True)
+                self.custom_overlays[cname]['user_visible'] = new_state
+                self.store.mark_dirty()
+                self._set_overlay_visible(cname, new_state)
             self.refresh_overlay_list()
 
         def update_widget_bg(self, widget_name):
@@ -626,6 +1223,7 @@ def create_widget(BaseClass, module_name):
                 return
             if not self.selected_overlay:
                 return
+            self.store.reload_if_changed()
             params = self.custom_overlays.get(self.selected_overlay)
             if params is None:
                 params = get_default_overlay_params()
@@ -634,24 +1232,8 @@ def create_widget(BaseClass, module_name):
             if 'widget_bgs' not in params:
                 params['widget_bgs'] = {}
             params['widget_bgs'][widget_name] = rgba
-            save_custom_overlays(self.module_name, self.custom_overlays)
-            mgr = overlay_manager.start_overlay_manager()
-            full_name = f"{self.module_name}:{self.selected_overlay}"
-            if full_name in mgr.overlays:
-                win = mgr.overlays[full_name]
-                try:
-                    child = win.findChild(QWidget, widget_name)
-                    if child is not None:
-                        child.setStyleSheet(f"background-color: {rgba}; border: none;")
-                except Exception:
-                    try:
-                        for child in win.findChildren(QWidget):
-                            if child.objectName() == widget_name:
-                                child.setStyleSheet(f"background-color: {rgba}; border: none;")
-                                break
-                    except Exception:
-                        pass
-        
+            self._queue_bg(self.selected_overlay, widget_name, rgba)
+
         def update_overlay_bg(self, _val=None):
             if self._suppress_widget_updates:
                 return
@@ -665,75 +1247,83 @@ def create_widget(BaseClass, module_name):
                 rgba_str = f"rgba({r},{g},{b},{a})"
             else:
                 rgba_str = f"rgba({r},{g},{b},{round(a/255.0, 3)})"
+            self.store.reload_if_changed()
             params = self.custom_overlays.get(self.selected_overlay)
             if params is None:
                 params = get_default_overlay_params()
                 self.custom_overlays[self.selected_overlay] = params
             params['bg'] = rgba_str
-            save_custom_overlays(self.module_name, self.custom_overlays)
-            mgr = overlay_manager.start_overlay_manager()
-            full_name = f"{self.module_name}:{self.selected_overlay}"
-            if full_name in mgr.overlays:
-                win = mgr.overlays[full_name]
-                try:
-                    win.params['bg'] = rgba_str
-                except Exception:
+            self._queue_bg(self.selected_overlay, None, rgba_str)
+
+        def _queue_bg(self, cname, widget_name, rgba):
+            # drží sa len posledná farba; aplikuje sa najviac raz za snímku
+            self._pending_bgs[(cname, widget_name)] = rgba
+            if not self._bg_apply_timer.isActive():
+                self._bg_apply_timer.start(BG_APPLY_INTERVAL_MS)
+            # uloženie až keď sa úprava ustáli
+            self.store.mark_dirty()
+
+        def _apply_pending_bgs(self):
+            pending, self._pending_bgs = self._pending_bgs, {}
+            for (cname, widget_name), rgba in pending.items():
+                win = self._overlay_container(cname)
+                if win is None:
+                    # overlay ešte nie je postavený - farba sa použije pri stavbe z params
+                    continue
+                style = f"background-color: {rgba}; border: none;"
+                if widget_name is not None:
                     try:
-                        win.params = dict(win.params or {})
-                        win.params['bg'] = rgba_str
+                        child = win.findChild(QWidget, widget_name)
+                        if child is not None and child.styleSheet() != style:
+                            child.setStyleSheet(style)
                     except Exception:
                         pass
-                root = getattr(win, "_overlay_root", None)
-                if root is not None:
+                    continue
+                if self._compositor is None:
                     try:
-                        root.setStyleSheet(f"background-color: {rgba_str}; border: none;")
+                        win.params['bg'] = rgba
                     except Exception:
                         try:
-                            root.setStyleSheet(f"background-color: {rgba_str}; border: none;")
+                            win.params = dict(win.params or {})
+                            win.params['bg'] = rgba
                         except Exception:
                             pass
+                # len koreň overlayu - štýl okna by sa kaskádovo prepočítal na všetky deti
+                target = getattr(win, "_overlay_root", None) or win
                 try:
-                    win.setStyleSheet(f"background-color: {rgba_str}; border: none;")
+                    if target.styleSheet() != style:
+                        target.setStyleSheet(style)
                 except Exception:
-                    try:
-                        win.setStyleSheet(f"background-color: {rgba_str}; border: none;")
-                    except Exception:
-                        pass
+                    pass
 
         def handle_overlay_shortcut(self, overlay_widget, params, combo):
             # kept for backwards compatibility if other code calls directly
             shortcut = params.get("shortcut", "").lower().strip()
             if combo.lower() == shortcut:
                 cname = overlay_widget._overlay_name
-                mgr = overlay_manager.start_overlay_manager()
-                full_name = f"{self.module_name}:{cname}"
-
-                if full_name in mgr.overlays:
-                    win = mgr.overlays[full_name]
-                    new_state = not getattr(win, "user_visible", True)
-                    win.user_visible = new_state
-                    try:
-                        win.set_overlay_visible(new_state and mgr.global_show)
-                    except Exception:
-                        win.setVisible(new_state and mgr.global_show)
+                self.store.reload_if_changed()
 
                 if cname in self.custom_overlays:
-                    self.custom_overlays[cname]['user_visible'] = not self.custom_overlays[cname].get('user_visible', True)
-                    save_custom_overlays(self.module_name, self.custom_overlays)
+                    new_state = not self.custom_overlays[cname].get('user_visible', True)
+                    self.custom_overlays[cname]['user_visible'] = new_state
+                    self.store.mark_dirty()
+                    self._set_overlay_visible(cname, new_state)
 
                 self.refresh_overlay_list()
 
         def close_widget(self):
-            # cleanup handlers
-            try:
-                for combo_norm, handler in list(self._bridge_handlers.items()):
-                    try:
-                        self.bridge.off(f"shortcut.{combo_norm}", handler)
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-            self._bridge_handlers.clear()
+            self._build_timer.stop()
+            self._pending_builds.clear()
+            self._bg_apply_timer.stop()
+            self._pending_bgs.clear()
+            if self._compositor is not None:
+                for cname in list(self._compositor.regions):
+                    self._destroy_overlay_window(cname)
+                self._stop_compositor()
+            self.store.flush()
+            # cleanup shortcut bindings
+            self.shortcuts.unregister_owner(self)
+            self._shortcut_bindings.clear()
 
         def showEvent(self, event):
             super().showEvent(event)
@@ -1,18 +1,31 @@
 import os
+import sys
 import json
-import configparser
+import time
 from datetime import datetime
-from PySide6.QtWidgets import QVBoxLayout, QLabel
-from PySide6.QtCore import QTimer, Qt
+from PySide6.QtWidgets import QVBoxLayout
+from PySide6.QtCore import QTimer, Qt, QObject, Signal
 from PySide6.QtGui import QFont
 
-# ////---- Default config for game_clock.json ----////
-DEFAULT_CONFIG = {
-    "font_family": "Arial",
-    "font_size": 32,
-    "font_color": "#ff8000",
-    "simulate_seconds": 120  # max počet sekúnd simulácie po update z INI
-}
+# ////---- Zdieľané pomocné moduly (python/customclock) ----////
+PYTHON_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "python")
+if PYTHON_DIR not in sys.path:
+    sys.path.append(PYTHON_DIR)
+from customclock.models import acquire_model, release_model, set_view_visible
+from customclock.lifecycle import VisibilityLifecycle
+from customclock.digits import DigitDisplay
+from customclock.filewatch import get_hub, parse_ini
+from customclock.schema import Schema, Field, at_least, is_color
+from customclock import perf
+
+# ////---- Schéma game_clock.json (typy, kontroly, predvolené hodnoty) ----////
+CONFIG_SCHEMA = Schema("GameClockConfig", [
+    Field("font_family", "Arial"),
+    Field("font_size", 32, at_least(1)),
+    Field("font_color", "#ff8000", is_color),
+    Field("simulate_seconds", 120, at_least(0))  # max počet sekúnd simulácie po update z INI
+])
+STYLE_FIELDS = frozenset({"font_family", "font_size", "font_color"})
 
 def ensure_dir(path):
     try:
@@ -20,8 +33,198 @@ def ensure_dir(path):
     except Exception:
         pass
 
+# ////---- Zdieľaný model herného času (jeden pre všetky inštancie widgetu) ----////
+class GameClockModel(QObject):
+    """Gets game_clock.json and data.ini from the file-watch hub and simulates the game
+    time once per second. Views only listen to style_changed/time_changed and render."""
+    style_changed = Signal()
+    time_changed = Signal()
+
+    def __init__(self, config_path, data_path):
+        super().__init__()
+        self._config_path = config_path
+        self._data_path = data_path
+
+        # interné stavy
+        self._data_updated = False  # hub priniesol nový čas z data.ini (spracuje ďalší tick)
+        self._time_float = 0.0
+        self._time_speed = 1.0
+        self._simulate_seconds = CONFIG_SCHEMA.default().simulate_seconds
+        self._simulated_seconds_count = 0
+        self._last_loaded_time_float = None
+        self._last_loaded_time_speed = None
+        self._time_disabled = False  # ak je True, hodiny sa neaktualizujú
+        self._suspended_at = None  # monotonic čas pozastavenia (všetky pohľady skryté)
+
+        # stav pre pohľady
+        self.config = None  # GameClockConfig (nemenný, vymení sa celý pri zmene súboru)
+        self.text = "00:00:00"
+
+        # ensure config exists
+        self._ensure_config()
+
+        # config aj data.ini posiela spoločný hub pri zmene - tick už nič nestat-uje
+        self._hub = get_hub()
+        self._apply_config(self._hub.subscribe(self._config_path, self._on_config_changed))
+
+        # timer
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.update)
+        self.timer.start(1000)
+
+        # prvé načítanie
+        self._data_subscribed = False
+        self._subscribe_data()
+
+    # ////---- Config helpers ----////
+    def _ensure_config(self):
+        cfg_dir = os.path.dirname(self._config_path)
+        ensure_dir(cfg_dir)
+        if not os.path.exists(self._config_path):
+            try:
+                with open(self._config_path, "w", encoding="utf-8") as f:
+                    json.dump(CONFIG_SCHEMA.defaults(), f, indent=2)
+            except Exception:
+                pass
+
+    def _on_config_changed(self, _path, user_cfg):
+        self._apply_config(user_cfg)
+
+    def _apply_config(self, user_cfg):
+        # aplikuje sa len to, čo sa oproti predchádzajúcej verzii zmenilo
+        cfg = CONFIG_SCHEMA.load(user_cfg, "game_clock.json")
+        changed = cfg.changed(self.config)
+        self.config = cfg
+        if "simulate_seconds" in changed:
+            self._simulate_seconds = cfg.simulate_seconds
+        if changed & STYLE_FIELDS:
+            self.style_changed.emit()
+
+    # ////---- Data helpers ----////
+    def _subscribe_data(self):
+        # Odber data.ini; vracia True, ak aktuálny obsah priniesol nový čas alebo speed.
+        if self._data_subscribed:
+            return False
+        self._data_subscribed = True
+        return self._apply_data(self._hub.subscribe(self._data_path, self._on_data_changed, parse_ini))
+
+    def _unsubscribe_data(self):
+        if self._data_subscribed:
+            self._data_subscribed = False
+            self._hub.unsubscribe(self._data_path, self._on_data_changed)
+
+    def _on_data_changed(self, _path, cfg):
+        if self._apply_data(cfg):
+            self._data_updated = True
+
+    def _apply_data(self, cfg):
+        # Prevezme čas a speed zo sparsovaného INI. Vracia True, ak sa zmenil čas alebo speed.
+        if cfg is None:
+            return False
+        try:
+            updated = False
+
+            if "Time" in cfg:
+                # Detekcia hodnoty None (ignorovanie simulácie)
+                time_str = cfg["Time"].get("time_of_day", "None")
+                if time_str.strip().lower() == "none":
+                    # skry hodiny
+                    self.text = ""
+                    self._time_disabled = True
+                    self.time_changed.emit()
+                    return False
+                else:
+                    self._time_disabled = False
+
+                new_time = float(cfg["Time"].get("time_of_day", "0"))
+                new_speed = float(cfg["Time"].get("time_speed", "1.0"))
+
+                # Reset simulácie len ak sa zmenila hodnota s toleranciou pre float
+                if (self._last_loaded_time_float is None or
+                    abs(new_time - self._last_loaded_time_float) > 0.001 or
+                    self._last_loaded_time_speed is None or
+                    abs(new_speed - self._last_loaded_time_speed) > 0.001):
+
+                    self._time_float = new_time
+                    self._time_speed = new_speed
+                    self._simulated_seconds_count = 0
+                    updated = True
+
+                self._last_loaded_time_float = new_time
+                self._last_loaded_time_speed = new_speed
+
+            if "Time_Simulation" in cfg:
+                self._simulate_seconds = int(cfg["Time_Simulation"].get("Second", self._simulate_seconds))
+
+            return updated
+        except Exception:
+            return False
+
+    # ////---- Tick každú sekundu ----////
+    def update(self):
+        perf.count("wakeup.game_clock")
+        started = perf.now()
+        self._tick()
+        perf.add_time("game_clock.update", perf.now() - started)
+
+    def _tick(self):
+        updated, self._data_updated = self._data_updated, False
+        self._advance(1, updated)
+
+    def _advance(self, steps, updated):
+        # Ak sú hodiny vypnuté, nesimuluj a nerenderuj
+        if self._time_disabled:
+            return
+
+        # Reset simulácie sa deje len ak prišiel update z INI
+        if updated:
+            self._simulated_seconds_count = 0
+
+        # simulácia iba ak nepresiahla max počet sekúnd
+        steps = min(steps, self._simulate_seconds - self._simulated_seconds_count)
+        if steps > 0:
+            self._time_float += (steps / 3600.0) * self._time_speed
+            self._time_float %= 24
+            self._simulated_seconds_count += steps
+
+        # update UI vždy ak nie je hodnota None
+        hours = int(self._time_float)
+        minutes = int((self._time_float - hours) * 60)
+        seconds = int((((self._time_float - hours) * 60) - minutes) * 60)
+        self.text = f"{hours:02}:{minutes:02}:{seconds:02}"
+        self.time_changed.emit()
+
+    # ////---- Pozastavenie, keď nie je viditeľný žiadny pohľad ----////
+    def suspend(self):
+        # skryté hodiny nečítajú ani data.ini (logic.py ho prepisuje každú sekundu)
+        self.timer.stop()
+        self._unsubscribe_data()
+        self._suspended_at = time.monotonic()
+
+    def resume(self):
+        # jeden krok: čerstvá vzorka z data.ini + simulácia za čas, ktorý medzitým ubehol
+        updated = self._subscribe_data()
+        updated, self._data_updated = updated or self._data_updated, False
+        data_mtime = self._hub.mtime(self._data_path)
+        if updated and data_mtime:
+            elapsed = time.time() - data_mtime
+        else:
+            elapsed = time.monotonic() - (self._suspended_at or time.monotonic())
+        self._suspended_at = None
+        self._advance(max(0, int(elapsed)), updated)
+        self.timer.start(1000)
+
+    def shutdown(self):
+        try:
+            self.timer.stop()
+        except Exception:
+            pass
+        self._hub.unsubscribe(self._config_path, self._on_config_changed)
+        self._unsubscribe_data()
+# ////-----------------------------------------------------------------------------------------
+
 def create_widget(BaseClass, module_name):
-    class GameClockWidget(BaseClass):
+    class GameClockWidget(VisibilityLifecycle, BaseClass):
         def __init__(self):
             super().__init__(module_name)
 
@@ -32,162 +235,49 @@ def create_widget(BaseClass, module_name):
             self.setMaximumSize(4000, 150)
 
             # label pre čas
-            self.clock_label = QLabel("00:00:00")
-            self.clock_label.setAlignment(Qt.AlignCenter)
+            # číslice z atlasu - pevná šírka, prekreslia sa len zmenené bunky
+            self.clock_label = DigitDisplay("game_clock", Qt.AlignCenter)
             layout.addWidget(self.clock_label)
 
-            # paths
-            self._config_path = self.get_config_path("game_clock.json")
-            self._data_path = self.get_data_path("data.ini")
+            # zdieľaný model - dock aj overlaye s game_clock čítajú data.ini len raz
+            config_path = self.get_config_path("game_clock.json")
+            data_path = self.get_data_path("data.ini")
+            self._model_key = ("game_clock", os.path.abspath(config_path))
+            self.model = acquire_model(self._model_key, lambda: GameClockModel(config_path, data_path))
+            self.model.style_changed.connect(self._apply_style)
+            self.model.time_changed.connect(self.update_widget)
+            self._apply_style()
+            self.update_widget()
+
+        # ////---- Vykreslenie stavu modelu ----////
+        def _apply_style(self):
+            cfg = self.model.config
+            self.clock_label.set_glyph_font(cfg.font_family, cfg.font_size, QFont.Bold)
+            self.clock_label.set_color(cfg.font_color)
 
-            # interné stavy
-            self._last_config_mtime = None
-            self._last_data_mtime = None
-            self._time_float = 0.0
-            self._time_speed = 1.0
-            self._simulate_seconds = DEFAULT_CONFIG["simulate_seconds"]
-            self._simulated_seconds_count = 0
-            self._last_loaded_time_float = None
-            self._last_loaded_time_speed = None
-            self._time_disabled = False  # ak je True, hodiny sa neaktualizujú
-
-            # ensure config exists
-            self._ensure_config()
-            self._load_and_apply_config()
-
-            # timer
-            self.timer = QTimer(self)
-            self.timer.timeout.connect(self.update_widget)
-            self.timer.start(1000)
-
-            # prvé načítanie
-            self._load_data(force=True)
-
-        # ////---- Config helpers ----////
-        def _ensure_config(self):
-            cfg_dir = os.path.dirname(self._config_path)
-            ensure_dir(cfg_dir)
-            if not os.path.exists(self._config_path):
-                try:
-                    with open(self._config_path, "w", encoding="utf-8") as f:
-                        json.dump(DEFAULT_CONFIG, f, indent=2)
-                except Exception:
-                    pass
-
-        def _load_and_apply_config(self):
-            try:
-                mtime = os.path.getmtime(self._config_path) if os.path.exists(self._config_path) else None
-            except Exception:
-                mtime = None
-            if mtime and mtime == self._last_config_mtime:
-                return
-            self._last_config_mtime = mtime
-
-            cfg = DEFAULT_CONFIG.copy()
-            try:
-                with open(self._config_path, "r", encoding="utf-8") as f:
-                    user_cfg = json.load(f)
-                    if isinstance(user_cfg, dict):
-                        cfg.update(user_cfg)
-            except Exception:
-                pass
-
-            fam = str(cfg.get("font_family", DEFAULT_CONFIG["font_family"]))
-            size = int(cfg.get("font_size", DEFAULT_CONFIG["font_size"]))
-            color = cfg.get("font_color", DEFAULT_CONFIG["font_color"])
-            self._simulate_seconds = int(cfg.get("simulate_seconds", DEFAULT_CONFIG["simulate_seconds"]))
-
-            font = QFont(fam, size)
-            self.clock_label.setFont(font)
-            self.clock_label.setStyleSheet(f"color: {color}; font-weight: bold;")
-
-        # ////---- Data helpers ----////
-        def _load_data(self, force=False):
-            # Načíta nový čas a speed z INI. Vracia True, ak sa zmenil čas alebo speed.
-            if not os.path.exists(self._data_path):
-                return False
-            try:
-                mtime = os.path.getmtime(self._data_path)
-            except Exception:
-                mtime = None
-
-            # Ak sa súbor nezmenil, nič nerobíme
-            if not force and self._last_data_mtime == mtime:
-                return False
-
-            # Uložíme nový mtime
-            self._last_data_mtime = mtime
-
-            try:
-                cfg = configparser.ConfigParser()
-                cfg.read(self._data_path)
-                updated = False
-
-                if "Time" in cfg:
-                    # Detekcia hodnoty None (ignorovanie simulácie)
-                    time_str = cfg["Time"].get("time_of_day", "None")
-                    if time_str.strip().lower() == "none":
-                        # skry hodiny
-                        self.clock_label.setText("")
-                        self._time_disabled = True
-                        return False
-                    else:
-                        self._time_disabled = False
-
-                    new_time = float(cfg["Time"].get("time_of_day", "0"))
-                    new_speed = float(cfg["Time"].get("time_speed", "1.0"))
-
-                    # Reset simulácie len ak sa zmenila hodnota s toleranciou pre float
-                    if (self._last_loaded_time_float is None or
-                        abs(new_time - self._last_loaded_time_float) > 0.001 or
-                        self._last_loaded_time_speed is None or
-                        abs(new_speed - self._last_loaded_time_speed) > 0.001):
-                        
-                        self._time_float = new_time
-                        self._time_speed = new_speed
-                        self._simulated_seconds_count = 0
-                        updated = True
-
-                    self._last_loaded_time_float = new_time
-                    self._last_loaded_time_speed = new_speed
-
-                if "Time_Simulation" in cfg:
-                    self._simulate_seconds = int(cfg["Time_Simulation"].get("Second", self._simulate_seconds))
-
-                return updated
-            except Exception:
-                return False
-
-        # ////---- Tick každú sekundu ----////
         def update_widget(self):
-            self._load_and_apply_config()
-            updated = self._load_data(force=False)
-
-            # Ak sú hodiny vypnuté, nesimuluj a nerenderuj
-            if self._time_disabled:
-                return
-
-            # Reset simulácie sa deje len ak prišiel update z INI
-            if updated:
-                self._simulated_seconds_count = 0
+            self.clock_label.set_text(self.model.text)
 
-            # simulácia iba ak nepresiahla max počet sekúnd
-            if self._simulated_seconds_count < self._simulate_seconds:
-                self._time_float += (1.0 / 3600.0) * self._time_speed
-                self._time_float %= 24
-                self._simulated_seconds_count += 1
+        # ////---- Viditeľnosť (pozastaví model, ak sú skryté všetky pohľady) ----////
+        def suspend_widget(self):
+            if self._model_key is not None:
+                set_view_visible(self._model_key, self, False)
 
-            # update UI vždy ak nie je hodnota None
-            hours = int(self._time_float)
-            minutes = int((self._time_float - hours) * 60)
-            seconds = int((((self._time_float - hours) * 60) - minutes) * 60)
-            self.clock_label.setText(f"{hours:02}:{minutes:02}:{seconds:02}")
+        def resume_widget(self):
+            if self._model_key is not None:
+                set_view_visible(self._model_key, self, True)
+                self._apply_style()
+                self.update_widget()
 
         def close_widget(self):
             try:
-                self.timer.stop()
+                self.model.style_changed.disconnect(self._apply_style)
+                self.model.time_changed.disconnect(self.update_widget)
             except Exception:
                 pass
+            if self._model_key is not None:
+                release_model(self._model_key, self)
+                self._model_key = None
 
     return GameClockWidget()
 
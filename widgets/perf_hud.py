@@ -0,0 +1,176 @@
+import os
+import sys
+import json
+from PySide6.QtWidgets import QVBoxLayout
+from PySide6.QtCore import QTimer, Qt
+
+# ////---- Zdieľané pomocné moduly (python/customclock) ----////
+PYTHON_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "python")
+if PYTHON_DIR not in sys.path:
+    sys.path.append(PYTHON_DIR)
+from customclock import perf
+from customclock.render import RenderedLabel, TimedLabel, render_counters
+from customclock.lifecycle import VisibilityLifecycle
+from customclock.filewatch import get_hub
+from customclock.schema import Schema, Field, at_least, is_color
+
+# ////---- Schéma perf_hud.json (typy, kontroly, predvolené hodnoty) ----////
+CONFIG_SCHEMA = Schema("PerfHudConfig", [
+    Field("font_family", "Consolas"),
+    Field("font_size", 10, at_least(1)),
+    Field("font_color", "#c0c0c0", is_color),
+    Field("interval_ms", 1000, at_least(250))
+])
+
+# ////---- Poradie widgetov v tabuľke (ostatné sa pridajú za ne) ----////
+WIDGET_ORDER = ["system_clock", "game_clock", "stopwatch", "console", "perf_hud"]
+LOGIC_PHASES = ["query", "convert", "write"]
+
+def ensure_dir(path):
+    try:
+        os.makedirs(path, exist_ok=True)
+    except Exception:
+        pass
+
+# ////---- Priemerný čas v ms za interval z dvoch snapshotov ----////
+def interval_ms(timings, previous, name):
+    count, total, _ = timings.get(name, (0, 0.0, 0.0))
+    prev_count, prev_total, _ = previous.get(name, (0, 0.0, 0.0))
+    if count <= prev_count:
+        return None, 0
+    return (total - prev_total) / (count - prev_count) * 1000.0, count - prev_count
+
+def format_ms(value):
+    return "   -  " if value is None else f"{value:6.2f}"
+
+def create_widget(BaseClass, module_name):
+    class PerfHudWidget(VisibilityLifecycle, BaseClass):
+        def __init__(self):
+            super().__init__(module_name)
+
+            # layout
+            layout = QVBoxLayout(self)
+            self.setLayout(layout)
+            self.setMinimumSize(260, 120)
+            self.setMaximumSize(4000, 400)
+
+            # jeden viacriadkový label - jedno setText za interval
+            self.hud_label = TimedLabel("", "perf_hud")
+            self.hud_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+            layout.addWidget(self.hud_label)
+            self._hud = RenderedLabel(self.hud_label, "perf_hud")
+
+            # paths
+            self._config_path = self.get_config_path("perf_hud.json")
+
+            # interné stavy
+            self._interval_ms = CONFIG_SCHEMA.default().interval_ms
+            self._previous = perf.snapshot()
+            self._previous_time = perf.now()
+
+            # ensure config exists
+            self._ensure_config()
+            self._hub = get_hub()
+            self._apply_config(self._hub.subscribe(self._config_path, self._on_config_changed))
+
+            # timer
+            self.timer = QTimer(self)
+            self.timer.timeout.connect(self.update_widget)
+            self.timer.start(self._interval_ms)
+
+        # ////---- Config helpers ----////
+        def _ensure_config(self):
+            cfg_dir = os.path.dirname(self._config_path)
+            ensure_dir(cfg_dir)
+            if not os.path.exists(self._config_path):
+                try:
+                    with open(self._config_path, "w", encoding="utf-8") as f:
+                        json.dump(CONFIG_SCHEMA.defaults(), f, indent=2)
+                except Exception:
+                    pass
+
+        def _on_config_changed(self, _path, user_cfg):
+            self._apply_config(user_cfg)
+
+        def _apply_config(self, user_cfg):
+            cfg = CONFIG_SCHEMA.load(user_cfg, "perf_hud.json")
+            self._interval_ms = cfg.interval_ms
+            if hasattr(self, "timer") and self.timer.interval() != self._interval_ms:
+                self.timer.setInterval(self._interval_ms)
+
+            self._hud.font(cfg.font_family, cfg.font_size)
+            self._hud.style(f"color: {cfg.font_color};")
+
+        # ////---- Zostavenie textu z rozdielu dvoch snapshotov ----////
+        def _build_text(self, counts, timings, elapsed):
+            prev_counts, prev_timings = self._previous
+            lines = []
+
+            # prebudenia event loopu za sekundu
+            wakeups = {}
+            for name, value in counts.items():
+                if name.startswith("wakeup."):
+                    rate = (value - prev_counts.get(name, 0)) / elapsed
+                    if rate > 0:
+                        wakeups[name[len("wakeup."):]] = rate
+            detail = ", ".join(f"{src} {rate:.1f}" for src, rate in sorted(wakeups.items()))
+            lines.append(f"Wakeups/s {sum(wakeups.values()):5.1f}  ({detail})" if detail else "Wakeups/s   0.0")
+
+            # update/paint na widget (priemer ms za interval, počet za sekundu)
+            widgets = {name.rsplit(".", 1)[0] for name in timings if name.endswith((".update", ".paint"))}
+            widgets.discard("logic")
+            ordered = [w for w in WIDGET_ORDER if w in widgets] + sorted(widgets - set(WIDGET_ORDER))
+            if ordered:
+                lines.append(f"{'widget':<13} {'update ms':>9} {'paint ms':>9} {'paint/s':>7} {'skipped':>7}")
+            for widget in ordered:
+                update_ms, _ = interval_ms(timings, prev_timings, f"{widget}.update")
+                paint_ms, paints = interval_ms(timings, prev_timings, f"{widget}.paint")
+                # podiel Qt volaní, ktoré RenderedLabel preskočil (od štartu)
+                rc = render_counters.get(widget)
+                total = rc["applied"] + rc["skipped"] if rc else 0
+                skipped = f"{rc['skipped'] * 100 // total}%" if total else "-"
+                lines.append(f"{widget:<13} {format_ms(update_ms):>9} {format_ms(paint_ms):>9} {paints / elapsed:7.1f} {skipped:>7}")
+
+            # fázy hlavnej slučky logiky
+            phases = [f"{phase} {format_ms(interval_ms(timings, prev_timings, f'logic.{phase}')[0]).strip()}" for phase in LOGIC_PHASES]
+            lines.append("Logic ms  " + "  ".join(phases))
+            lines.append(f"DB busy   {counts.get('logic.db_busy', 0)}")
+            pushes = counts.get("filewatch.push", 0) - prev_counts.get("filewatch.push", 0)
+            lines.append(f"Watches   {self._hub.watch_count()}  (pushes {pushes})")
+
+            rss = perf.rss_bytes()
+            lines.append(f"RSS       {rss / (1024 * 1024):.1f} MB" if rss else "RSS       -")
+            return "\n".join(lines)
+
+        # ////---- Tick podľa intervalu ----////
+        def update_widget(self):
+            perf.count("wakeup.perf_hud")
+            started = perf.now()
+            counts, timings = perf.snapshot()
+            elapsed = max(1e-3, started - self._previous_time)
+            self._hud.text(self._build_text(counts, timings, elapsed))
+            self._previous = (counts, timings)
+            self._previous_time = started
+            perf.add_time("perf_hud.update", perf.now() - started)
+
+        # ////---- Viditeľnosť ----////
+        def suspend_widget(self):
+            self.timer.stop()
+
+        def resume_widget(self):
+            # interval sa počíta od zobrazenia, nie od skrytia
+            self._previous = perf.snapshot()
+            self._previous_time = perf.now()
+            self.timer.start(self._interval_ms)
+
+        def close_widget(self):
+            try:
+                self.timer.stop()
+            except Exception:
+                pass
+            self._hub.unsubscribe(self._config_path, self._on_config_changed)
+
+    return PerfHudWidget()
+
+def get_widget_dock_position():
+    return Qt.RightDockWidgetArea, 3
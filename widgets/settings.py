@@ -34,6 +34,16 @@ def create_widget(BaseClass, module_name):
             self.btn_config.clicked.connect(lambda: self.open_file("stopwatch.json"))
             layout.addWidget(self.btn_config)
 
+            # Tlačidlo na otvorenie
+            self.btn_config = QPushButton("console.json")
+            self.btn_config.clicked.connect(lambda: self.open_file("console.json"))
+            layout.addWidget(self.btn_config)
+
+            # Tlačidlo na otvorenie
+            self.btn_config = QPushButton("perf_hud.json")
+            self.btn_config.clicked.connect(lambda: self.open_file("perf_hud.json"))
+            layout.addWidget(self.btn_config)
+
             # Tlačidlo na otvorenie path.ini
             self.btn_path = QPushButton("path.ini")
             self.btn_path.clicked.connect(lambda: self.open_file("path.ini"))
@@ -7,19 +7,57 @@
 # ////---- Importy ----////
 # /////////////////////////////////////////////////////////////////////////////////////////////
 import os
+import sys
 import json
+import math
+import time
+import heapq
+import itertools
 from PySide6.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel
-from PySide6.QtCore import QTimer, Qt, QPoint
-from PySide6.QtGui import QFont, QPixmap, QPainter, QColor, QPolygon
+from PySide6.QtCore import QTimer, Qt, QPoint, QObject, Signal
+from PySide6.QtGui import QPixmap, QPainter, QColor, QPolygon, QFont
 
-from shortcut_manager import get_bridge
+# ////---- Zdieľané pomocné moduly (python/customclock) ----////
+PYTHON_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "python")
+if PYTHON_DIR not in sys.path:
+    sys.path.append(PYTHON_DIR)
+from customclock.shortcuts import get_registry, format_sequence
+from customclock.models import acquire_model, release_model, set_view_visible
+from customclock.lifecycle import VisibilityLifecycle
+from customclock.filewatch import get_hub, parse_ini
+from customclock.render import RenderedLabel
+from customclock.digits import DigitDisplay
+from customclock.schema import Schema, Field, at_least, is_color, one_of, values_are, to_number
+from customclock.log import log_to_console
+from customclock import perf
 
-# ////---- Default config ----////
-DEFAULT_CONFIG = {
-    "font_family": "Arial",
-    "font_size": 28,
-    "font_color": "#00ffcc",
-    "countdown_colors": {
+# ////---- Počet desatinných miest podľa režimu "subsecond" ----////
+SUBSECOND_DECIMALS = {
+    "none": 0,
+    "tenths": 1,
+    "hundredths": 2
+}
+
+# ////---- Kontrola countdown_colors (kľúč = percento 0-100, hodnota = farba) ----////
+def check_countdown_colors(colors):
+    for key, value in colors.items():
+        try:
+            percent = int(key)
+        except ValueError:
+            return f"{key!r} is not a percent"
+        if not 0 <= percent <= 100:
+            return f"{key!r} is not between 0 and 100"
+        problem = is_color(value) if isinstance(value, str) else f"{value!r} is not a color"
+        if problem:
+            return f"{key}: {problem}"
+    return None
+
+# ////---- Schéma jedného časovača (hlavný = vrchné kľúče stopwatch.json, ďalšie v "timers") ----////
+TIMER_SCHEMA = Schema("StopwatchTimerConfig", [
+    Field("font_family", "Arial"),
+    Field("font_size", 28, at_least(1)),
+    Field("font_color", "#00ffcc", is_color),
+    Field("countdown_colors", {
         "100": "#4080cc",
         "75": "#00ff00",
         "50": "#ffff00",
@@ -29,11 +67,17 @@ DEFAULT_CONFIG = {
         "10": "#ff2000",
         "5": "#ff1000",
         "0": "#ff0000"
-    },
-    "show_seconds": True,
-    "direction": "up",
-    "start_time_sec": 0,
-    "shortcuts": {
+    }, check_countdown_colors),
+    Field("smooth_colors", False),  # plynulý prechod medzi farbami countdown_colors
+    Field("show_seconds", True),
+    Field("subsecond", "none", one_of(*SUBSECOND_DECIMALS), normalize=str.lower),  # "none", "tenths" alebo "hundredths"
+    Field("direction", "up", one_of("up", "down"), normalize=str.lower),
+    Field("start_time_sec", 0, coerce=to_number),
+    # "real" = reálne sekundy, "game" = herné sekundy podľa time_of_day/time_speed z data.ini
+    Field("mode", "real", one_of("real", "game"), normalize=str.lower),
+    # len pre "game": odpočet do herného času, napr. "21:00" (prázdne = bežný odpočet)
+    Field("target_game_time", ""),
+    Field("shortcuts", {
         "start": "ctrl+s",
         "reset": "ctrl+r",
         "add_min": "ctrl+up",
@@ -43,8 +87,26 @@ DEFAULT_CONFIG = {
         "sub_10min": "ctrl+shift+down",
         "sub_hour": "ctrl+left",
         "direction_toggle": "ctrl+d"
-    }
-}
+    }, values_are())
+])
+
+def default_config():
+    """Content of a new stopwatch.json."""
+    cfg = TIMER_SCHEMA.defaults()
+    # ďalšie pomenované časovače, napr. {"respawn": {"direction": "down", "start_time_sec": 300, "shortcuts": {...}}}
+    cfg["timers"] = {}
+    return cfg
+
+# ////---- Journal stavu stopiek ----////
+JOURNAL_FILE = "stopwatch_journal.jsonl"
+JOURNAL_COMPACT_AFTER = 64  # po koľkých záznamoch sa journal zhustí do jedného snapshotu
+
+# ////---- Kľúče configu, po ktorých zmene pohľady menia font/farby ----////
+STYLE_KEYS = frozenset({"font_family", "font_size", "font_color", "countdown_colors", "smooth_colors"})
+
+# ////---- Herný režim ----////
+GAME_RESYNC_TOLERANCE = 90.0  # herné sekundy, pod ktoré sa odpočet do herného času neprepočítava
+TARGET_PASSED_WINDOW = 3600.0  # herné sekundy po cieli, v ktorých sa cieľ berie ako dosiahnutý (nie "zajtra")
 
 stopwatch_instance = [None]  # optional global ref
 
@@ -60,19 +122,53 @@ def ensure_dir(path):
         pass
 # ////-----------------------------------------------------------------------------------------
 
-# ////---- Prevod sekúnd na formát HH:MM:SS ----////
-def seconds_to_str(secs, show_seconds=True):
+# ////---- Prevod sekúnd na formát HH:MM:SS (voliteľne s desatinami) ----////
+def seconds_to_str(secs, show_seconds=True, decimals=0):
     neg = secs < 0
-    secs = abs(int(secs))
-    h = secs // 3600
-    m = (secs % 3600) // 60
-    s = secs % 60
+    if not show_seconds:
+        decimals = 0
+    scale = 10 ** decimals
+    units = int(round(abs(secs) * scale))
+    whole, frac = divmod(units, scale)
+    h = whole // 3600
+    m = (whole % 3600) // 60
+    s = whole % 60
     if show_seconds:
-        return f"{'-' if neg else ''}{h:02}:{m:02}:{s:02}"
+        text = f"{'-' if neg else ''}{h:02}:{m:02}:{s:02}"
+        if decimals:
+            text += f".{frac:0{decimals}}"
+        return text
     else:
         return f"{'-' if neg else ''}{h:02}:{m:02}"
 # ////-----------------------------------------------------------------------------------------
 
+# ////---- Zaokrúhlenie času na zobrazovaný krok ----////
+def quantize_display(secs, direction="up", decimals=0):
+    """Round the running value to what is shown on screen.
+       Counting up truncates (00:00:00 is shown for the whole first second),
+       counting down rounds up (the start value is shown for the whole first second).
+    """
+    scale = 10 ** decimals
+    if direction == "down":
+        return math.ceil(secs * scale - 1e-6) / scale
+    return math.floor(secs * scale + 1e-6) / scale
+# ////-----------------------------------------------------------------------------------------
+
+# ////---- Čas do najbližšej viditeľnej zmeny ----////
+def seconds_to_next_change(secs, direction="up", step=1.0):
+    """Return how long (in seconds) the quantized display keeps its current value."""
+    if step <= 0:
+        return 0.0
+    pos = secs / step
+    if direction == "down":
+        delta = (pos - math.floor(pos)) * step
+    else:
+        delta = (math.floor(pos) + 1 - pos) * step
+    if delta <= 1e-6:
+        delta = step
+    return delta
+# ////-----------------------------------------------------------------------------------------
+
 # ////---- Získanie farby podľa percentuálneho stavu ----////
 def get_percent_color(percent, colors):
     percent = int(percent)
@@ -84,9 +180,38 @@ def get_percent_color(percent, colors):
     return colors.get("0", "#ff0000")
 # ////-----------------------------------------------------------------------------------------
 
+# ////---- Tabuľka farieb pre percentá 0-100 (počíta sa raz pri načítaní configu) ----////
+def build_color_lut(colors, smooth=False):
+    """Return a list of 101 color names, index = percent.
+       Without smoothing the result matches get_percent_color() for every percent,
+       with smoothing the colors are linearly interpolated between the configured thresholds.
+    """
+    lut = [get_percent_color(p, colors) for p in range(101)]
+    if not smooth:
+        return lut
+    try:
+        stops = sorted((int(k), QColor(v)) for k, v in colors.items())
+    except Exception:
+        return lut
+    for (lo, c_lo), (hi, c_hi) in zip(stops, stops[1:]):
+        if hi <= lo:
+            continue
+        for p in range(max(0, lo), min(100, hi) + 1):
+            t = (p - lo) / (hi - lo)
+            mixed = QColor(
+                round(c_lo.red() + (c_hi.red() - c_lo.red()) * t),
+                round(c_lo.green() + (c_hi.green() - c_lo.green()) * t),
+                round(c_lo.blue() + (c_hi.blue() - c_lo.blue()) * t)
+            )
+            lut[p] = mixed.name()
+    return lut
+# ////-----------------------------------------------------------------------------------------
+
 # ////---- Vykreslenie šípky (nahor alebo nadol) ----////
-def draw_arrow(direction="up", size=32, color="#00ffcc"):
-    pixmap = QPixmap(size, size)
+def draw_arrow(direction="up", size=32, color="#00ffcc", dpr=1.0):
+    # pixmapa v natívnom rozlíšení obrazovky, logická veľkosť ostáva size x size
+    pixmap = QPixmap(max(1, round(size * dpr)), max(1, round(size * dpr)))
+    pixmap.setDevicePixelRatio(dpr)
     pixmap.fill(Qt.transparent)
     painter = QPainter(pixmap)
     painter.setRenderHint(QPainter.Antialiasing)
@@ -110,274 +235,919 @@ def draw_arrow(direction="up", size=32, color="#00ffcc"):
     return pixmap
 # ////-----------------------------------------------------------------------------------------
 
-# ////---- Normalizácia skratky na formát bez medzier a malými písmenami ----////
-def normalize_combo(combo: str) -> str:
-    """Normalize a combo string to the form that ShortcutListener emits:
-       - lower case
-       - no spaces
-       - modifiers and keys joined by '+' (we accept user input like 'Ctrl + Shift + Up')
+# ////---- Cache predkreslených šípok (smer, veľkosť, farba, DPR) ----////
+_arrow_cache = {}
+
+def get_arrow_pixmap(direction="up", size=32, color="#00ffcc", dpr=1.0):
+    key = (direction, size, str(color), round(float(dpr), 2))
+    pixmap = _arrow_cache.get(key)
+    if pixmap is None:
+        pixmap = draw_arrow(direction, size, color, key[3])
+        _arrow_cache[key] = pixmap
+    return pixmap
+# ////-----------------------------------------------------------------------------------------
+
+# ////---- Čas uplynutý od záznamu (monotonic ak je to ten istý boot, inak wall clock) ----////
+ELAPSED_CLOCK_TOLERANCE = 5.0  # sekundy, o ktoré sa monotonic a wall rozdiel smú líšiť (NTP korekcie)
+
+def elapsed_since(mono, wall):
+    d_mono = time.monotonic() - mono
+    d_wall = time.time() - wall
+    # monotonic hodiny sú spoločné pre celý systém až do reštartu PC (na Windows bežia
+    # od bootu, takže záznam z iného bootu môže mať malý kladný rozdiel); presnejší
+    # monotonic sa použije, len ak sa s wall rozdielom zhoduje - inak je záznam z iného
+    # bootu alebo PC medzitým spal a platí wall clock
+    if d_mono >= 0 and abs(d_mono - d_wall) <= ELAPSED_CLOCK_TOLERANCE:
+        return d_mono
+    return max(0.0, d_wall)
+# ////-----------------------------------------------------------------------------------------
+
+# ////---- Herný čas "HH:MM" / "HH:MM:SS" na sekundy ----////
+def parse_game_time(text):
+    if not text:
+        return None
+    try:
+        parts = [int(p) for p in str(text).strip().split(":")]
+    except ValueError:
+        return None
+    if not 1 <= len(parts) <= 3:
+        return None
+    parts += [0] * (3 - len(parts))
+    h, m, sec = parts
+    return (h % 24) * 3600 + m * 60 + sec
+# ////-----------------------------------------------------------------------------------------
+
+# ////---- Načítanie herného času a rýchlosti z data.ini ----////
+def game_time_from(cfg, mtime):
+    """Return (game_seconds_now, time_speed) from parsed data.ini written at `mtime`,
+       or (None, speed) if the time is unknown.
+       time_of_day is extrapolated by the age of the file, so a sample written a moment ago is exact.
+    """
+    if cfg is None or mtime is None or "Time" not in cfg:
+        return None, None
+    try:
+        speed = float(cfg["Time"].get("time_speed", "1.0"))
+    except ValueError:
+        speed = None
+    time_str = cfg["Time"].get("time_of_day", "None")
+    if time_str.strip().lower() == "none":
+        return None, speed
+    try:
+        game_secs = float(time_str) * 3600.0
+    except ValueError:
+        return None, speed
+    age = max(0.0, time.time() - mtime)
+    return (game_secs + age * (speed or 0.0)) % 86400, speed
+# ////-----------------------------------------------------------------------------------------
+
+# ////---- Append-only journal akcií stopiek ----////
+class StopwatchJournal:
+    """Append-only journal of user actions (start/pause/set/dir) for all named timers.
+
+    Every record carries the timer name ("t") and the resulting anchor (value, running,
+    direction, percent base) together with the monotonic and wall timestamp of that anchor,
+    so replay is a fold over valid lines and a torn last line is simply skipped. Only user
+    actions append; the journal is compacted into one snapshot per timer once it grows
+    past JOURNAL_COMPACT_AFTER.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._records = 0
+        self._torn_tail = False  # posledný riadok bez '\n' (pád počas zápisu)
+
+    def replay(self):
+        """Return {timer_name: last_state} or None if the journal can't be read."""
+        states = {}
+        count = 0
+        self._torn_tail = False
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    self._torn_tail = not line.endswith("\n")
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        continue
+                    if not isinstance(rec, dict) or "v" not in rec:
+                        continue
+                    name = str(rec.get("t", ""))
+                    states[name] = dict(states.get(name, {}), **rec)
+                    count += 1
+        except FileNotFoundError:
+            pass
+        except Exception:
+            return None
+        self._records = count
+        return states
+
+    def append(self, rec):
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                if self._torn_tail:
+                    f.write("\n")
+                f.write(json.dumps(rec, separators=(",", ":")) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception:
+            return
+        self._torn_tail = False
+        self._records += 1
+        if self._records > JOURNAL_COMPACT_AFTER:
+            self.compact()
+
+    def compact(self, keep=None):
+        """Rewrite the journal as one snapshot per timer (optionally only names in keep)."""
+        states = self.replay()
+        if states is None:
+            return
+        tmp_path = self.path + ".tmp"
+        lines = []
+        for name, state in states.items():
+            if keep is not None and name not in keep:
+                continue
+            state["ev"] = "snap"
+            lines.append(json.dumps(state, separators=(",", ":")) + "\n")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            self._records = len(lines)
+            self._torn_tail = False
+        except Exception:
+            pass
+# ////-----------------------------------------------------------------------------------------
+
+# ////---- Stav jedného pomenovaného časovača ----////
+class StopwatchTimer:
+    """State of one named timer: monotonic anchor, direction, colors and shortcuts.
+
+    The displayed value is derived from the anchor:
+      running: value = anchor_value +/- (monotonic() - anchor_mono)
+      paused:  value = anchor_value
+    """
+    def __init__(self, name):
+        self.name = name
+        self.running = False
+        self.direction = "up"  # "up" or "down"
+        self.show_seconds = True
+        self.decimals = 0  # 0 = celé sekundy, 1 = desatiny, 2 = stotiny
+        self.start_time = 0
+        self.anchor_value = 0.0
+        self.anchor_mono = None
+        self.percent_base_time = 0  # base time for percent calculation in countdown mode
+        self.countdown_colors = dict(TIMER_SCHEMA.default().countdown_colors)
+        self.color_lut = build_color_lut(self.countdown_colors)
+        self.shortcuts = {}
+        # herný režim: rate = herné sekundy za reálnu sekundu (time_speed), target v herných sekundách
+        self.game_mode = False
+        self.rate = 1.0
+        self.target_game_secs = None
+        self.target_armed = True  # odpočet k cieľu ešte nebol spustený (po resete / zmene cieľa)
+        self.font_color = TIMER_SCHEMA.default().font_color
+        self.config = None  # naposledy aplikovaný StopwatchTimerConfig (nemenný)
+        self.generation = 0  # zvyšuje sa pri každom preplánovaní (staré záznamy v heape sa ignorujú)
+
+    # ////---- Čas ----////
+    def value(self, now=None):
+        if not self.running or self.anchor_mono is None:
+            return self.anchor_value
+        elapsed = ((time.monotonic() if now is None else now) - self.anchor_mono) * self.rate
+        if self.direction == "up":
+            return self.anchor_value + elapsed
+        return max(0.0, self.anchor_value - elapsed)
+
+    def set_value(self, value):
+        # nová kotva, ak časovač beží
+        self.anchor_value = float(value)
+        self.anchor_mono = time.monotonic() if self.running else None
+
+    def next_change_in(self):
+        """Real seconds until the shown value changes, None while paused or frozen."""
+        if not self.running or self.rate <= 0:
+            return None
+        step = 10 ** -self.decimals if self.show_seconds else 1.0
+        return seconds_to_next_change(self.value(), self.direction, step) / self.rate
+
+    def set_rate(self, rate):
+        # nová kotva pri zmene rýchlosti - čas do zmeny ostáva spojitý
+        rate = max(0.0, float(rate))
+        if abs(rate - self.rate) < 1e-9:
+            return False
+        cur = self.value()
+        self.rate = rate
+        self.set_value(cur)
+        return True
+
+    def sync_game_clock(self, game_secs, speed):
+        """Apply a published game-time sample. Returns True if the anchor moved."""
+        if not self.game_mode:
+            return False
+        moved = False
+        if speed is not None:
+            moved = self.set_rate(speed)
+        if self.target_game_secs is not None and game_secs is not None:
+            if not self.running and not self.target_armed:
+                # pozastavený používateľom alebo cieľ už dosiahnutý - ostáva, kým ho niekto
+                # neresetuje alebo znova nespustí
+                return moved
+            remaining = (self.target_game_secs - game_secs) % 86400
+            if not self.target_armed and remaining > 86400 - TARGET_PASSED_WINDOW:
+                # cieľ práve prešiel počas odpočtu - 0, nie rovnaký čas zajtra
+                remaining = 0.0
+            if self.running:
+                self.target_armed = False
+            # data.ini má obmedzenú presnosť - bežiaci odpočet ignoruje drobné odchýlky
+            if not self.running or abs(remaining - self.value()) > GAME_RESYNC_TOLERANCE:
+                if self.percent_base_time == 0 or remaining > self.percent_base_time:
+                    self.percent_base_time = remaining if remaining > 0 else 1
+                self.set_value(remaining)
+                moved = True
+        return moved
+
+    def check_expired(self, now=None):
+        """Stop a finished countdown. Returns True if it just expired."""
+        if self.running and self.direction == "down" and self.value(now) <= 0:
+            self.running = False
+            self.set_value(0)
+            return True
+        return False
+
+    # ////---- Zobrazenie ----////
+    def display(self):
+        """Return (text, color) for the current value."""
+        decimals = self.decimals if self.show_seconds else 0
+        shown = quantize_display(self.value(), self.direction, decimals)
+        color = self.font_color
+        if self.direction == "down" and self.percent_base_time > 0:
+            percent = int(100 * shown / max(1, self.percent_base_time))
+            percent = max(0, min(100, percent))
+            color = self.color_lut[percent]
+        return seconds_to_str(shown, self.show_seconds, decimals), color
+
+    # ////---- Akcie zo skratiek ----////
+    def apply_action(self, action_name):
+        """Execute action mapped to a shortcut action_name (like 'start' or 'add_min')."""
+        if action_name == "start":
+            if self.running:
+                # paused - zmrazí hodnotu, percent base ostáva aby percento dávalo zmysel
+                self.anchor_value = self.value()
+                self.anchor_mono = None
+                self.running = False
+                self.target_armed = False
+            else:
+                cur = self.value()
+                if self.target_game_secs is not None and cur <= 0:
+                    # nové spustenie dobehnutého odpočtu - počíta k ďalšiemu výskytu cieľa
+                    self.target_armed = True
+                # if starting to count (e.g. start), set percent base for countdown
+                if self.direction == "down" and self.percent_base_time == 0:
+                    self.percent_base_time = cur if cur > 0 else 1
+                self.anchor_value = cur
+                self.anchor_mono = time.monotonic()
+                self.running = True
+        elif action_name == "reset":
+            self.running = False
+            self.target_armed = True
+            self.set_value(self.start_time)
+            self.percent_base_time = self.start_time
+        elif action_name == "add_min":
+            self.set_value(self.value() + 60)
+        elif action_name == "add_10min":
+            self.set_value(self.value() + 600)
+        elif action_name == "add_hour":
+            self.set_value(self.value() + 3600)
+        elif action_name == "sub_min":
+            self.set_value(max(0, self.value() - 60))
+        elif action_name == "sub_10min":
+            self.set_value(max(0, self.value() - 600))
+        elif action_name == "sub_hour":
+            self.set_value(max(0, self.value() - 3600))
+        elif action_name == "direction_toggle":
+            self.set_direction("down" if self.direction == "up" else "up")
+        else:
+            return False
+        return True
+
+    def set_direction(self, new_direction, recompute_base=True):
+        # switch direction, keep the current value and recompute percent base accordingly
+        cur = self.value()
+        self.direction = new_direction
+        # nová kotva, aby sa bežiaci čas od tohto bodu počítal opačným smerom
+        self.set_value(cur)
+        if not recompute_base:
+            return
+        # when switching to countdown, set base if needed
+        if self.direction == "down":
+            self.percent_base_time = cur if cur > 0 else 1
+        else:
+            self.percent_base_time = cur
+
+    # ////---- Config ----////
+    def apply_config(self, cfg):
+        """Apply the compiled config of this timer; only changed fields are touched
+           and the running time is never reset. Returns the set of changed fields.
+        """
+        first_load = self.config is None
+        changed = cfg.changed(self.config)
+        self.config = cfg
+        if not changed:
+            return changed
+
+        if changed & {"show_seconds", "subsecond"}:
+            self.show_seconds = cfg.show_seconds
+            self.decimals = SUBSECOND_DECIMALS[cfg.subsecond]
+        if "font_color" in changed:
+            self.font_color = cfg.font_color
+        if changed & {"countdown_colors", "smooth_colors"}:
+            self.countdown_colors = dict(cfg.countdown_colors)
+            self.color_lut = build_color_lut(self.countdown_colors, cfg.smooth_colors)
+
+        # štartovací čas - pri prvom načítaní nastaví čas, neskôr len ak časovač
+        # ešte stojí na pôvodnej štartovacej hodnote (bežiaci čas sa nemení)
+        if "start_time_sec" in changed:
+            old_start = self.start_time
+            self.start_time = cfg.start_time_sec
+            if first_load or (not self.running and self.value() == old_start):
+                self.set_value(self.start_time)
+                self.percent_base_time = self.start_time
+
+        # smer - rovnaké správanie ako direction_toggle, čas sa zachová
+        if "direction" in changed:
+            new_direction = cfg.direction
+            if new_direction != self.direction:
+                self.set_direction(new_direction, recompute_base=not first_load)
+
+        if changed & {"mode", "target_game_time"}:
+            self.game_mode = cfg.mode == "game"
+            self.target_game_secs = parse_game_time(cfg.target_game_time) if self.game_mode else None
+            self.target_armed = not self.running
+            if not self.game_mode:
+                self.set_rate(1.0)
+            elif self.target_game_secs is not None and self.direction != "down":
+                # odpočet do herného času má zmysel len nadol
+                self.set_direction("down", recompute_base=False)
+
+        if "shortcuts" in changed:
+            self.shortcuts = dict(cfg.shortcuts)
+        return changed
+
+    # ////---- Journal ----////
+    def snapshot(self, event):
+        now_mono = time.monotonic()
+        mono = self.anchor_mono if self.anchor_mono is not None else now_mono
+        return {
+            "ev": event,
+            "t": self.name,
+            "r": self.running,
+            "v": self.anchor_value,
+            "d": self.direction,
+            "b": self.percent_base_time,
+            "k": self.rate,
+            "a": self.target_armed,
+            "m": mono,
+            "w": time.time() - (now_mono - mono)
+        }
+
+    def restore(self, state):
+        try:
+            value = float(state.get("v", self.start_time))
+            direction = state.get("d", self.direction)
+            running = bool(state.get("r", False))
+            base = state.get("b", self.percent_base_time)
+            rate = float(state.get("k", 1.0)) if self.game_mode else 1.0
+            armed = bool(state.get("a", not running))
+            if running:
+                elapsed = elapsed_since(float(state.get("m", 0.0)), float(state.get("w", time.time()))) * rate
+                value = value + elapsed if direction == "up" else value - elapsed
+        except (TypeError, ValueError):
+            return
+        self.direction = "down" if direction == "down" else "up"
+        self.percent_base_time = base
+        if running and self.direction == "down" and value <= 0:
+            # countdown medzitým dobehol
+            running = False
+            value = 0
+        self.running = running
+        self.target_armed = armed and not running
+        self.rate = rate
+        self.set_value(max(0.0, value) if self.direction == "down" else value)
+# ////-----------------------------------------------------------------------------------------
+
+# ////---- Zlúčený config pre každý pomenovaný časovač ----////
+def timer_configs(cfg):
+    """Split parsed stopwatch.json into {timer_name: StopwatchTimerConfig}.
+       The top-level keys describe the main timer (name ""); every entry of "timers"
+       inherits the top-level look but starts without shortcuts, so timers don't
+       steal each other's keys unless configured to.
     """
-    if not combo:
-        return combo
-    # remove spaces and lower
-    return combo.replace(" ", "").lower()
+    if not isinstance(cfg, dict):
+        cfg = {}
+    base = {k: v for k, v in cfg.items() if k != "timers"}
+    result = {"": TIMER_SCHEMA.load(base, "stopwatch.json")}
+    timers = cfg.get("timers", {})
+    if isinstance(timers, dict):
+        for name, overrides in timers.items():
+            if not name or not isinstance(overrides, dict):
+                continue
+            merged = dict(base)
+            merged["shortcuts"] = {}
+            merged.update(overrides)
+            result[str(name)] = TIMER_SCHEMA.load(merged, f"stopwatch.json timers.{name}")
+    return result
 # ////-----------------------------------------------------------------------------------------
 
+# /////////////////////////////////////////////////////////////////////////////////////////////
+# ////---- Zdieľaný model stopiek (časovače, journal, skratky, watchery) ----////
+# /////////////////////////////////////////////////////////////////////////////////////////////
+
+class StopwatchModel(QObject):
+    """All stopwatch state for one stopwatch.json: timers, deadline heap, journal,
+    shortcuts and file watchers. Exists once per config, so a stopwatch shown in the
+    dock and in several overlays handles each shortcut and journal record once.
+    Views listen to the signals below and only render."""
+    timers_changed = Signal()     # časovač pridaný/odstránený
+    style_changed = Signal(str)   # font/farby časovača sa zmenili
+    timer_changed = Signal(str)   # hodnota/smer časovača sa zmenili (treba prekresliť)
+
+    # ////---- Inicializácia modelu ----////
+    def __init__(self, config_path, data_dir):
+        super().__init__()
+        self._config_path = config_path
+        self._data_dir = data_dir
+        self._hub = get_hub()
+        self.timers = {}  # name -> StopwatchTimer
+        self._suspended = False  # všetky pohľady skryté - bez prekresľovania a sledovania data.ini
+
+        # jeden plánovač pre všetky časovače: heap (deadline, seq, name, generation)
+        self._deadlines = []
+        self._deadline_seq = itertools.count()
+
+        # skratky v zdieľanom registri: (timer_name, action) -> (text skratky, binding)
+        self.shortcuts = get_registry()
+        self._shortcut_bindings = {}
+
+        # timer - single-shot, natiahnutý len na najbližší deadline z heapu
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self._tick)
+
+        # obnova bežiaceho/pozastaveného stavu z journalu (prežije reštart aplikácie)
+        self._journal = StopwatchJournal(os.path.join(data_dir, JOURNAL_FILE))
+
+        # load config now (and register shortcuts); ďalšie zmeny pošle hub bez pollingu
+        self._ensure_config()
+        self._load_and_apply_config(self._hub.subscribe(self._config_path, self._on_config_file_changed))
+        self._restore_from_journal()
+        self._register_shortcuts()
+
+        # herný čas (data.ini) - odoberá sa len ak niektorý časovač beží v režime "game"
+        self._data_path = os.path.join(data_dir, "data.ini")
+        self._game_sample = (None, None)
+        self._data_subscribed = False
+        self._update_data_watch()
+    # ////---------------------------------------------------------------------------------
+
+    # ////---- Zabezpečí, že config súbor existuje ----////
+    def _ensure_config(self):
+        cfg_dir = os.path.dirname(self._config_path)
+        ensure_dir(cfg_dir)
+        if not os.path.exists(self._config_path):
+            try:
+                with open(self._config_path, "w", encoding="utf-8") as f:
+                    json.dump(default_config(), f, indent=2)
+            except Exception:
+                pass
+    # ////---------------------------------------------------------------------------------
+
+    # ////---- Načíta config súbor a aplikuje len zmenené nastavenia ----////
+    def _load_and_apply_config(self, user_cfg):
+        """Apply parsed stopwatch.json and re-apply only what changed, per timer.
+           Timers are added/removed according to "timers"; running time is never reset.
+           Returns {timer_name: changed_keys} for timers that changed.
+        """
+        configs = timer_configs(user_cfg)
+        result = {}
+        added_or_removed = False
+
+        # odstránené časovače
+        for name in list(self.timers):
+            if name not in configs:
+                timer = self.timers.pop(name)
+                timer.generation += 1  # zneplatní naplánované deadliny
+                result[name] = {"removed"}
+                added_or_removed = True
+
+        for name, timer_cfg in configs.items():
+            timer = self.timers.get(name)
+            if timer is None:
+                timer = self.timers[name] = StopwatchTimer(name)
+                added_or_removed = True
+            changed = timer.apply_config(timer_cfg)
+            if changed:
+                result[name] = changed
+
+        if added_or_removed:
+            self.timers_changed.emit()
+        for name, changed in result.items():
+            if name in self.timers and changed & STYLE_KEYS:
+                self.style_changed.emit(name)
+        return result
+    # ////---------------------------------------------------------------------------------
+
+    # ////---- Registrácia skratiek do zdieľaného registra (idempotentná) ----////
+    def _register_shortcuts(self):
+        """Sync shortcuts of all timers into the shared registry. One binding per
+           (timer, action); only added, removed or changed ones touch the registry.
+        """
+        wanted = {}
+        for name, timer in self.timers.items():
+            for action, combo in timer.shortcuts.items():
+                if combo:
+                    wanted[(name, action)] = combo
+
+        # unregister removed/changed
+        for key, (combo, binding) in list(self._shortcut_bindings.items()):
+            if wanted.get(key) == combo:
+                continue
+            self.shortcuts.unregister(binding)
+            del self._shortcut_bindings[key]
+
+        # register new
+        for key, combo in wanted.items():
+            if key in self._shortcut_bindings:
+                continue
+            name, action = key
+            def make_handler(action, name):
+                return lambda: self._on_shortcut_triggered(action, name)
+            binding = self.shortcuts.register(
+                combo, make_handler(action, name), owner=self,
+                name=f"stopwatch:{name}/{action}" if name else f"stopwatch/{action}"
+            )
+            self._shortcut_bindings[key] = (combo, binding)
+            if binding is not None and binding.conflicts:
+                others = ", ".join(sorted({b.name for b in binding.conflicts}))
+                log_to_console(f"[Stopwatch] Skratka {format_sequence(binding.sequence)} ({binding.name}) koliduje s: {others}", self._data_dir)
+
+    # ////---------------------------------------------------------------------------------
+
+    # ////---- Spracovanie spustenej skratky ----////
+    def _on_shortcut_triggered(self, action_name: str, timer_name: str = ""):
+        """Execute action mapped to a shortcut action_name (like 'start' or 'add_min')."""
+        # note: action_name is the logical name from config, not the combo string
+        timer = self.timers.get(timer_name)
+        if timer is None or not timer.apply_action(action_name):
+            return
+        if timer.game_mode and action_name in ("start", "reset"):
+            # odpočet do herného času sa hneď zarovná na posledný známy herný čas
+            timer.sync_game_clock(*self._game_sample)
+        # zápis akcie do journalu (jediné miesto okrem zmeny configu, ktoré píše na disk)
+        self._journal.append(timer.snapshot(action_name))
+        # update immediately UI
+        self.timer_changed.emit(timer_name)
+        self._schedule(timer)
+    # ////---------------------------------------------------------------------------------
+
+    # ////---- Obnova stavu z journalu ----////
+    def _restore_from_journal(self):
+        states = self._journal.replay()
+        if not states:
+            return
+        for name, state in states.items():
+            timer = self.timers.get(name)
+            if timer is None:
+                continue
+            timer.restore(state)
+            self._schedule(timer)
+        # zhustenie journalu hneď po štarte (záznamy zmazaných časovačov sa zahodia)
+        self._journal.compact(keep=set(self.timers))
+    # ////---------------------------------------------------------------------------------
+
+    # ////---- Plánovač: deadline heap pre všetky časovače ----////
+    def _schedule(self, timer, arm=True):
+        """(Re)schedule the next visible change of one timer. Older heap entries
+           of the same timer become stale through the generation counter.
+        """
+        timer.generation += 1
+        delay = timer.next_change_in()
+        if delay is not None:
+            # +1 ms aby sme sa nezobudili tesne pred hranicou a neukázali starú hodnotu
+            deadline = time.monotonic() + delay + 0.001
+            heapq.heappush(self._deadlines, (deadline, next(self._deadline_seq), timer.name, timer.generation))
+        if arm:
+            self._arm_wakeup()
+
+    def _arm_wakeup(self):
+        if self._suspended:
+            # heap ostáva, časovač sa natiahne až pri resume()
+            return
+        # zahodí zneplatnené záznamy na vrchu heapu
+        while self._deadlines:
+            _, _, name, generation = self._deadlines[0]
+            timer = self.timers.get(name)
+            if timer is not None and timer.generation == generation:
+                break
+            heapq.heappop(self._deadlines)
+        if not self._deadlines:
+            # nič nebeží - žiadne prebúdzanie event loopu
+            self.timer.stop()
+            return
+        delay = self._deadlines[0][0] - time.monotonic()
+        self.timer.start(max(0, int(math.ceil(delay * 1000))))
+
+    # ////---- Tick handler (len pri najbližšom deadline) ----////
+    def _tick(self):
+        """Called by the single-shot QTimer at the earliest deadline in the heap."""
+        perf.count("wakeup.stopwatch")
+        started = perf.now()
+        now = time.monotonic()
+        due = []
+        while self._deadlines and self._deadlines[0][0] <= now + 0.0005:
+            _, _, name, generation = heapq.heappop(self._deadlines)
+            timer = self.timers.get(name)
+            if timer is not None and timer.generation == generation:
+                due.append(timer)
+        for timer in due:
+            # countdown finished -> stops and is not rescheduled
+            timer.check_expired()
+            self.timer_changed.emit(timer.name)
+            self._schedule(timer, arm=False)
+        self._arm_wakeup()
+        perf.add_time("stopwatch.update", perf.now() - started)
+    # ////---------------------------------------------------------------------------------
+
+    # ////---- Zmena config súboru (obsah posiela hub) ----////
+    def _on_config_file_changed(self, _path, user_cfg):
+        # config changed -> apply only the diff
+        changes = self._load_and_apply_config(user_cfg)
+        if not changes:
+            return
+        if any("shortcuts" in c or "removed" in c for c in changes.values()):
+            self._register_shortcuts()
+        if any(c & {"mode", "target_game_time", "removed"} for c in changes.values()):
+            self._update_data_watch()
+        for name, changed in changes.items():
+            timer = self.timers.get(name)
+            if timer is None:
+                continue
+            if changed & {"start_time_sec", "direction"}:
+                self._journal.append(timer.snapshot("config"))
+            self.timer_changed.emit(name)
+            self._schedule(timer, arm=False)
+        self._arm_wakeup()
+    # ////---------------------------------------------------------------------------------
+
+    # ////---- Herný čas z data.ini ----////
+    def _update_data_watch(self):
+        wanted = not self._suspended and any(t.game_mode for t in self.timers.values())
+        if wanted and not self._data_subscribed:
+            self._data_subscribed = True
+            cfg = self._hub.subscribe(self._data_path, self._on_data_file_changed, parse_ini)
+            self._on_data_file_changed(self._data_path, cfg)
+        elif not wanted and self._data_subscribed:
+            self._data_subscribed = False
+            self._hub.unsubscribe(self._data_path, self._on_data_file_changed)
+
+    def _on_data_file_changed(self, _path, cfg):
+        """New time_of_day/time_speed sample: re-anchor game timers.
+           Redraws are still scheduled from the known rate, this only corrects them.
+        """
+        game_secs, speed = game_time_from(cfg, self._hub.mtime(self._data_path))
+        if speed is None:
+            speed = self._game_sample[1]
+        self._game_sample = (game_secs, speed)
+        moved = False
+        for timer in self.timers.values():
+            if timer.sync_game_clock(game_secs, speed):
+                self.timer_changed.emit(timer.name)
+                self._schedule(timer, arm=False)
+                moved = True
+        if moved:
+            self._arm_wakeup()
+    # ////---------------------------------------------------------------------------------
+
+    # ////---- Pozastavenie, keď nie je viditeľný žiadny pohľad ----////
+    def suspend(self):
+        """Stop redraw wakeups and data.ini watching. Timers keep running (their value
+           comes from the monotonic clock), shortcuts and the journal stay active."""
+        self._suspended = True
+        self.timer.stop()
+        self._update_data_watch()
+
+    def resume(self):
+        """Resync in one step: fresh game time sample, expired countdowns, new deadlines."""
+        self._suspended = False
+        self._update_data_watch()
+        for timer in self.timers.values():
+            timer.check_expired()
+            self.timer_changed.emit(timer.name)
+            self._schedule(timer, arm=False)
+        self._arm_wakeup()
+    # ////---------------------------------------------------------------------------------
+
+    # ////---- Ukončenie (posledný pohľad zatvorený) ----////
+    def shutdown(self):
+        try:
+            self.timer.stop()
+        except Exception:
+            pass
+        self._deadlines.clear()
+        self._hub.unsubscribe(self._config_path, self._on_config_file_changed)
+        if self._data_subscribed:
+            self._data_subscribed = False
+            self._hub.unsubscribe(self._data_path, self._on_data_file_changed)
+        self.shortcuts.unregister_owner(self)
+        self._shortcut_bindings.clear()
+    # ////---------------------------------------------------------------------------------
+
 # /////////////////////////////////////////////////////////////////////////////////////////////
 # ////---- Hlavná trieda widgetu ----////
 # /////////////////////////////////////////////////////////////////////////////////////////////
 
 # ////---- Vytvorenie widgetu ----////
 def create_widget(BaseClass, module_name):
-    class StopwatchWidget(BaseClass):
+    class StopwatchWidget(VisibilityLifecycle, BaseClass):
         # ////---- Inicializácia widgetu ----////
         def __init__(self):
             super().__init__(module_name)
             stopwatch_instance[0] = self
 
-            # UI layout (kept similar to your original)
-            layout = QHBoxLayout(self)
+            # UI layout - jeden riadok (šípka + čas) pre každý časovač
+            layout = QVBoxLayout(self)
             layout.setAlignment(Qt.AlignCenter)
             self.setLayout(layout)
             self.setMinimumSize(200, 80)
             self.setMaximumSize(4000, 200)
+            self._rows_layout = layout
+            self._rows = {}  # name -> dict(row, arrow_label, name_label, time_label, name, applied_arrow)
 
-            self.arrow_label = QLabel()
-            self.arrow_label.setAlignment(Qt.AlignVCenter | Qt.AlignRight)
-            self.arrow_label.setFixedWidth(36)
-
-            self.time_label = QLabel("00:00")
-            self.time_label.setAlignment(Qt.AlignVCenter | Qt.AlignLeft)
-
-            layout.addWidget(self.arrow_label)
-            layout.addWidget(self.time_label)
-
-            # config/state
-            self._config_path = self.get_config_path("stopwatch.json")
-            self._last_config_mtime = None
-
-            self._running = False
-            self._direction = "up"  # "up" or "down"
-            self._show_seconds = True
-            self._start_time = 0
-            self._current_time = 0
-            self._percent_base_time = 0  # base time for percent calculation in countdown mode
-            self._countdown_colors = DEFAULT_CONFIG["countdown_colors"].copy()
-            self._shortcuts = DEFAULT_CONFIG["shortcuts"].copy()
-            self._font_color = DEFAULT_CONFIG["font_color"]
-
-            # Bridge related
-            self.bridge = get_bridge()
-            self._bridge_handlers = {}  # map normalized_combo -> zero-arg handler
-
-            # timers
-            self.timer = QTimer(self)
-            self.timer.timeout.connect(self._tick)
-            self.timer.start(1000)  # every second
-
-            # load config now (and register shortcuts)
-            self._ensure_config()
-            self._load_and_apply_config()
-            self._register_shortcuts()
+            # zdieľaný model - stopky v docku aj v overlayoch majú jeden stav, journal a skratky
+            config_path = self.get_config_path("stopwatch.json")
+            data_dir = os.path.dirname(self.get_data_path(JOURNAL_FILE))
+            self._model_key = ("stopwatch", os.path.abspath(config_path))
+            self.model = acquire_model(self._model_key, lambda: StopwatchModel(config_path, data_dir))
+            self.model.timers_changed.connect(self._sync_rows)
+            self.model.style_changed.connect(self._apply_style)
+            self.model.timer_changed.connect(self._on_timer_changed)
 
             # initial UI update
-            self.update_widget()
+            self._sync_rows()
         # ////---------------------------------------------------------------------------------
 
-        # ////---- Zabezpečí, že config súbor existuje ----////
-        def _ensure_config(self):
-            cfg_dir = os.path.dirname(self._config_path)
-            ensure_dir(cfg_dir)
-            if not os.path.exists(self._config_path):
-                try:
-                    with open(self._config_path, "w", encoding="utf-8") as f:
-                        json.dump(DEFAULT_CONFIG, f, indent=2)
-                except Exception:
-                    pass
-        # ////---------------------------------------------------------------------------------
+        # ////---- Pridanie / odstránenie riadkov podľa časovačov modelu ----////
+        def _sync_rows(self):
+            timers = self.model.timers
+            for name in list(self._rows):
+                if name not in timers:
+                    self._remove_row(name)
+            for name in timers:
+                if name not in self._rows:
+                    self._add_row(name)
+                    self._apply_style(name)
+            self.setMaximumSize(4000, 200 * max(1, len(timers)))
 
-        # ////---- Načíta config súbor a aplikuje nastavenia ----////
-        def _load_and_apply_config(self):
-            try:
-                mtime = os.path.getmtime(self._config_path) if os.path.exists(self._config_path) else None
-            except Exception:
-                mtime = None
-            # If not changed, keep current
-            if mtime and mtime == self._last_config_mtime:
-                return
-            self._last_config_mtime = mtime
+        def _add_row(self, name):
+            row = QHBoxLayout()
+            row.setAlignment(Qt.AlignCenter)
+            arrow_label = QLabel()
+            arrow_label.setAlignment(Qt.AlignVCenter | Qt.AlignRight)
+            arrow_label.setFixedWidth(36)
+            name_label = None
+            if name:
+                name_label = QLabel(name)
+                name_label.setAlignment(Qt.AlignVCenter | Qt.AlignLeft)
+            time_label = DigitDisplay("stopwatch", Qt.AlignVCenter | Qt.AlignLeft)
+            row.addWidget(arrow_label)
+            if name_label is not None:
+                row.addWidget(name_label)
+            row.addWidget(time_label)
+            # hlavný časovač je vždy prvý
+            if name:
+                self._rows_layout.addLayout(row)
+            else:
+                self._rows_layout.insertLayout(0, row)
 
-            cfg = DEFAULT_CONFIG.copy()
-            try:
-                with open(self._config_path, "r", encoding="utf-8") as f:
-                    user_cfg = json.load(f)
-                    if isinstance(user_cfg, dict):
-                        cfg.update(user_cfg)
-            except Exception:
-                pass
+            self._rows[name] = {
+                "row": row,
+                "arrow_label": arrow_label,
+                "name_label": name_label,
+                "time_label": time_label,
+                "name": RenderedLabel(name_label, "stopwatch") if name_label is not None else None,
+                "applied_arrow": None
+            }
+            # backwards compatible attribute names for the main timer
+            if not name:
+                self.arrow_label = arrow_label
+                self.time_label = time_label
 
-            # apply config
-            self._shortcuts = cfg.get("shortcuts", DEFAULT_CONFIG["shortcuts"])
-            self._font_color = cfg.get("font_color", DEFAULT_CONFIG["font_color"])
-            self._show_seconds = cfg.get("show_seconds", DEFAULT_CONFIG["show_seconds"])
-            self._direction = cfg.get("direction", "up")
-            self._start_time = cfg.get("start_time_sec", 0)
-            self._countdown_colors = cfg.get("countdown_colors", DEFAULT_CONFIG["countdown_colors"]).copy()
-
-            # reset current time to start_time on config load (original behaviour)
-            self._current_time = self._start_time
-            self._percent_base_time = self._current_time
-
-            # font
-            fam = str(cfg.get("font_family", DEFAULT_CONFIG["font_family"]))
-            size = int(cfg.get("font_size", DEFAULT_CONFIG["font_size"]))
-            font = QFont(fam, size)
-            self.time_label.setFont(font)
-
-            # update arrow color/graphic
-            self.update_arrow()
+        def _remove_row(self, name):
+            row = self._rows.pop(name, None)
+            if row is None:
+                return
+            for key in ("arrow_label", "name_label", "time_label"):
+                widget = row[key]
+                if widget is not None:
+                    row["row"].removeWidget(widget)
+                    widget.deleteLater()
+            self._rows_layout.removeItem(row["row"])
+            row["row"].deleteLater()
         # ////---------------------------------------------------------------------------------
 
-        # ////---- Registrácia skratiek do bridge ----////
-        def _register_shortcuts(self):
-            """Register current shortcuts into bridge. Uses normalized combo keys:
-               e.g. "ctrl+shift+up" -> register event name "shortcut.ctrl+shift+up".
-               Handlers are zero-arg callables because bridge.emit doesn't pass args.
-            """
-            # unregister old
-            try:
-                for combo_norm, handler in list(self._bridge_handlers.items()):
-                    self.bridge.off(f"shortcut.{combo_norm}", handler)
-            except Exception:
-                pass
-            self._bridge_handlers.clear()
-
-            # register new
-            for action, combo in self._shortcuts.items():
-                combo_norm = normalize_combo(combo)
-                event_name = f"shortcut.{combo_norm}"
-                # handler must be zero-arg because bridge.emit triggers callback without args
-                def make_handler(act):
-                    return lambda act=act, combo_norm=combo_norm: self._on_shortcut_triggered(act, combo_norm)
-                handler = make_handler(action)
-                self.bridge.on(event_name, handler)
-                self._bridge_handlers[combo_norm] = handler
+        # ////---- Aplikovanie fontu a farieb časovača ----////
+        def _apply_style(self, name):
+            timer = self.model.timers.get(name)
+            row = self._rows.get(name)
+            if timer is None or row is None:
+                return
+            family = timer.config.font_family
+            size = timer.config.font_size
+            row["time_label"].set_glyph_font(family, size, QFont.Bold)
+            if row["name"] is not None:
+                row["name"].font(family, size)
+                row["name"].style(f"color: {timer.font_color};")
+            self._update_arrow(name)
+            self._render(name)
         # ////---------------------------------------------------------------------------------
 
-        # ////---- Spracovanie spustenej skratky ----////
-        def _on_shortcut_triggered(self, action_name: str, combo_norm: str):
-            """Execute action mapped to a shortcut action_name (like 'start' or 'add_min')."""
-            # note: action_name is the logical name from config, not the combo string
-            if action_name == "start":
-                self._running = not self._running
-                if self._running:
-                    # if starting to count (e.g. start), set percent base for countdown
-                    if self._direction == "down" and self._percent_base_time == 0:
-                        self._percent_base_time = self._current_time if self._current_time > 0 else 1
-                else:
-                    # paused - keep percent base as-is so percentage remains meaningful
-                    pass
-            elif action_name == "reset":
-                self._current_time = self._start_time
-                self._running = False
-                self._percent_base_time = self._current_time
-            elif action_name == "add_min":
-                self._current_time += 60
-            elif action_name == "add_10min":
-                self._current_time += 600
-            elif action_name == "add_hour":
-                self._current_time += 3600
-            elif action_name == "sub_min":
-                self._current_time = max(0, self._current_time - 60)
-            elif action_name == "sub_10min":
-                self._current_time = max(0, self._current_time - 600)
-            elif action_name == "sub_hour":
-                self._current_time = max(0, self._current_time - 3600)
-            elif action_name == "direction_toggle":
-                # switch direction and recompute percent base accordingly
-                old = self._direction
-                self._direction = "down" if old == "up" else "up"
-                # when switching to countdown, set base if needed
-                if self._direction == "down":
-                    self._percent_base_time = self._current_time if self._current_time > 0 else 1
-                else:
-                    self._percent_base_time = self._current_time
-                self.update_arrow()
-            # update immediately UI
-            self.update_widget()
+        # ////---- Zmena hodnoty časovača v modeli ----////
+        def _on_timer_changed(self, name):
+            self._update_arrow(name)
+            self._render(name)
         # ////---------------------------------------------------------------------------------
 
-        # ////---- Tick handler (every second) ----////
-        def _tick(self):
-            """Called every second by QTimer: update time, reload config if changed, update UI."""
-            # Check config mtime and reload (so we reuse the same second timer)
+        # ////---- Aktualizácia šípky podľa smeru ----////
+        def _update_arrow(self, name):
+            timer = self.model.timers.get(name)
+            row = self._rows.get(name)
+            if timer is None or row is None:
+                return
+            direction = "up" if timer.direction == "up" else "down"
             try:
-                cur_mtime = os.path.getmtime(self._config_path) if os.path.exists(self._config_path) else None
+                dpr = self.devicePixelRatioF()
             except Exception:
-                cur_mtime = None
-            if cur_mtime != self._last_config_mtime:
-                # config changed -> reload and re-register shortcuts
-                self._load_and_apply_config()
-                self._register_shortcuts()
-
-            # Advance time if running
-            if self._running:
-                if self._direction == "up":
-                    self._current_time += 1
-                else:
-                    self._current_time -= 1
-                    if self._current_time < 0:
-                        self._current_time = 0
-                        self._running = False
-
-            # update UI every tick
-            self.update_widget()
-        # ////---------------------------------------------------------------------------------
+                dpr = 1.0
+            key = (direction, timer.font_color, dpr)
+            if key == row["applied_arrow"]:
+                return
+            row["applied_arrow"] = key
+            row["arrow_label"].setPixmap(get_arrow_pixmap(direction, 32, timer.font_color, dpr))
 
-        # ////---- Aktualizácia šípky podľa smeru ----////
         def update_arrow(self):
-            color = self._font_color
-            if self._direction == "up":
-                self.arrow_label.setPixmap(draw_arrow("up", 32, color))
-            else:
-                self.arrow_label.setPixmap(draw_arrow("down", 32, color))
+            for name in self._rows:
+                self._update_arrow(name)
         # ////---------------------------------------------------------------------------------
 
         # ////---- Aktualizácia vizuálu a textu podľa času ----////
+        def _render(self, name):
+            """Update visual label and color of one timer according to direction/percent."""
+            timer = self.model.timers.get(name)
+            row = self._rows.get(name)
+            if timer is None or row is None:
+                return
+            text, color = timer.display()
+            # farba mení atlas, text prekreslí len zmenené číslice
+            row["time_label"].set_color(color)
+            row["time_label"].set_text(text)
+
         def update_widget(self):
-            """Update visual label and color according to direction/percent."""
-            # compute color
-            color = self._font_color
-            if self._direction == "down" and self._percent_base_time > 0:
-                percent = int(100 * self._current_time / max(1, self._percent_base_time))
-                percent = max(0, min(100, percent))
-                color = get_percent_color(percent, self._countdown_colors)
-            # update style and text
-            self.time_label.setStyleSheet(f"color: {color}; font-weight: bold;")
-            self.time_label.setText(seconds_to_str(self._current_time, self._show_seconds))
-            self.update_arrow()
+            for name in self._rows:
+                self._render(name)
         # ////---------------------------------------------------------------------------------
 
         # ////---- Cleanup on close ----////
         def close_widget(self):
-            # cleanup timers and unregister shortcuts
+            # odpojenie od modelu; posledný pohľad model zastaví a odregistruje skratky
             try:
-                self.timer.stop()
+                self.model.timers_changed.disconnect(self._sync_rows)
+                self.model.style_changed.disconnect(self._apply_style)
+                self.model.timer_changed.disconnect(self._on_timer_changed)
             except Exception:
                 pass
-            for combo_norm, handler in list(self._bridge_handlers.items()):
-                try:
-                    self.bridge.off(f"shortcut.{combo_norm}", handler)
-                except Exception:
-                    pass
-            self._bridge_handlers.clear()
-            stopwatch_instance[0] = None
+            if self._model_key is not None:
+                release_model(self._model_key, self)
+                self._model_key = None
+            if stopwatch_instance[0] is self:
+                stopwatch_instance[0] = None
         # ////---------------------------------------------------------------------------------
 
-        # ////---- Event pri zobrazení widgetu (pre registráciu skratiek) ----////
+        # ////---- Viditeľnosť (pozastaví model, ak sú skryté všetky pohľady) ----////
+        def suspend_widget(self):
+            if self._model_key is not None:
+                set_view_visible(self._model_key, self, False)
+
+        def resume_widget(self):
+            if self._model_key is not None:
+                set_view_visible(self._model_key, self, True)
+                self.update_widget()
+        # ////---------------------------------------------------------------------------------
+
+        # ////---- Event pri zobrazení widgetu ----////
         def showEvent(self, event):
             super().showEvent(event)
-            self._register_shortcuts()
+            # DPR sa mohlo zmeniť (presun na iný monitor) - update_arrow si to overí
+            self.update_arrow()
         # ////---------------------------------------------------------------------------------
 
     return StopwatchWidget()
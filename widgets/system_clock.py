@@ -1,18 +1,33 @@
 import os
+import sys
 import json
-from PySide6.QtWidgets import QVBoxLayout, QLabel
-from PySide6.QtCore import QTimer, Qt, QDateTime
+from PySide6.QtWidgets import QVBoxLayout
+from PySide6.QtCore import QTimer, Qt, QDateTime, QObject, Signal
 from PySide6.QtGui import QFont
 
-# ////---- Default config for system_clock.json ----////
-DEFAULT_CONFIG = {
-    "font_family": "Arial",
-    "font_size": 28,
-    "font_color": "#00ffcc",
-    "show_seconds": True,
-    "show_date": False,
-    "date_format": "dd.MM.yyyy"
-}
+# ////---- Zdieľané pomocné moduly (python/customclock) ----////
+PYTHON_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "python")
+if PYTHON_DIR not in sys.path:
+    sys.path.append(PYTHON_DIR)
+from customclock.models import acquire_model, release_model, set_view_visible
+from customclock.lifecycle import VisibilityLifecycle
+from customclock.render import RenderedLabel, TimedLabel
+from customclock.digits import DigitDisplay
+from customclock.filewatch import get_hub
+from customclock.schema import Schema, Field, at_least, is_color
+from customclock import perf
+
+# ////---- Schéma system_clock.json (typy, kontroly, predvolené hodnoty) ----////
+CONFIG_SCHEMA = Schema("SystemClockConfig", [
+    Field("font_family", "Arial"),
+    Field("font_size", 28, at_least(1)),
+    Field("font_color", "#00ffcc", is_color),
+    Field("show_seconds", True),
+    Field("show_date", False),
+    Field("date_format", "dd.MM.yyyy")
+])
+STYLE_FIELDS = frozenset({"font_family", "font_size", "font_color"})
+FORMAT_FIELDS = frozenset({"show_seconds", "show_date", "date_format"})
 
 def ensure_dir(path):
     try:
@@ -20,8 +35,92 @@ def ensure_dir(path):
     except Exception:
         pass
 
+# ////---- Zdieľaný model systémového času (jeden pre všetky inštancie widgetu) ----////
+class SystemClockModel(QObject):
+    """Gets system_clock.json from the file-watch hub and formats the current time once per second.
+    Views only listen to style_changed/time_changed and render the current state."""
+    style_changed = Signal()
+    time_changed = Signal()
+
+    def __init__(self, config_path):
+        super().__init__()
+        self._config_path = config_path
+
+        # stav pre pohľady
+        self.config = None  # SystemClockConfig (nemenný, vymení sa celý pri zmene súboru)
+        self.time_text = "00:00"
+        self.date_text = ""
+
+        # ensure config exists
+        self._ensure_config()
+        self._hub = get_hub()
+        self._apply_config(self._hub.subscribe(self._config_path, self._on_config_changed))
+
+        # timer
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.update)
+        self.timer.start(1000)
+
+        # prvé vykreslenie
+        self.update()
+
+    # ////---- Config helpers ----////
+    def _ensure_config(self):
+        cfg_dir = os.path.dirname(self._config_path)
+        ensure_dir(cfg_dir)
+        if not os.path.exists(self._config_path):
+            try:
+                with open(self._config_path, "w", encoding="utf-8") as f:
+                    json.dump(CONFIG_SCHEMA.defaults(), f, indent=2)
+            except Exception:
+                pass
+
+    def _on_config_changed(self, _path, user_cfg):
+        changed = self._apply_config(user_cfg)
+        # zmena formátu (sekundy, dátum) sa prejaví hneď, nie až pri ďalšom ticku
+        if changed & FORMAT_FIELDS and self.timer.isActive():
+            self.update()
+
+    def _apply_config(self, user_cfg):
+        # vracia množinu zmenených polí oproti predchádzajúcej verzii
+        cfg = CONFIG_SCHEMA.load(user_cfg, "system_clock.json")
+        changed = cfg.changed(self.config)
+        self.config = cfg
+        if changed & STYLE_FIELDS:
+            self.style_changed.emit()
+        return changed
+
+    # ////---- Tick každú sekundu ----////
+    def update(self):
+        perf.count("wakeup.system_clock")
+        started = perf.now()
+        now = QDateTime.currentDateTime()
+        cfg = self.config
+        time_format = "HH:mm:ss" if cfg.show_seconds else "HH:mm"
+        self.time_text = now.toString(time_format)
+        self.date_text = now.toString(cfg.date_format) if cfg.show_date else ""
+        self.time_changed.emit()
+        perf.add_time("system_clock.update", perf.now() - started)
+
+    # ////---- Pozastavenie, keď nie je viditeľný žiadny pohľad ----////
+    def suspend(self):
+        self.timer.stop()
+
+    def resume(self):
+        # aktuálny čas hneď, ďalší tick o sekundu
+        self.update()
+        self.timer.start(1000)
+
+    def shutdown(self):
+        try:
+            self.timer.stop()
+        except Exception:
+            pass
+        self._hub.unsubscribe(self._config_path, self._on_config_changed)
+# ////-----------------------------------------------------------------------------------------
+
 def create_widget(BaseClass, module_name):
-    class SystemClockWidget(BaseClass):
+    class SystemClockWidget(VisibilityLifecycle, BaseClass):
         def __init__(self):
             super().__init__(module_name)
 
@@ -32,100 +131,62 @@ def create_widget(BaseClass, module_name):
             self.setMaximumSize(4000, 200)
 
             # label pre čas
-            self.clock_label = QLabel("00:00")
-            self.clock_label.setAlignment(Qt.AlignCenter)
+            self.clock_label = DigitDisplay("system_clock", Qt.AlignCenter)
             layout.addWidget(self.clock_label)
 
             # label pre dátum
-            self.date_label = QLabel("")
+            self.date_label = TimedLabel("", "system_clock")
             self.date_label.setAlignment(Qt.AlignCenter)
             layout.addWidget(self.date_label)
-
-            # paths
-            self._config_path = self.get_config_path("system_clock.json")
-
-            # interné stavy
-            self._last_config_mtime = None
-            self._show_seconds = DEFAULT_CONFIG["show_seconds"]
-            self._show_date = DEFAULT_CONFIG["show_date"]
-            self._date_format = DEFAULT_CONFIG["date_format"]
-
-            # ensure config exists
-            self._ensure_config()
-            self._load_and_apply_config()
-
-            # timer
-            self.timer = QTimer(self)
-            self.timer.timeout.connect(self.update_widget)
-            self.timer.start(1000)
-
-            # prvé vykreslenie
+            self._date = RenderedLabel(self.date_label, "system_clock")
+
+            # zdieľaný model - dock aj overlaye so system_clock majú jeden časovač a config
+            config_path = self.get_config_path("system_clock.json")
+            self._model_key = ("system_clock", os.path.abspath(config_path))
+            self.model = acquire_model(self._model_key, lambda: SystemClockModel(config_path))
+            self.model.style_changed.connect(self._apply_style)
+            self.model.time_changed.connect(self.update_widget)
+            self._apply_style()
             self.update_widget()
 
-        # ////---- Config helpers ----////
-        def _ensure_config(self):
-            cfg_dir = os.path.dirname(self._config_path)
-            ensure_dir(cfg_dir)
-            if not os.path.exists(self._config_path):
-                try:
-                    with open(self._config_path, "w", encoding="utf-8") as f:
-                        json.dump(DEFAULT_CONFIG, f, indent=2)
-                except Exception:
-                    pass
-
-        def _load_and_apply_config(self):
-            try:
-                mtime = os.path.getmtime(self._config_path) if os.path.exists(self._config_path) else None
-            except Exception:
-                mtime = None
-            if mtime and mtime == self._last_config_mtime:
-                return
-            self._last_config_mtime = mtime
-
-            cfg = DEFAULT_CONFIG.copy()
-            try:
-                with open(self._config_path, "r", encoding="utf-8") as f:
-                    user_cfg = json.load(f)
-                    if isinstance(user_cfg, dict):
-                        cfg.update(user_cfg)
-            except Exception:
-                pass
-
-            fam = str(cfg.get("font_family", DEFAULT_CONFIG["font_family"]))
-            size = int(cfg.get("font_size", DEFAULT_CONFIG["font_size"]))
-            color = cfg.get("font_color", DEFAULT_CONFIG["font_color"])
-            self._show_seconds = bool(cfg.get("show_seconds", DEFAULT_CONFIG["show_seconds"]))
-            self._show_date = bool(cfg.get("show_date", DEFAULT_CONFIG["show_date"]))
-            self._date_format = str(cfg.get("date_format", DEFAULT_CONFIG["date_format"]))
-
-            font = QFont(fam, size)
-            self.clock_label.setFont(font)
-            self.date_label.setFont(font)
-            self.clock_label.setStyleSheet(f"color: {color}; font-weight: bold;")
-            self.date_label.setStyleSheet(f"color: {color};")
+        # ////---- Vykreslenie stavu modelu ----////
+        def _apply_style(self):
+            cfg = self.model.config
+            self.clock_label.set_glyph_font(cfg.font_family, cfg.font_size, QFont.Bold)
+            self._date.font(cfg.font_family, cfg.font_size)
+            self.clock_label.set_color(cfg.font_color)
+            self._date.style(f"color: {cfg.font_color};")
 
-        # ////---- Tick každú sekundu ----////
         def update_widget(self):
-            self._load_and_apply_config()
+            self.clock_label.set_text(self.model.time_text)
 
-            now = QDateTime.currentDateTime()
-            time_format = "HH:mm:ss" if self._show_seconds else "HH:mm"
-            self.clock_label.setText(now.toString(time_format))
+            show_date = self.model.config.show_date
+            if show_date:
+                self._date.text(self.model.date_text)
+            self._date.visible(show_date)
 
-            if self._show_date:
-                self.date_label.setText(now.toString(self._date_format))
-                self.date_label.show()
-            else:
-                self.date_label.hide()
+        # ////---- Viditeľnosť (pozastaví model, ak sú skryté všetky pohľady) ----////
+        def suspend_widget(self):
+            if self._model_key is not None:
+                set_view_visible(self._model_key, self, False)
+
+        def resume_widget(self):
+            if self._model_key is not None:
+                set_view_visible(self._model_key, self, True)
+                self._apply_style()
+                self.update_widget()
 
         def close_widget(self):
             try:
-                self.timer.stop()
+                self.model.style_changed.disconnect(self._apply_style)
+                self.model.time_changed.disconnect(self.update_widget)
             except Exception:
                 pass
+            if self._model_key is not None:
+                release_model(self._model_key, self)
+                self._model_key = None
 
     return SystemClockWidget()
 
 def get_widget_dock_position():
     return Qt.LeftDockWidgetArea, 1
-